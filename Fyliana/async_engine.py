@@ -0,0 +1,153 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.rate_limit import BACKOFF_BASE, BACKOFF_CAP, RETRY_STATUSES, backoff_delay, retry_after_seconds
+
+try:
+    import aiohttp
+except ImportError:  # Only needed for the async engine
+    aiohttp = None
+
+# Default limits
+MAX_CONCURRENCY = 64  # requests in flight across all hosts
+PER_HOST_LIMIT = 16  # requests in flight per host
+PARSE_THREADS = 4  # threads that run BeautifulSoup off the event loop
+MAX_RETRIES = 5
+
+
+class AsyncFetcher:
+    """
+    asyncio/aiohttp fetcher with a global and a per-host concurrency limit.
+
+    Parsing is handed to a small thread pool (or to `parse_executor`, e.g. the process pool
+    of a ParsePool) so the event loop keeps hundreds of requests in flight, and `once` collapses repeated work on the same key (e.g. a
+    product detail page) into a single task.
+
+    An optional RateLimiter paces every request. Throttled (429/503), failed (5xx) and timed
+    out requests are retried with exponential backoff and jitter, honouring Retry-After.
+    An optional Metrics instance records every response, retry and parse.
+
+    With an HttpCache (`cache`), the one the thread engine uses, fresh pages are served from
+    disk without a request, and stale ones are revalidated, so an unchanged page costs a 304.
+    The cache's SQLite calls run on the event loop's default thread pool.
+    """
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, per_host_limit=PER_HOST_LIMIT,
+                 parse_threads=PARSE_THREADS, parse_executor=None, max_retries=MAX_RETRIES, limiter=None,
+                 backoff_base=BACKOFF_BASE, backoff_cap=BACKOFF_CAP, metrics=None, timeout=30, cache=None):
+        if aiohttp is None:
+            raise RuntimeError("The async engine needs aiohttp: pip install aiohttp")
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.limiter = limiter
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.metrics = metrics
+        self.timeout = timeout
+        self.cache = cache
+        self.requests = 0
+        self._own_parse_pool = parse_executor is None
+        self._parse_pool = parse_executor or ThreadPoolExecutor(max_workers=parse_threads)
+        self._tasks = {}
+        self._session = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_limit)
+        self._session = aiohttp.ClientSession(connector=connector,
+                                              timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        if self._own_parse_pool:
+            self._parse_pool.shutdown(wait=False)
+
+    async def fetch(self, url, raise_for_status=True):
+        """
+        Fetch a URL and return the body as bytes, or None if it failed (or kept failing after
+        `max_retries` retries). Waiting between retries does not block any thread.
+        """
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.max_retries + 1):
+            status, retry_after = None, None
+            conditional_headers = {}
+            if self.cache:
+                start = time.perf_counter()
+                cached, conditional_headers = await loop.run_in_executor(None, self.cache.lookup, url)
+                if cached:
+                    if self.metrics:
+                        self.metrics.record_response(cached, time.perf_counter() - start)
+                    return cached.content
+            if self.limiter:
+                waited = time.perf_counter()
+                await self.limiter.acquire_async(url)
+                if self.metrics:
+                    self.metrics.count("limiter_wait_seconds", time.perf_counter() - waited)
+            start = time.perf_counter()
+            try:
+                self.requests += 1
+                async with self._session.get(url, headers=conditional_headers) as response:
+                    status = response.status
+                    retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                    body = await response.read()
+                    cached = None
+                    if self.cache:
+                        cached = await loop.run_in_executor(None, self.cache.update, url, status, body,
+                                                            dict(response.headers), response.charset)
+                    if cached:
+                        # Not modified: the stored page, recorded like the thread engine records it
+                        status, body = cached.status_code, cached.content
+                        if self.metrics:
+                            self.metrics.record_response(cached, time.perf_counter() - start)
+                    elif self.metrics:
+                        self.metrics.observe("fetch", time.perf_counter() - start)
+                        self.metrics.count("requests", status=str(status))
+                        self.metrics.count("bytes", len(body))
+                    if status not in RETRY_STATUSES:
+                        if raise_for_status and status >= 400:
+                            print(f"Failed to fetch URL {url}: HTTP {status}")
+                            return None
+                        return body
+                    error = f"HTTP {status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+                if self.metrics:
+                    self.metrics.count("request_errors")
+            finally:
+                if self.limiter:
+                    self.limiter.release(url, status, retry_after)
+
+            if attempt < self.max_retries:
+                delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap, retry_after)
+                if self.metrics:
+                    self.metrics.count("retries")
+                print(f"Error fetching URL {url}: {error}. Retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})...")
+                await asyncio.sleep(delay)
+        print(f"Failed to fetch URL after {self.max_retries + 1} attempts: {url}")
+        return None
+
+    async def parse(self, func, *args):
+        """
+        Run a parsing function in the parse pool.
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        result = await loop.run_in_executor(self._parse_pool, func, *args)
+        if self.metrics:
+            self.metrics.observe("parse", time.perf_counter() - start)
+        return result
+
+    async def once(self, key, coroutine_function, *args):
+        """
+        Run `coroutine_function(*args)` once per key and share its result with every caller.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coroutine_function(*args))
+            self._tasks[key] = task
+        return await task
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import sqlite3
+import threading
+
+
+def card_fingerprint(card):
+    """
+    Hash everything a listing card shows (title, price, SKU, URL).
+    """
+    return hashlib.sha256(json.dumps(card, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class CardStore:
+    """
+    Listing cards of earlier runs with the description and images read from their detail pages.
+
+    When a card's fingerprint matches the stored one the product is assumed unchanged and its
+    stored details are reused, so its detail page is not requested at all. With `reuse=False`
+    cards are only recorded, ready for a later run that skips. Recorded cards are committed
+    every `commit_every` cards and on close, so a crash loses at most that many.
+    """
+
+    def __init__(self, path, reuse=True, commit_every=100):
+        self.path = path
+        self.reuse = reuse
+        self.commit_every = commit_every
+        self.reused = 0
+        self.fetched = 0
+        self._uncommitted = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cards ("
+            " url TEXT PRIMARY KEY, fingerprint TEXT NOT NULL, description TEXT NOT NULL, images TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def lookup(self, card):
+        """
+        Return the stored (description, images) of an unchanged card, otherwise None.
+        """
+        if not self.reuse:
+            return None
+        with self._lock:
+            row = self._db.execute("SELECT fingerprint, description, images FROM cards WHERE url = ?",
+                                   (card["url"],)).fetchone()
+            if row and row[0] == card_fingerprint(card):
+                self.reused += 1
+                return row[1], row[2]
+        return None
+
+    def remember(self, card, details):
+        """
+        Store the details fetched for a card.
+        """
+        description, images = details
+        with self._lock:
+            self.fetched += 1
+            if details == ("No description available.", ""):
+                return  # The detail page could not be fetched, try again next run
+            self._db.execute("INSERT OR REPLACE INTO cards (url, fingerprint, description, images) VALUES (?, ?, ?, ?)",
+                             (card["url"], card_fingerprint(card), description, images))
+            self._uncommitted += 1
+            if self._uncommitted >= self.commit_every:
+                self._db.commit()
+                self._uncommitted = 0
+
+    def get(self, card, fetch):
+        """
+        Return (description, images) of a card, calling `fetch(url)` only if the card changed.
+        """
+        details = self.lookup(card)
+        if details is None:
+            details = fetch(card["url"])
+            self.remember(card, details)
+        return details
+
+    def report(self):
+        """
+        Summarize how many detail fetches were skipped for the end of a run.
+        """
+        total = self.reused + self.fetched
+        share = self.reused / total * 100 if total else 0
+        return (f"Card store: {self.reused} unchanged products reused their details, "
+                f"{self.fetched} fetched ({share:.1f}% of detail fetches skipped)")
+
+    def close(self):
+        with self._lock:
+            self._db.commit()
+            self._db.close()
@@ -1,116 +0,0 @@
-
-
-category_structure = {"epipla": {
-    "Καναπέδες": {
-        "Καναπέδες γωνιακοί": {'url': 'https://www.fylliana.gr/epipla/kanapedes/kanapedes-goniakoi', 'valid_colors': ['Χρώμα[]=2832', 'Χρώμα[]=2882', 'Χρώμα[]=2850', 'Χρώμα[]=2838', 'Χρώμα[]=2800', 'Χρώμα[]=754', 'Χρώμα[]=73', 'Χρώμα[]=72', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=691', 'Χρώμα[]=21', 'Χρώμα[]=2802', 'Χρώμα[]=627', 'Χρώμα[]=11', 'Χρώμα[]=2807', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=2806', 'Χρώμα[]=762', 'Χρώμα[]=2843', 'Χρώμα[]=212'], 'valid_materials': ['Υλικό[]=2842', 'Υλικό[]=1', 'Υλικό[]=2870', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=70', 'Χαρακτηριστικά[]=2084', 'Χαρακτηριστικά[]=713', 'Χαρακτηριστικά[]=178', 'Χαρακτηριστικά[]=2590', 'Χαρακτηριστικά[]=29', 'Χαρακτηριστικά[]=712', 'Χαρακτηριστικά[]=2805', 'Χαρακτηριστικά[]=2601', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=2799', 'Χαρακτηριστικά[]=2828', 'Χαρακτηριστικά[]=44']},
-        "Καναπέδες κρεβάτια": {'url': 'https://www.fylliana.gr/epipla/kanapedes/kanapedes-krebatia', 'valid_colors': ['Χρώμα[]=2851', 'Χρώμα[]=2838', 'Χρώμα[]=73', 'Χρώμα[]=72', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=691', 'Χρώμα[]=21', 'Χρώμα[]=14', 'Χρώμα[]=627', 'Χρώμα[]=11', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=2806', 'Χρώμα[]=762'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=69', 'Χαρακτηριστικά[]=70', 'Χαρακτηριστικά[]=2863', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=2828', 'Χαρακτηριστικά[]=44', 'Χαρακτηριστικά[]=2827']},
-        "Σετ Καναπέδες": {'url': 'https://www.fylliana.gr/epipla/kanapedes/salonia', 'valid_colors': ['Χρώμα[]=2838', 'Χρώμα[]=2800', 'Χρώμα[]=754', 'Χρώμα[]=73', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=2807', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=2806'], 'valid_materials': ['Υλικό[]=2842', 'Υλικό[]=2870', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=69', 'Χαρακτηριστικά[]=70', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=2799']},
-    },
-    "Κρεβάτια": {
-        "Επενδεδυμένα": {'url': 'https://www.fylliana.gr/epipla/krebatia/ependymena', 'valid_colors': ['Χρώμα[]=2832', 'Χρώμα[]=2838', 'Χρώμα[]=2901', 'Χρώμα[]=2835', 'Χρώμα[]=2800', 'Χρώμα[]=754', 'Χρώμα[]=73', 'Χρώμα[]=72', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=19', 'Χρώμα[]=2831', 'Χρώμα[]=2806', 'Χρώμα[]=212'], 'valid_materials': ['Υλικό[]=2', 'Υλικό[]=2842', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2863', 'Χαρακτηριστικά[]=62', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=61', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=60']},
-        "Μελαμίνης": {'url': 'https://www.fylliana.gr/epipla/krebatia/melaminis', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2865', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=15', 'Χρώμα[]=2866', 'Χρώμα[]=10', 'Χρώμα[]=2896', 'Χρώμα[]=11', 'Χρώμα[]=13'], 'valid_materials': ['Υλικό[]=2890', 'Υλικό[]=2', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=62', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=61', 'Χαρακτηριστικά[]=60', 'Χαρακτηριστικά[]=63']},
-        "Μεταλλικά": {'url': 'https://www.fylliana.gr/epipla/krebatia/metallika', 'valid_colors': ['Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=13'], 'valid_materials': ['Υλικό[]=5', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=62', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=61', 'Χαρακτηριστικά[]=2836', 'Χαρακτηριστικά[]=60']},
-    },
-    "Τραπεζαρίες": {
-        "Σετ τραπεζαρίας": {'url': 'https://www.fylliana.gr/epipla/trapezaries/set-trapezarias', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=12', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=756', 'Υλικό[]=2', 'Υλικό[]=5'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-        "Τραπέζια τραπεζαρίας": {'url': 'https://www.fylliana.gr/epipla/trapezaries/trapezia-trapezarias', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=57', 'Χρώμα[]=2891', 'Χρώμα[]=2865', 'Χρώμα[]=56', 'Χρώμα[]=2841', 'Χρώμα[]=55', 'Χρώμα[]=2822', 'Χρώμα[]=2881', 'Χρώμα[]=75', 'Χρώμα[]=81', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=58', 'Χρώμα[]=15', 'Χρώμα[]=42', 'Χρώμα[]=3', 'Χρώμα[]=4', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=2889', 'Χρώμα[]=7'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2826', 'Υλικό[]=2861', 'Υλικό[]=28', 'Υλικό[]=2825', 'Υλικό[]=146', 'Υλικό[]=2900', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1'], 'valid_features': ['Χαρακτηριστικά[]=53', 'Χαρακτηριστικά[]=49']},
-    },
-    "Έπιπλα γραφείου": {
-        "Βιβλιοθήκες": {'url': 'https://www.fylliana.gr/epipla/epipla-grafeiou/bibliothikes', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=55', 'Χρώμα[]=8', 'Χρώμα[]=10'], 'valid_materials': ['Υλικό[]=2'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-        "Γραφεία": {'url': 'https://www.fylliana.gr/epipla/epipla-grafeiou/grafeia', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=81', 'Χρώμα[]=8', 'Χρώμα[]=15', 'Χρώμα[]=10', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=2', 'Υλικό[]=5'], 'valid_features': ['Χαρακτηριστικά[]=53', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27']},
-        "Καρέκλες γραφείου": {'url': 'https://www.fylliana.gr/epipla/epipla-grafeiou/karekles-grafeiou', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=18', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=16', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=762'], 'valid_materials': ['Υλικό[]=2883', 'Υλικό[]=39', 'Υλικό[]=5', 'Υλικό[]=37', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2804', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2827', 'Χαρακτηριστικά[]=36', 'Χαρακτηριστικά[]=32', 'Χαρακτηριστικά[]=34', 'Χαρακτηριστικά[]=45', 'Χαρακτηριστικά[]=2849']},
-    },
-    "Έπιπλα υποδοχής": {
-        "Έπιπλα χώλ": {'url': 'https://www.fylliana.gr/epipla/epipla-ypodochis/epipla-chol', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2833', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=58', 'Χρώμα[]=15', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2795', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2'], 'valid_features': ['Χαρακτηριστικά[]=64', 'Χαρακτηριστικά[]=65', 'Χαρακτηριστικά[]=66', 'Χαρακτηριστικά[]=68', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=46', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27']},
-        "Κρεμάστρες - Καλόγεροι": {'url': 'https://www.fylliana.gr/epipla/epipla-ypodochis/kremastres-kalogeroi', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=25', 'Χρώμα[]=59', 'Χρώμα[]=10'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2', 'Υλικό[]=5'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85']},
-        "Παπουτσοθήκες": {'url': 'https://www.fylliana.gr/epipla/epipla-ypodochis/papoutsothikes', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2833', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=2824', 'Χρώμα[]=8', 'Χρώμα[]=9', 'Χρώμα[]=15', 'Χρώμα[]=4', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2795', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2', 'Υλικό[]=2834'], 'valid_features': ['Χαρακτηριστικά[]=65', 'Χαρακτηριστικά[]=66', 'Χαρακτηριστικά[]=67', 'Χαρακτηριστικά[]=68', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=46', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=92', 'Χαρακτηριστικά[]=27']},
-    },
-    "Πολυθρόνες-Ανάκλινδρα": {'url': 'https://www.fylliana.gr/epipla/polythrones-anaklindra', 'valid_colors': ['Χρώμα[]=2796', 'Χρώμα[]=55', 'Χρώμα[]=2838', 'Χρώμα[]=2800', 'Χρώμα[]=761', 'Χρώμα[]=754', 'Χρώμα[]=714', 'Χρώμα[]=181', 'Χρώμα[]=41', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=2803', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=2807', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=2806', 'Χρώμα[]=212', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=1960', 'Υλικό[]=39', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=724', 'Υλικό[]=211', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=40', 'Χαρακτηριστικά[]=2084', 'Χαρακτηριστικά[]=2804', 'Χαρακτηριστικά[]=2798', 'Χαρακτηριστικά[]=2805', 'Χαρακτηριστικά[]=2601', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=44', 'Χαρακτηριστικά[]=2827', 'Χαρακτηριστικά[]=34']},
-    "Καρέκλες": {'url': 'https://www.fylliana.gr/epipla/karekles', 'valid_colors': ['Χρώμα[]=52', 'Χρώμα[]=2832', 'Χρώμα[]=56', 'Χρώμα[]=2841', 'Χρώμα[]=55', 'Χρώμα[]=2838', 'Χρώμα[]=2839', 'Χρώμα[]=2835', 'Χρώμα[]=2860', 'Χρώμα[]=2792', 'Χρώμα[]=2800', 'Χρώμα[]=761', 'Χρώμα[]=2847', 'Χρώμα[]=9', 'Χρώμα[]=754', 'Χρώμα[]=41', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=2802', 'Χρώμα[]=2803', 'Χρώμα[]=627', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=115', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=637', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=2831', 'Χρώμα[]=184', 'Χρώμα[]=2806', 'Χρώμα[]=2843', 'Χρώμα[]=212', 'Χρώμα[]=7', 'Χρώμα[]=2809', 'Χρώμα[]=692'], 'valid_materials': ['Υλικό[]=1960', 'Υλικό[]=39', 'Υλικό[]=97', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=724', 'Υλικό[]=1961', 'Υλικό[]=211', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2863', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=2827']},
-    "Τραπεζάκια σαλονιού": {'url': 'https://www.fylliana.gr/epipla/trapezakia-saloniou', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=88', 'Χρώμα[]=2840', 'Χρώμα[]=2891', 'Χρώμα[]=2865', 'Χρώμα[]=56', 'Χρώμα[]=2841', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=2822', 'Χρώμα[]=2881', 'Χρώμα[]=2838', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=754', 'Χρώμα[]=15', 'Χρώμα[]=42', 'Χρώμα[]=3', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2895', 'Χρώμα[]=11', 'Χρώμα[]=2898', 'Χρώμα[]=2889', 'Χρώμα[]=13', 'Χρώμα[]=47', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2826', 'Υλικό[]=2861', 'Υλικό[]=28', 'Υλικό[]=2825', 'Υλικό[]=146', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=2842', 'Υλικό[]=1', 'Υλικό[]=2834', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=38']},
-    "Συρταριέρες - Κονσόλες – Μπουφέδες": {
-        "Classic": {'url': 'https://www.fylliana.gr/epipla/komotes-mpoufedes/classic', 'valid_colors': ['Χρώμα[]=755', 'Χρώμα[]=8', 'Χρώμα[]=15', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2', 'Υλικό[]=2842', 'Υλικό[]=1', 'Υλικό[]=2834'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27']},
-        "Μελαμίνης": {'url': 'https://www.fylliana.gr/epipla/komotes-mpoufedes/melaminis', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=15', 'Χρώμα[]=2866', 'Χρώμα[]=4', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=93', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2826', 'Υλικό[]=2', 'Υλικό[]=5'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27']},
-    },
-    "Βιβλιοθήκες - Ραφιέρες": {'url': 'https://www.fylliana.gr/epipla/bibliothikes-rafieres', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=88', 'Χρώμα[]=2891', 'Χρώμα[]=2865', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=8', 'Χρώμα[]=754', 'Χρώμα[]=3', 'Χρώμα[]=4', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2896', 'Χρώμα[]=11', 'Χρώμα[]=2894', 'Χρώμα[]=2889'], 'valid_materials': ['Υλικό[]=2829', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Διάφορα Μικροέπιπλα": {
-        "Τραπεζάκια Σαλονιού": {'url': 'https://www.fylliana.gr/epipla/diafora-mikroepipla/trapezakia-saloniou', 'valid_colors': [], 'valid_materials': [], 'valid_features': []},
-    },
-    "Βιτρίνες": {'url': 'https://www.fylliana.gr/epipla/bitrines', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2865', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=8', 'Χρώμα[]=58', 'Χρώμα[]=754', 'Χρώμα[]=15', 'Χρώμα[]=3', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2896', 'Χρώμα[]=93', 'Χρώμα[]=11', 'Χρώμα[]=2898', 'Χρώμα[]=2889'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2825', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=2834'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85']},
-    "Ταμπουρέ - Σκαμπό": {'url': 'https://www.fylliana.gr/epipla/tampoure-skampo', 'valid_colors': ['Χρώμα[]=2838', 'Χρώμα[]=2839', 'Χρώμα[]=73', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=691', 'Χρώμα[]=21', 'Χρώμα[]=2802', 'Χρώμα[]=2803', 'Χρώμα[]=11', 'Χρώμα[]=2797', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=48', 'Χρώμα[]=47', 'Χρώμα[]=637', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=2817', 'Χρώμα[]=2831', 'Χρώμα[]=2806', 'Χρώμα[]=2809', 'Χρώμα[]=126', 'Χρώμα[]=692'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=1960', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2863', 'Χαρακτηριστικά[]=2084', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830', 'Χαρακτηριστικά[]=33']},
-    "Μπαούλα": {
-        "Πλαστικά Μπαούλα": {'url': 'https://www.fylliana.gr/epipla/mpaoula/plastika-mpaoula', 'valid_colors': [], 'valid_materials': [], 'valid_features': []},
-    },
-    "Έπιπλα τηλεόρασης - Συνθέσεις τηλεόρασης": {
-        "Classic": {'url': 'https://www.fylliana.gr/epipla/epipla-tileorasis-syntheseis-tileorasis/classic', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2881', 'Χρώμα[]=8', 'Χρώμα[]=15', 'Χρώμα[]=3', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2825', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=2834'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-        "Μελαμίνης": {'url': 'https://www.fylliana.gr/epipla/epipla-tileorasis-syntheseis-tileorasis/melaminis', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2840', 'Χρώμα[]=2891', 'Χρώμα[]=2893', 'Χρώμα[]=2865', 'Χρώμα[]=56', 'Χρώμα[]=79', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=58', 'Χρώμα[]=15', 'Χρώμα[]=2866', 'Χρώμα[]=2899', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2895', 'Χρώμα[]=2896', 'Χρώμα[]=93', 'Χρώμα[]=11', 'Χρώμα[]=2894', 'Χρώμα[]=2898', 'Χρώμα[]=2889'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2890', 'Υλικό[]=28', 'Υλικό[]=2', 'Υλικό[]=5'], 'valid_features': ['Χαρακτηριστικά[]=2897', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=92']},
-    },
-    "Κομοδίνα": {
-        "Classic": {'url': 'https://www.fylliana.gr/epipla/komodina/classic', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=4', 'Χρώμα[]=2814'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=2834'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-        "Μελαμίνης": {'url': 'https://www.fylliana.gr/epipla/komodina/melaminis', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=55', 'Χρώμα[]=86', 'Χρώμα[]=15', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=93', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=2'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=27']},
-    },
-    "Ντουλάπες": {'url': 'https://www.fylliana.gr/epipla/ntoulapes', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2869', 'Χρώμα[]=2865', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=86', 'Χρώμα[]=8', 'Χρώμα[]=2867', 'Χρώμα[]=58', 'Χρώμα[]=15', 'Χρώμα[]=2866', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2896', 'Χρώμα[]=93', 'Χρώμα[]=11'], 'valid_materials': ['Υλικό[]=2890', 'Υλικό[]=2', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=65', 'Χαρακτηριστικά[]=66', 'Χαρακτηριστικά[]=67', 'Χαρακτηριστικά[]=68', 'Χαρακτηριστικά[]=53', 'Χαρακτηριστικά[]=29', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=46', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=92', 'Χαρακτηριστικά[]=80', 'Χαρακτηριστικά[]=27']},
-    "Κουζίνες": {'url': 'https://www.fylliana.gr/epipla/kouzines', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=2893', 'Χρώμα[]=55', 'Χρώμα[]=91', 'Χρώμα[]=2792', 'Χρώμα[]=58', 'Χρώμα[]=15', 'Χρώμα[]=2866', 'Χρώμα[]=59', 'Χρώμα[]=10', 'Χρώμα[]=2896', 'Χρώμα[]=11', 'Χρώμα[]=2894'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=2'], 'valid_features': ['Χαρακτηριστικά[]=64', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27']},
-    "Παιδικά έπιπλα": {'url': 'https://www.fylliana.gr/epipla/paidika-epipla', 'valid_colors': ['Χρώμα[]=55', 'Χρώμα[]=8', 'Χρώμα[]=42', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=17', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=24'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=2'], 'valid_features': ['Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=61', 'Χαρακτηριστικά[]=26', 'Χαρακτηριστικά[]=85', 'Χαρακτηριστικά[]=27', 'Χαρακτηριστικά[]=60']},
-    "Σετ Προσφορών": {'url': 'https://www.fylliana.gr/epipla/set-prosforon', 'valid_colors': [], 'valid_materials': [], 'valid_features': []},
-},
-"diakosmitika": {
-    "Καθρέφτες": {'url': 'https://www.fylliana.gr/diakosmitika/kathreftes', 'valid_colors': ['Χρώμα[]=2818', 'Χρώμα[]=2891', 'Χρώμα[]=55', 'Χρώμα[]=8', 'Χρώμα[]=754', 'Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=2795', 'Χρώμα[]=11', 'Χρώμα[]=47', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=674', 'Υλικό[]=657', 'Υλικό[]=28', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=724', 'Υλικό[]=758', 'Υλικό[]=647'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Κάδρα": {'url': 'https://www.fylliana.gr/diakosmitika/kadra', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=122', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=678', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Διακοσμητικά τοίχου": {'url': 'https://www.fylliana.gr/diakosmitika/diakosmitika-toichou', 'valid_colors': ['Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=2903', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=674', 'Υλικό[]=657', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Κεραμικά διακοσμητικά": {'url': 'https://www.fylliana.gr/diakosmitika/keramika-diakosmitika', 'valid_colors': ['Χρώμα[]=2888', 'Χρώμα[]=717', 'Χρώμα[]=25', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=19', 'Χρώμα[]=184', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=674', 'Υλικό[]=28', 'Υλικό[]=146', 'Υλικό[]=662'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Γυάλινα διακοσμητικά": {'url': 'https://www.fylliana.gr/diakosmitika/gyalina-diakosmitika', 'valid_colors': ['Χρώμα[]=2904', 'Χρώμα[]=2855', 'Χρώμα[]=754', 'Χρώμα[]=714', 'Χρώμα[]=25', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=42', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=11', 'Χρώμα[]=115', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=637', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=677', 'Υλικό[]=5', 'Υλικό[]=1'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Μεταλλικά διακοσμητικά": {'url': 'https://www.fylliana.gr/diakosmitika/metallika-diakosmitika', 'valid_colors': ['Χρώμα[]=2855', 'Χρώμα[]=717', 'Χρώμα[]=25', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=2903', 'Χρώμα[]=184', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=657', 'Υλικό[]=28', 'Υλικό[]=2', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Ρολόγια": {'url': 'https://www.fylliana.gr/diakosmitika/rologia', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=184', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Κορνίζες": {'url': 'https://www.fylliana.gr/diakosmitika/kornizes', 'valid_colors': ['Χρώμα[]=72', 'Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=674', 'Υλικό[]=28', 'Υλικό[]=39', 'Υλικό[]=37', 'Υλικό[]=724'], 'valid_features': ['Χαρακτηριστικά[]=62', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=46', 'Χαρακτηριστικά[]=30']},
-    "Κεριά": {'url': 'https://www.fylliana.gr/diakosmitika/keria', 'valid_colors': ['Χρώμα[]=10'], 'valid_materials': [], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Φιγούρες": {'url': 'https://www.fylliana.gr/diakosmitika/figoures', 'valid_colors': ['Χρώμα[]=2832', 'Χρώμα[]=25', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=2814', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=674', 'Υλικό[]=146', 'Υλικό[]=724', 'Υλικό[]=662'], 'valid_features': ['Χαρακτηριστικά[]=178', 'Χαρακτηριστικά[]=712', 'Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=46']},
-    "Λουλούδια": {'url': 'https://www.fylliana.gr/diakosmitika/louloudia', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=21', 'Χρώμα[]=14', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=16', 'Χρώμα[]=19', 'Χρώμα[]=20'], 'valid_materials': ['Υλικό[]=2857', 'Υλικό[]=37'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Εποχιακά": {'url': 'https://www.fylliana.gr/diakosmitika/epochiaka', 'valid_colors': ['Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=122', 'Χρώμα[]=22', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=674', 'Υλικό[]=756', 'Υλικό[]=659', 'Υλικό[]=146', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=724', 'Υλικό[]=1961', 'Υλικό[]=211', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Διάφορα διακοσμητικά": {'url': 'https://www.fylliana.gr/diakosmitika/diafora-diakosmitika', 'valid_colors': ['Χρώμα[]=52', 'Χρώμα[]=25', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=2814', 'Χρώμα[]=11', 'Χρώμα[]=115', 'Χρώμα[]=13', 'Χρώμα[]=1434', 'Χρώμα[]=17', 'Χρώμα[]=47', 'Χρώμα[]=2903', 'Χρώμα[]=19', 'Χρώμα[]=2806', 'Χρώμα[]=7', 'Χρώμα[]=2880', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=31', 'Υλικό[]=674', 'Υλικό[]=756', 'Υλικό[]=657', 'Υλικό[]=28', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=147', 'Υλικό[]=2858', 'Υλικό[]=35', 'Υλικό[]=647'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Γούρια": {'url': 'https://www.fylliana.gr/diakosmitika/gouria', 'valid_colors': ['Χρώμα[]=181', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=17', 'Χρώμα[]=122'], 'valid_materials': ['Υλικό[]=28'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Φανάρια": {'url': 'https://www.fylliana.gr/diakosmitika/fanaria', 'valid_colors': ['Χρώμα[]=714', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=47', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=5', 'Υλικό[]=667', 'Υλικό[]=211', 'Υλικό[]=647'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-},
-"stromata-leyka-eidi": {
-},
-"yfasma": {
-    "Κουρτίνες": {'url': 'https://www.fylliana.gr/yfasma/kourtines', 'valid_colors': ['Χρώμα[]=13'], 'valid_materials': ['Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Τραπεζομάντηλα": {'url': 'https://www.fylliana.gr/yfasma/trapezomantila', 'valid_colors': ['Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=184'], 'valid_materials': ['Υλικό[]=724', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Καρέ - Τραβέρσες": {'url': 'https://www.fylliana.gr/yfasma/kare-traberses', 'valid_colors': ['Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=2044', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=19', 'Χρώμα[]=2806', 'Χρώμα[]=2809', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=724', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Ριχτάρια": {'url': 'https://www.fylliana.gr/yfasma/richtaria', 'valid_colors': ['Χρώμα[]=52', 'Χρώμα[]=2835', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=627', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=19', 'Χρώμα[]=184', 'Χρώμα[]=2806'], 'valid_materials': ['Υλικό[]=2808', 'Υλικό[]=1960', 'Υλικό[]=724', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Μαξιλάρια": {'url': 'https://www.fylliana.gr/yfasma/maxilaria', 'valid_colors': ['Χρώμα[]=52', 'Χρώμα[]=2838', 'Χρώμα[]=2835', 'Χρώμα[]=181', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=627', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=16', 'Χρώμα[]=19', 'Χρώμα[]=20', 'Χρώμα[]=184', 'Χρώμα[]=2806', 'Χρώμα[]=212', 'Χρώμα[]=2809', 'Χρώμα[]=126', 'Χρώμα[]=692'], 'valid_materials': ['Υλικό[]=2902', 'Υλικό[]=2808', 'Υλικό[]=1960', 'Υλικό[]=724', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Χαλιά": {'url': 'https://www.fylliana.gr/yfasma/chalia', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=2802', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=762', 'Χρώμα[]=212'], 'valid_materials': ['Υλικό[]=2862', 'Υλικό[]=2808', 'Υλικό[]=724', 'Υλικό[]=6', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Κουβέρτες": {'url': 'https://www.fylliana.gr/yfasma/koubertes', 'valid_colors': ['Χρώμα[]=72', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=2802', 'Χρώμα[]=17', 'Χρώμα[]=20', 'Χρώμα[]=2806'], 'valid_materials': ['Υλικό[]=2902', 'Υλικό[]=724', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Πουφ": {'url': 'https://www.fylliana.gr/yfasma/pouf', 'valid_colors': ['Χρώμα[]=52', 'Χρώμα[]=15', 'Χρώμα[]=10', 'Χρώμα[]=13', 'Χρώμα[]=2806'], 'valid_materials': ['Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-},
-"fotismos": {
-    "Φωτιστικά οροφής": {'url': 'https://www.fylliana.gr/fotismos/fotistika-orofis', 'valid_colors': ['Χρώμα[]=2855', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=2802', 'Χρώμα[]=11', 'Χρώμα[]=115', 'Χρώμα[]=13', 'Χρώμα[]=47', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=5', 'Υλικό[]=667', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=211', 'Υλικό[]=2858', 'Υλικό[]=647'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Επιτραπέζιες λάμπες": {'url': 'https://www.fylliana.gr/fotismos/epitrapezies-lampes', 'valid_colors': ['Χρώμα[]=2855', 'Χρώμα[]=25', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=47', 'Χρώμα[]=7', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=28', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=211', 'Υλικό[]=2858', 'Υλικό[]=647'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49']},
-    "Λάμπες δαπέδου": {'url': 'https://www.fylliana.gr/fotismos/lampes-dapedou', 'valid_colors': ['Χρώμα[]=2855', 'Χρώμα[]=25', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=2802', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=47', 'Χρώμα[]=126'], 'valid_materials': ['Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=37', 'Υλικό[]=211', 'Υλικό[]=2858'], 'valid_features': ['Χαρακτηριστικά[]=49']},
-    "Απλίκες": {'url': 'https://www.fylliana.gr/fotismos/aplikes', 'valid_colors': [], 'valid_materials': [], 'valid_features': []},
-},
-"eidi-kipou": {
-    "Τραπέζια κήπου": {'url': 'https://www.fylliana.gr/eidi-kipou/trapezia', 'valid_colors': ['Χρώμα[]=15', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=13'], 'valid_materials': ['Υλικό[]=657', 'Υλικό[]=670', 'Υλικό[]=28', 'Υλικό[]=97', 'Υλικό[]=2852', 'Υλικό[]=5', 'Υλικό[]=37', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=45']},
-    "Καρέκλες - Πολυθρόνες": {'url': 'https://www.fylliana.gr/eidi-kipou/karekles-kareklopolythrones', 'valid_colors': ['Χρώμα[]=754', 'Χρώμα[]=73', 'Χρώμα[]=72', 'Χρώμα[]=15', 'Χρώμα[]=2853', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=14', 'Χρώμα[]=10', 'Χρώμα[]=11', 'Χρώμα[]=13', 'Χρώμα[]=48'], 'valid_materials': ['Υλικό[]=2885', 'Υλικό[]=2810', 'Υλικό[]=2713', 'Υλικό[]=657', 'Υλικό[]=670', 'Υλικό[]=2854', 'Υλικό[]=97', 'Υλικό[]=2852', 'Υλικό[]=5', 'Υλικό[]=37', 'Υλικό[]=1961', 'Υλικό[]=211', 'Υλικό[]=2858', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2084', 'Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=36', 'Χαρακτηριστικά[]=45']},
-    "Ομπρέλες": {'url': 'https://www.fylliana.gr/eidi-kipou/ompreles', 'valid_colors': ['Χρώμα[]=13'], 'valid_materials': ['Υλικό[]=657', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=154']},
-    "Κούνιες - Αιώρες": {'url': 'https://www.fylliana.gr/eidi-kipou/diafora', 'valid_colors': ['Χρώμα[]=2796', 'Χρώμα[]=15', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=13', 'Χρώμα[]=17', 'Χρώμα[]=16', 'Χρώμα[]=22'], 'valid_materials': ['Υλικό[]=2884', 'Υλικό[]=2810', 'Υλικό[]=657', 'Υλικό[]=670', 'Υλικό[]=5', 'Υλικό[]=1', 'Υλικό[]=211', 'Υλικό[]=2858', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2859', 'Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=2830']},
-    "Catering": {'url': 'https://www.fylliana.gr/eidi-kipou/catering', 'valid_colors': ['Χρώμα[]=10'], 'valid_materials': ['Υλικό[]=2673', 'Υλικό[]=5', 'Υλικό[]=35'], 'valid_features': ['Χαρακτηριστικά[]=2859', 'Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=45']},
-    "Σετ κήπου": {'url': 'https://www.fylliana.gr/eidi-kipou/set-kipou', 'valid_colors': ['Χρώμα[]=2796', 'Χρώμα[]=754', 'Χρώμα[]=15', 'Χρώμα[]=4', 'Χρώμα[]=12', 'Χρώμα[]=10', 'Χρώμα[]=13', 'Χρώμα[]=2806'], 'valid_materials': ['Υλικό[]=683', 'Υλικό[]=2810', 'Υλικό[]=2713', 'Υλικό[]=2823', 'Υλικό[]=657', 'Υλικό[]=670', 'Υλικό[]=97', 'Υλικό[]=5', 'Υλικό[]=37', 'Υλικό[]=724', 'Υλικό[]=1961', 'Υλικό[]=211'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2830']},
-    "Ντουλάπες εξωτερικού χώρου": {'url': 'https://www.fylliana.gr/eidi-kipou/ntoulapes', 'valid_colors': ['Χρώμα[]=754', 'Χρώμα[]=15'], 'valid_materials': ['Υλικό[]=37'], 'valid_features': ['Χαρακτηριστικά[]=154', 'Χαρακτηριστικά[]=49', 'Χαρακτηριστικά[]=2815', 'Χαρακτηριστικά[]=2816']},
-}
-}
-
-color_dict={'Χρώμα[]=2832': 'Elephant', 'Χρώμα[]=2882': 'Ice', 'Χρώμα[]=2850': 'Light Blue', 'Χρώμα[]=2838': 'Mint', 'Χρώμα[]=2800': 'Taupe', 'Χρώμα[]=754': 'Ανθρακί', 'Χρώμα[]=73': 'Ανοιχτό γκρι', 'Χρώμα[]=72': 'Ανοιχτό καφέ', 'Χρώμα[]=181': 'Βεραμάν', 'Χρώμα[]=15': 'Γκρι', 'Χρώμα[]=12': 'Καφέ', 'Χρώμα[]=691': 'Κεραμιδί', 'Χρώμα[]=21': 'Κίτρινο', 'Χρώμα[]=2802': 'Κρεμ', 'Χρώμα[]=627': 'Λαδί', 'Χρώμα[]=11': 'Μαύρο', 'Χρώμα[]=2807': 'Μόκα', 'Χρώμα[]=2797': 'Μουσταρδί', 'Χρώμα[]=13': 'Μπεζ', 'Χρώμα[]=17': 'Μπλε', 'Χρώμα[]=637': 'Πετρόλ', 'Χρώμα[]=22': 'Πορτοκαλί', 'Χρώμα[]=19': 'Πράσινο', 'Χρώμα[]=20': 'Ροζ', 'Χρώμα[]=184': 'Σιέλ', 'Χρώμα[]=2806': 'Σκούρο γκρί', 'Χρώμα[]=762': 'Σκούρο καφέ', 'Χρώμα[]=2843': 'Σκούρο Μπλε', 'Χρώμα[]=212': 'Τυρκουάζ', 'Χρώμα[]=2851': 'Denim', 'Χρώμα[]=14': 'Κόκκινο', 'Χρώμα[]=2901': 'Navy blue', 'Χρώμα[]=2835': 'RAF', 'Χρώμα[]=10': 'Λευκό', 'Χρώμα[]=2831': 'Σάπιο Μήλο', 'Χρώμα[]=2818': 'Artisan', 'Χρώμα[]=2891': 'Cashmere', 'Χρώμα[]=2865': 'Flagstaff oak', 'Χρώμα[]=55': 'Grey Oak', 'Χρώμα[]=86': 'Grey oak/Λευκή λάκκα', 'Χρώμα[]=8': 'Sonοma', 'Χρώμα[]=2867': 'Surfside', 'Χρώμα[]=2866': 'Γκρι Γραφίτης', 'Χρώμα[]=2896': 'Λευκό Ματ', 'Χρώμα[]=57': 'Black Grey Wood', 'Χρώμα[]=56': 'Golden Oak', 'Χρώμα[]=2841': 'Golden Sand', 'Χρώμα[]=2822': 'Macchiato', 'Χρώμα[]=2881': 'Mango', 'Χρώμα[]=75': 'Sonoma-Latte', 'Χρώμα[]=81': 'Sonoma/Λευκό', 'Χρώμα[]=58': 'White Oak', 'Χρώμα[]=42': 'Διάφανο', 'Χρώμα[]=3': 'Δρυς', 'Χρώμα[]=4': 'Καρυδί', 'Χρώμα[]=59': 'Λευκή Λάκα', 'Χρώμα[]=2889': 'Μαύρο Ματ', 'Χρώμα[]=7': 'Φυσικό', 'Χρώμα[]=18': 'Λαχανί', 'Χρώμα[]=16': 'Μωβ', 'Χρώμα[]=2833': 'Dark Sonoma', 'Χρώμα[]=91': 'Grey oak/White oak', 'Χρώμα[]=2795': 'Λευκό Oak', 'Χρώμα[]=25': 'Ασημί', 'Χρώμα[]=2824': 'Pacific oak', 'Χρώμα[]=9': 'Wenge', 'Χρώμα[]=2796': 'Cappuccino', 'Χρώμα[]=761': 'Terracota', 'Χρώμα[]=714': 'Ασήμι', 'Χρώμα[]=41': 'Γαλάζιο', 'Χρώμα[]=2803': 'Κυπαρισσί', 'Χρώμα[]=126': 'Χρυσό', 'Χρώμα[]=52': 'Camel', 'Χρώμα[]=2839': 'Ocean Blue', 'Χρώμα[]=2860': 'Safir', 'Χρώμα[]=2792': 'Sand', 'Χρώμα[]=2847': 'Tobacco', 'Χρώμα[]=115': 'Μελί', 'Χρώμα[]=2809': 'Χακί', 'Χρώμα[]=692': 'Ώχρα', 'Χρώμα[]=88': 'Black Grey Wood/Λευκό', 'Χρώμα[]=2840': 'Carbon', 'Χρώμα[]=2895': 'Λευκό high gloss foil', 'Χρώμα[]=2898': 'Μαύρο Oak', 'Χρώμα[]=47': 'Μπρονζέ', 'Χρώμα[]=755': 'Classic Wallnut', 'Χρώμα[]=93': 'Λευκο-black grey wood', 'Χρώμα[]=2894': 'Μαύρο mat foil', 'Χρώμα[]=48': 'Μπορντό', 'Χρώμα[]=2817': 'Σαμπανί', 'Χρώμα[]=2893': 'Cashmere matt foil', 'Χρώμα[]=79': 'Golden oak/Λευκό', 'Χρώμα[]=2899': 'Γκρι Ματ', 'Χρώμα[]=2814': 'Λευκό Αντικέ', 'Χρώμα[]=2869': 'Concrete', 'Χρώμα[]=24': 'Φούξια', 'Χρώμα[]=122': 'Πολύχρωμο', 'Χρώμα[]=2903': 'Νίκελ', 'Χρώμα[]=2888': 'Ανοιχτό πράσινο', 'Χρώμα[]=717': 'Αντικέ χρυσό', 'Χρώμα[]=2904': 'Cooper', 'Χρώμα[]=2855': 'Copper', 'Χρώμα[]=1434': 'Μπεζ-Μπλε', 'Χρώμα[]=2880': 'Χάλκινο', 'Χρώμα[]=2044': 'Ιβουάρ', 'Χρώμα[]=2853': 'Εκρού'}
-material_dict={'Υλικό[]=2842': 'Μοριοσανίδα', 'Υλικό[]=1': 'Ξύλο', 'Υλικό[]=2870': 'Ξύλο οξιάς', 'Υλικό[]=6': 'Τεχνόδερμα', 'Υλικό[]=35': 'Ύφασμα', 'Υλικό[]=31': 'Mdf', 'Υλικό[]=2': 'Μελαμίνη', 'Υλικό[]=2890': 'Mdf foil', 'Υλικό[]=5': 'Μέταλλο', 'Υλικό[]=211': 'Σίδερο', 'Υλικό[]=756': 'PVC', 'Υλικό[]=2826': 'Paper Wood', 'Υλικό[]=2861': 'Sintered stone', 'Υλικό[]=28': 'Γυαλί', 'Υλικό[]=2825': 'Καπλαμάς Δρυός', 'Υλικό[]=146': 'Κεραμικό', 'Υλικό[]=2900': 'Μασιφ ξύλο ακακίας', 'Υλικό[]=2883': 'Mesh', 'Υλικό[]=39': 'Δέρμα', 'Υλικό[]=37': 'Πλαστικό', 'Υλικό[]=2834': 'Ξύλο Πεύκου', 'Υλικό[]=1960': 'Βελούδο', 'Υλικό[]=724': 'Πολυεστέρας', 'Υλικό[]=97': 'Μασίφ Ξύλο', 'Υλικό[]=1961': 'Πολυπροπυλένιο', 'Υλικό[]=2829': 'Chipboard', 'Υλικό[]=674': 'Polyresin', 'Υλικό[]=657': 'Αλουμίνιο', 'Υλικό[]=758': 'Πολυουρεθανη', 'Υλικό[]=647': 'Ψάθα', 'Υλικό[]=678': 'Καμβάς', 'Υλικό[]=662': 'Τσιμέντο', 'Υλικό[]=677': 'Κρύσταλλο', 'Υλικό[]=2857': 'Polyfoam', 'Υλικό[]=659': 'Ακρυλικό', 'Υλικό[]=147': 'Πορσελάνη', 'Υλικό[]=2858': 'Σχοινί', 'Υλικό[]=667': 'Μπαμπού', 'Υλικό[]=2808': 'Βαμβακερό', 'Υλικό[]=2902': 'Microfiber', 'Υλικό[]=2862': 'Cotton', 'Υλικό[]=670': 'Ατσάλι', 'Υλικό[]=2852': 'Μασίφ ξύλο οξιάς', 'Υλικό[]=2885': 'Macrame', 'Υλικό[]=2810': 'Rattan', 'Υλικό[]=2713': 'Textilene', 'Υλικό[]=2854': 'Καραβόπανο', 'Υλικό[]=2884': 'Polycotton', 'Υλικό[]=2673': 'HDPE-ΕΝΙΣΧΥΜΕΝΟ ΠΡΩΤΟΓΕΝΕΣ ΠΛΑΣΤΙΚΟ', 'Υλικό[]=683': 'Polywood', 'Υλικό[]=2823': 'Wicker / Rattan'}
-features_dict={'Χαρακτηριστικά[]=70': '3θέσιος', 'Χαρακτηριστικά[]=2084': 'Αδιάβροχο', 'Χαρακτηριστικά[]=713': 'Αναστρέψιμη Γωνία', 'Χαρακτηριστικά[]=178': 'Αριστερή', 'Χαρακτηριστικά[]=2590': 'Αφρώδες', 'Χαρακτηριστικά[]=29': 'Γωνία', 'Χαρακτηριστικά[]=712': 'Δεξιά', 'Χαρακτηριστικά[]=2805': 'Ελατήρια zig-zag', 'Χαρακτηριστικά[]=2601': 'Ελατήρια τύπου Pocket', 'Χαρακτηριστικά[]=49': 'Εσωτερικού χώρου', 'Χαρακτηριστικά[]=2830': 'Ημιαδιάβροχο', 'Χαρακτηριστικά[]=26': 'Με αποθ/κό χώρο', 'Χαρακτηριστικά[]=2799': 'Με αποσπόμενα μαξιλάρια', 'Χαρακτηριστικά[]=2828': 'Με ελατήρια', 'Χαρακτηριστικά[]=44': 'Με μηχ/σμό κρεβατιού', 'Χαρακτηριστικά[]=69': '2θέσιος', 'Χαρακτηριστικά[]=2863': 'Easy clean', 'Χαρακτηριστικά[]=2827': 'Με μηχανισμό ανύψωσης', 'Χαρακτηριστικά[]=62': 'Διπλό', 'Χαρακτηριστικά[]=61': 'Ημίδιπλο', 'Χαρακτηριστικά[]=60': 'Μονό', 'Χαρακτηριστικά[]=63': 'Υπέρδιπλο', 'Χαρακτηριστικά[]=2836': 'Με ουρανό', 'Χαρακτηριστικά[]=53': 'Ανοιγόμενη επιφάνεια', 'Χαρακτηριστικά[]=85': 'Με ντουλάπι', 'Χαρακτηριστικά[]=27': 'Με συρτάρι', 'Χαρακτηριστικά[]=2804': 'Ανάκλιση', 'Χαρακτηριστικά[]=36': 'Με μπράτσα', 'Χαρακτηριστικά[]=32': 'Με πλάτη', 'Χαρακτηριστικά[]=34': 'Περιστρεφόμενη', 'Χαρακτηριστικά[]=45': 'Πτυσσόμενο', 'Χαρακτηριστικά[]=2849': 'Ρυθμιζόμενοι βραχίωνες', 'Χαρακτηριστικά[]=64': '1φυλλη', 'Χαρακτηριστικά[]=65': '2φυλλη', 'Χαρακτηριστικά[]=66': '3φυλλη', 'Χαρακτηριστικά[]=68': '5φυλλη', 'Χαρακτηριστικά[]=46': 'Με καθρέπτη', 'Χαρακτηριστικά[]=67': '4φυλλη', 'Χαρακτηριστικά[]=92': 'Με ραφι', 'Χαρακτηριστικά[]=40': 'Relax', 'Χαρακτηριστικά[]=2798': 'Ανεβατόριο', 'Χαρακτηριστικά[]=154': 'Εξωτερικού χώρου', 'Χαρακτηριστικά[]=38': 'Τροχήλατο', 'Χαρακτηριστικά[]=33': 'Χωρίς πλάτη', 'Χαρακτηριστικά[]=2897': 'Επιτοίχιο', 'Χαρακτηριστικά[]=80': 'Με συρόμενες πόρτες', 'Χαρακτηριστικά[]=30': 'Οβάλ', 'Χαρακτηριστικά[]=2859': 'Αναδιπλούμενη', 'Χαρακτηριστικά[]=2815': 'Κλείδωμα με λουκέτο', 'Χαρακτηριστικά[]=2816': 'Μετακινούμενα ράφια'}
-
-
-
-
-
-
-stroma_color={'Χρώμα[]=10': 'Λευκό', 'Χρώμα[]=12': 'Καφέ', 'Χρώμα[]=73': 'Ανοιχτό γκρι', 'Χρώμα[]=15': 'Γκρι', 'Χρώμα[]=13': 'Μπεζ'}
-
-stroma_material={'Υλικό[]=2886': 'Memory Foam', 'Υλικό[]=758': 'Πολυουρεθανη', 'Υλικό[]=35': 'Ύφασμα', 'Υλικό[]=2905': 'Foam', 'Υλικό[]=724': 'Πολυεστέρας'}
-
-stroma_feature={'Χαρακτηριστικά[]=2846': '2 όψεων', 'Χαρακτηριστικά[]=2845': 'Αεριζόμενο', 'Χαρακτηριστικά[]=2599': 'Ανατομικό', 'Χαρακτηριστικά[]=2844': 'Αντιβακτηριακό', 'Χαρακτηριστικά[]=2887': 'Αντιμικροβιακό', 'Χαρακτηριστικά[]=62': 'Διπλό', 'Χαρακτηριστικά[]=2587': 'Ελατήρια τύπου Bonnel', 'Χαρακτηριστικά[]=2601': 'Ελατήρια τύπου Pocket', 'Χαρακτηριστικά[]=49': 'Εσωτερικού χώρου', 'Χαρακτηριστικά[]=61': 'Ημίδιπλο', 'Χαρακτηριστικά[]=2605': 'Κετσές λευκός', 'Χαρακτηριστικά[]=60': 'Μονό', 'Χαρακτηριστικά[]=2598': 'Ορθοπεδικό', 'Χαρακτηριστικά[]=2603': 'Περιμετρικές κολώνες στήριξης', 'Χαρακτηριστικά[]=2588': 'Περιμετρικό λαμάκι στήριξης', 'Χαρακτηριστικά[]=2610': 'Σύστημα εξαερισμού', 'Χαρακτηριστικά[]=2611': 'Φερμουάρ', 'Χαρακτηριστικά[]=2592': 'Χειρολαβές', 'Χαρακτηριστικά[]=2084': 'Αδιάβροχο'}
@@ -0,0 +1,272 @@
+import hashlib
+import json
+import os
+import re
+from collections.abc import Mapping
+
+REGISTRY_VERSION = 1
+
+# Filter lists of a category and the sidebar group each one is read from, in discovery order
+FILTER_GROUPS = {
+    "valid_colors": "Χρώμα",
+    "valid_materials": "Υλικό",
+    "valid_features": "Χαρακτηριστικά",
+    "valid_dimensions": "Διαστάσεις",
+}
+
+
+def filter_kind(group):
+    """
+    Return the filter list ('valid_colors', ...) a sidebar group belongs to, or None.
+    """
+    for kind, label in FILTER_GROUPS.items():
+        if label in group:
+            return kind
+    return None
+
+
+def filter_count(label_text):
+    """
+    Return the product count of a sidebar label like 'Γκρι (12)', or None if it shows none.
+    """
+    match = re.search(r"\((\d+)\)\s*$", label_text)
+    return int(match.group(1)) if match else None
+
+
+def has_products(filters, *filter_params):
+    """
+    False if discovery counted no products for any of the filter values of a category, so
+    a listing filtered by all of them is empty. Values without a count are assumed to have
+    products, as are None (no filter).
+    """
+    counts = filters.get("counts", {})
+    return all(counts.get(filter_param, 1) > 0 for filter_param in filter_params if filter_param)
+
+
+def sidebar_fingerprint(soup):
+    """
+    Hash the filter sidebar (div#sdb) of a parsed category page; "" if it has none.
+    """
+    sidebar = soup.find("div", id="sdb")
+    if not sidebar:
+        return ""
+    return hashlib.sha256(" ".join(str(sidebar).split()).encode("utf-8")).hexdigest()[:16]
+
+
+def category_paths(category_structure):
+    """
+    Yield (main category, subcategory path list, details) for every scraped category of a
+    structure, with deeper subcategories in place of their parent.
+    """
+    for main_category, subcategories in category_structure.items():
+        for subcategory_name, details in subcategories.items():
+            if "url" in details:
+                yield main_category, [subcategory_name], details
+            else:
+                for deep_subcategory_name, deep_details in details.items():
+                    yield main_category, [subcategory_name, deep_subcategory_name], deep_details
+
+
+def save_registry(path, base_url, category_structure, names, kinds, fingerprints=None):
+    """
+    Write a discovered category structure to a compact JSON registry.
+
+    Every filter parameter ('Χρώμα[]=15') is stored once, with its name from `names`, and
+    categories list the numbers of their filters instead of repeating the strings. URLs are
+    stored relative to `base_url`. `kinds` are the filter lists every category has.
+    `fingerprints` maps (main category, category path) to the hash of its filter sidebar.
+    Product counts of the filter values (a category's "counts") are kept next to its filters.
+    """
+    filters = []
+    numbers = {}
+
+    def intern(filter_param):
+        if filter_param not in numbers:
+            numbers[filter_param] = len(filters)
+            group, _, value = filter_param.partition("[]=")
+            filters.append([group, value, names.get(filter_param, "")])
+        return numbers[filter_param]
+
+    categories = []
+    for main_category, subcategory_path, details in category_paths(category_structure):
+        url = details["url"]
+        if url.startswith(base_url):
+            url = url[len(base_url):]
+        fingerprint = (fingerprints or {}).get((main_category, " > ".join(subcategory_path)), "")
+        filter_params = [filter_param for kind in kinds for filter_param in details.get(kind, [])]
+        counts = details.get("counts", {})
+        categories.append([main_category, subcategory_path, url,
+                           [intern(filter_param) for filter_param in filter_params], fingerprint,
+                           [counts.get(filter_param) for filter_param in filter_params]])
+    # Names of values no category lists any more are kept, as the dictionaries kept them
+    for filter_param in names:
+        intern(filter_param)
+
+    registry = {"version": REGISTRY_VERSION, "base_url": base_url, "kinds": list(kinds),
+                "main_categories": list(category_structure), "filters": filters, "categories": categories}
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(registry, f, ensure_ascii=False, separators=(",", ":"))
+        f.write("\n")
+    os.replace(temporary_path, path)
+    print(f"Saved {len(categories)} categories and {len(filters)} filter values to {path}")
+
+
+def diff_structures(old, new):
+    """
+    Compare two category structures. Returns {"added": [...], "removed": [...], "changed": {...}}:
+    the paths ('epipla > Καναπέδες') of added and removed categories, and for every category
+    in both whose filters differ, (added filter values, removed filter values).
+    """
+    def flatten(structure):
+        return {" > ".join([main_category] + path): [filter_param for kind in FILTER_GROUPS
+                                                     for filter_param in details.get(kind, [])]
+                for main_category, path, details in category_paths(structure)}
+
+    old_categories, new_categories = flatten(old), flatten(new)
+    changed = {}
+    for path, values in new_categories.items():
+        if path in old_categories:
+            added = [value for value in values if value not in old_categories[path]]
+            removed = [value for value in old_categories[path] if value not in values]
+            if added or removed:
+                changed[path] = (added, removed)
+    return {"added": [path for path in new_categories if path not in old_categories],
+            "removed": [path for path in old_categories if path not in new_categories],
+            "changed": changed}
+
+
+def format_diff(diff, names):
+    """
+    Format a diff_structures result as text, naming filter values with `names`.
+    """
+    if not (diff["added"] or diff["removed"] or diff["changed"]):
+        return "Categories unchanged since the last discovery."
+    lines = [f"Categories since the last discovery: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+             f"{len(diff['changed'])} with changed filters"]
+    lines.extend(f"  + {path}" for path in diff["added"])
+    lines.extend(f"  - {path}" for path in diff["removed"])
+    for path, (added, removed) in diff["changed"].items():
+        values = [f"+{value} ({names.get(value, '')})" for value in added]
+        values += [f"-{value} ({names.get(value, '')})" for value in removed]
+        lines.append(f"  ~ {path}: {', '.join(values)}")
+    return "\n".join(lines)
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only dict built by `load()` the first time it is used.
+    """
+
+    def __init__(self, load):
+        self._load = load
+        self._data = None
+
+    def _mapping(self):
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def __getitem__(self, key):
+        return self._mapping()[key]
+
+    def __iter__(self):
+        return iter(self._mapping())
+
+    def __len__(self):
+        return len(self._mapping())
+
+    def __repr__(self):
+        return repr(self._mapping())
+
+
+class CategoryRegistry:
+    """
+    Categories and filters found by discovery, read from the JSON registry on first use.
+
+    The file is only opened when a category or name is first looked up, so importing a
+    scraper costs nothing. Each filter parameter becomes one string shared by every
+    category listing it. `category(main, path)` returns one category through an index by
+    category path; `structure()` and `names(kind)` give the nested category_structure and
+    the {filter parameter: name} dictionaries the scrapers used to import.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._registry = None
+
+    def _load(self):
+        if self._registry is None:
+            with open(self.path, encoding="utf-8") as f:
+                registry = json.load(f)
+            if registry.get("version") != REGISTRY_VERSION:
+                raise ValueError(f"{self.path}: unsupported registry version {registry.get('version')}")
+            registry["params"] = [f"{group}[]={value}" for group, value, _ in registry["filters"]]
+            registry["index"] = {(entry[0], " > ".join(entry[1])): position
+                                 for position, entry in enumerate(registry["categories"])}
+            self._registry = registry
+        return self._registry
+
+    def _details(self, position):
+        registry = self._load()
+        entry = registry["categories"][position]
+        url, numbers = entry[2:4]
+        details = {"url": url if "://" in url else registry["base_url"] + url}
+        for kind in registry["kinds"]:
+            details[kind] = []
+        for number in numbers:
+            group = registry["filters"][number][0]
+            details[filter_kind(group)].append(registry["params"][number])
+        if len(entry) > 5 and any(count is not None for count in entry[5]):
+            details["counts"] = {registry["params"][number]: count
+                                 for number, count in zip(numbers, entry[5]) if count is not None}
+        return details
+
+    def category(self, main_category, path):
+        """
+        Return {"url": ..., "valid_colors": [...], ...} of one category, e.g.
+        category("epipla", "Καναπέδες > Καναπέδες γωνιακοί"). Raises KeyError for unknown ones.
+        """
+        return self._details(self._load()["index"][main_category, path])
+
+    def fingerprint(self, main_category, path):
+        """
+        Return the stored filter sidebar hash of a category, or None if it is unknown.
+        """
+        registry = self._load()
+        position = registry["index"].get((main_category, path))
+        if position is None or len(registry["categories"][position]) < 5:
+            return None
+        return registry["categories"][position][4] or None
+
+    def paths(self):
+        """
+        Return (main category, category path) of every category, in site order.
+        """
+        return list(self._load()["index"])
+
+    def _structure(self):
+        structure = {main_category: {} for main_category in self._load()["main_categories"]}
+        for position, entry in enumerate(self._load()["categories"]):
+            main_category, path = entry[0], entry[1]
+            parent = structure.setdefault(main_category, {})
+            for name in path[:-1]:
+                parent = parent.setdefault(name, {})
+            parent[path[-1]] = self._details(position)
+        return structure
+
+    def structure(self):
+        """
+        Return the nested {main category: {subcategory: details or {deep subcategory: details}}}.
+        """
+        return LazyMapping(self._structure)
+
+    def names(self, kind=None):
+        """
+        Return {filter parameter: name} of one filter list ('valid_colors', ...), or of every filter.
+        """
+        def load():
+            registry = self._load()
+            return {registry["params"][number]: name for number, (group, _, name) in enumerate(registry["filters"])
+                    if kind is None or filter_kind(group) == kind}
+        return LazyMapping(load)
@@ -0,0 +1,94 @@
+import threading
+from concurrent.futures import Future
+
+
+class DetailCache:
+    """
+    Thread-safe cache of product detail pages keyed by product URL.
+
+    Every product is scraped once per run: concurrent lookups of the same URL wait for
+    the single in-flight fetch instead of downloading the page again. `get` blocks the
+    calling thread with `fetch(url)`; `submit` hands out Futures instead.
+    """
+
+    def __init__(self, fetch=None):
+        self.fetch = fetch
+        self.hits = 0
+        self.misses = 0
+        self._results = {}
+        self._in_flight = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        """
+        Return the cached result for a URL, fetching it if no other thread already is.
+        """
+        while True:
+            with self._lock:
+                if url in self._results:
+                    self.hits += 1
+                    return self._results[url]
+                event = self._in_flight.get(url)
+                if event is None:
+                    event = threading.Event()
+                    self._in_flight[url] = event
+                    self.misses += 1
+                    break
+
+            # Another thread is fetching this URL, wait for it and look again
+            event.wait()
+
+        try:
+            result = self.fetch(url)
+            with self._lock:
+                self._results[url] = result
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[url]
+            event.set()
+
+    def submit(self, url, start):
+        """
+        Return a Future of the result for a URL without blocking. `start(url)` must return a
+        Future of the result and is only called if the URL is neither cached nor in flight.
+        """
+        with self._lock:
+            if url in self._results:
+                self.hits += 1
+                future = Future()
+                future.set_result(self._results[url])
+                return future
+            if url in self._futures:
+                self.hits += 1
+                return self._futures[url]
+            self.misses += 1
+            future = self._futures[url] = Future()
+
+        def settle(started):
+            with self._lock:
+                del self._futures[url]
+                if started.exception() is None:
+                    self._results[url] = started.result()
+            if started.exception() is None:
+                future.set_result(started.result())
+            else:
+                future.set_exception(started.exception())
+
+        try:
+            start(url).add_done_callback(settle)
+        except Exception as e:
+            failed = Future()
+            failed.set_exception(e)
+            settle(failed)
+        return future
+
+    def report(self):
+        """
+        Summarize cache usage for the end of a run.
+        """
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0
+        return (f"Detail cache: {self.hits} hits, {self.misses} misses "
+                f"({hit_rate:.1f}% hit rate, {len(self._results)} unique product pages)")
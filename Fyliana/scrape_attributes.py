@@ -1,5 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.fetch import Fetcher
+from common.http_cache import HttpCache
+from common.parsing import make_soup
+from category_registry import CategoryRegistry, diff_structures, filter_count, format_diff, save_registry, \
+    sidebar_fingerprint
+from detail_cache import DetailCache
 
 # Base URL for the website
 BASE_URL = "https://www.fylliana.gr"
@@ -14,20 +24,62 @@ MAIN_CATEGORIES = [
     "eidi-kipou"
 ]
 
+# Registry the scrapers read the categories and filters from
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fylliana_categories.json")
+
+# HTTP cache shared with script.py. Every page is revalidated (ttl 0), so an unchanged page
+# costs a 304 instead of a download
+CACHE_FILE = "fylliana_http_cache.sqlite"
+
+# Category pages fetched at the same time; each level of the category tree is fetched concurrently
+DISCOVERY_WORKERS = 8
+
+# Parts of a subcategory page read for deeper subcategories and for filters
+SUBCATEGORY_PARSE_RULES = [("div", {"class": "box"}), ("div", {"id": "sdb"})]
+
+http_cache = HttpCache(CACHE_FILE, ttl=0)
+
+# Keep-alive connections reused for every category page
+fetcher = Fetcher(workers=DISCOVERY_WORKERS, cache=http_cache)
+
 # Nested dictionary to store the entire structure
 category_structure = {}
 color_dict={}
 material_dict ={}
 features_dict={}
 
+# Filter lists of a category and the dictionary naming their values
+FILTER_DICTS = {"valid_colors": color_dict, "valid_materials": material_dict, "valid_features": features_dict}
+
+# Filter sidebar hash of every category, keyed by (main category, category path)
+category_fingerprints = {}
+
+# Registry of the last discovery and its filter names when running with --incremental, set up in main()
+previous_registry = None
+previous_names = {}
+reused_sidebars = []
+
+
+def fetch_page(url):
+    """
+    Download a category page and return its content.
+    """
+    print(f"Fetching: {url}")
+    response = fetcher.get(url)
+    response.raise_for_status()
+    return response.content
+
+
+# Every category page is downloaded once per run, however many steps read it
+page_cache = DetailCache(fetch_page)
+
 
 def extract_subcategories(main_category_url):
     """
     Extract subcategories and their URLs from a main category page.
     """
     print(f"Extracting subcategories from: {main_category_url}")
-    response = requests.get(main_category_url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = make_soup(page_cache.get(main_category_url), ("div", {"id": "indstc"}))
 
     subcategories = {}
 
@@ -42,20 +94,16 @@ def extract_subcategories(main_category_url):
     return subcategories
 
 
-def extract_deep_subcategories(subcategory_url):
+def parse_deep_subcategories(soup):
     """
-    Extract deeper subcategories (e.g., from 'Καναπέδες') if available.
+    Extract deeper subcategories (e.g., from 'Καναπέδες') from a parsed subcategory page, if available.
     """
-    print(f"Checking for deeper subcategories in: {subcategory_url}")
-    response = requests.get(subcategory_url)
-    soup = BeautifulSoup(response.content, "html.parser")
-
     deep_subcategories = {}
 
     # Locate deeper subcategories in the provided HTML structure
     deep_subcategory_section = soup.find("div", class_="box")
-    if deep_subcategory_section.find("h3"):
-        if deep_subcategory_section and "Κατηγορίες" in deep_subcategory_section.find("h3").text:
+    if deep_subcategory_section and deep_subcategory_section.find("h3"):
+        if "Κατηγορίες" in deep_subcategory_section.find("h3").text:
             for subcategory in deep_subcategory_section.find_all("a"):
                 deep_subcategory_name = subcategory.text.strip()
                 deep_subcategory_url = BASE_URL + subcategory["href"]
@@ -64,23 +112,22 @@ def extract_deep_subcategories(subcategory_url):
     return deep_subcategories
 
 
-def scrape_filters(subcategory_url):
+def parse_filters(soup, subcategory_url):
     """
-    Scrape attribute filters (Χρώμα, Υλικό, Χαρακτηριστικά) from a subcategory URL
+    Scrape attribute filters (Χρώμα, Υλικό, Χαρακτηριστικά) from a parsed subcategory page
     and extract only the portion after 'filter-' from the URLs.
+    Returns (filters, {filter parameter: human-readable name}); filters["counts"] holds the
+    product count the sidebar shows for each value.
     """
-    print(f"Scraping filters for subcategory: {subcategory_url}")
-    response = requests.get(subcategory_url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    # Initialize dictionaries for filters
+    filters = {"valid_colors": [], "valid_materials": [], "valid_features": [], "counts": {}}
+    names = {}
 
     # Locate the filter section
     filter_section = soup.find("div", id="sdb")  # The main filter container
     if not filter_section:
         print(f"No filters found for {subcategory_url}")
-        return {"valid_colors": [], "valid_materials": [], "valid_features": []}
-
-    # Initialize dictionaries for filters
-    filters = {"valid_colors": [], "valid_materials": [], "valid_features": []}
+        return filters, names
 
     # Extract filters
     filter_boxes = filter_section.find_all("div", class_="box")
@@ -111,73 +158,148 @@ def scrape_filters(subcategory_url):
             # Store in the appropriate list
             if "Χρώμα" in filter_name:
                 filters["valid_colors"].append(filter_param)
-                color_dict[filter_param] = value  # Map URL extension to human-readable name
             elif "Υλικό" in filter_name:
                 filters["valid_materials"].append(filter_param)
-                material_dict[filter_param] = value  # Map URL extension to human-readable name
             elif "Χαρακτηριστικά" in filter_name:
                 filters["valid_features"].append(filter_param)
-                features_dict[filter_param] = value  # Map URL extension to human-readable name
+            else:
+                continue
+            names[filter_param] = value  # Map URL extension to human-readable name
+            count = filter_count(label_text)
+            if count is not None:
+                filters["counts"][filter_param] = count
 
+    return filters, names
+
+
+def record_filter_names(filters, names):
+    """
+    Add the names of a category's filter values to color_dict, material_dict and features_dict.
+    Returns the filters.
+    """
+    for key, names_dict in FILTER_DICTS.items():
+        for filter_param in filters[key]:
+            names_dict[filter_param] = names[filter_param]
     return filters
 
 
+def read_sidebar(soup, url, key):
+    """
+    Return (filters, names) of a category page's filter sidebar and record its fingerprint.
+    With a previous registry, an unchanged sidebar is not read again: the stored filters are used.
+    """
+    fingerprint = sidebar_fingerprint(soup)
+    category_fingerprints[key] = fingerprint
+    if previous_registry and previous_registry.fingerprint(*key) == fingerprint:
+        reused_sidebars.append(key)
+        stored = previous_registry.category(*key)
+        filters = {kind: stored.get(kind, []) for kind in FILTER_DICTS}
+        filters["counts"] = stored.get("counts", {})
+        return filters, {filter_param: previous_names[filter_param]
+                         for kind in FILTER_DICTS for filter_param in filters[kind]}
+    return parse_filters(soup, url)
+
+
+def read_subcategory(subcategory_url, key):
+    """
+    Read a subcategory page once for both questions discovery asks of it.
+    Returns (deeper subcategories, (filters, names)); the filters are only read when there
+    are no deeper subcategories, since then the page is the one scraped.
+    """
+    print(f"Checking for deeper subcategories in: {subcategory_url}")
+    soup = make_soup(page_cache.get(subcategory_url), *SUBCATEGORY_PARSE_RULES)
+    deep_subcategories = parse_deep_subcategories(soup)
+    if deep_subcategories:
+        return deep_subcategories, None
+    return deep_subcategories, read_sidebar(soup, subcategory_url, key)
+
+
+def read_deep_subcategory(deep_subcategory_url, key):
+    """
+    Read the filters of a deeper subcategory page. Returns (filters, names).
+    """
+    print(f"Scraping filters for subcategory: {deep_subcategory_url}")
+    soup = make_soup(page_cache.get(deep_subcategory_url), ("div", {"id": "sdb"}))
+    return read_sidebar(soup, deep_subcategory_url, key)
+
+
 def build_nested_structure():
     """
     Build the nested dictionary structure with main categories, subcategories, and attributes.
+
+    The category tree is crawled breadth first, one level at a time, with every page of a
+    level fetched concurrently: main categories, then all their subcategories, then all
+    deeper subcategories. Results are put together in site order afterwards, so the
+    structure and the dictionaries come out the same as from a page-by-page walk.
     """
-    for main_category in MAIN_CATEGORIES:
-        main_category_url = f"{BASE_URL}/{main_category}"
-        subcategories = extract_subcategories(main_category_url)
-
-        # Add the main category
-        category_structure[main_category] = {}
-
-        # Iterate through subcategories
-        for subcategory_name, subcategory_url in subcategories.items():
-            print(f"Processing subcategory: {subcategory_name}")
-
-            # Check if deeper subcategories exist
-            deep_subcategories = extract_deep_subcategories(subcategory_url)
-            if deep_subcategories:
-                category_structure[main_category][subcategory_name] = {}
-                for deep_subcategory_name, deep_subcategory_url in deep_subcategories.items():
-                    print(f"Processing deeper subcategory: {deep_subcategory_name}")
-                    attributes = scrape_filters(deep_subcategory_url)
-                    category_structure[main_category][subcategory_name][deep_subcategory_name] = {
-                        "url": deep_subcategory_url,
-                        **attributes,
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+        main_pages = {main_category: executor.submit(extract_subcategories, f"{BASE_URL}/{main_category}")
+                      for main_category in MAIN_CATEGORIES}
+        subcategories = {main_category: future.result() for main_category, future in main_pages.items()}
+
+        subcategory_pages = {(main_category, subcategory_name): executor.submit(
+                                 read_subcategory, subcategory_url, (main_category, subcategory_name))
+                             for main_category, children in subcategories.items()
+                             for subcategory_name, subcategory_url in children.items()}
+
+        deep_pages = {}
+        for (main_category, subcategory_name), future in subcategory_pages.items():
+            deep_subcategories, _ = future.result()
+            for deep_subcategory_name, deep_subcategory_url in deep_subcategories.items():
+                deep_pages[main_category, subcategory_name, deep_subcategory_name] = executor.submit(
+                    read_deep_subcategory, deep_subcategory_url,
+                    (main_category, f"{subcategory_name} > {deep_subcategory_name}"))
+
+        for main_category, children in subcategories.items():
+            # Add the main category
+            category_structure[main_category] = {}
+
+            for subcategory_name, subcategory_url in children.items():
+                deep_subcategories, attributes = subcategory_pages[main_category, subcategory_name].result()
+                if deep_subcategories:
+                    category_structure[main_category][subcategory_name] = {}
+                    for deep_subcategory_name, deep_subcategory_url in deep_subcategories.items():
+                        filters = deep_pages[main_category, subcategory_name, deep_subcategory_name].result()
+                        category_structure[main_category][subcategory_name][deep_subcategory_name] = {
+                            "url": deep_subcategory_url,
+                            **record_filter_names(*filters),
+                        }
+                else:
+                    # If no deeper subcategories, the subcategory's own filters are used
+                    category_structure[main_category][subcategory_name] = {
+                        "url": subcategory_url,
+                        **record_filter_names(*attributes),
                     }
-            else:
-                # If no deeper subcategories, scrape attributes for the current subcategory
-                attributes = scrape_filters(subcategory_url)
-                category_structure[main_category][subcategory_name] = {
-                    "url": subcategory_url,
-                    **attributes,
-                }
 
 
 def main():
+    global previous_registry, previous_names
+    parser = argparse.ArgumentParser(description="Discover Fylliana categories and filters into the registry.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only read the filter sidebars that changed since the last discovery, "
+                             "and print what changed")
+    args = parser.parse_args()
+
+    previous_structure = None
+    if args.incremental and os.path.exists(CATEGORIES_FILE):
+        previous_registry = CategoryRegistry(CATEGORIES_FILE)
+        previous_structure = dict(previous_registry.structure())
+        previous_names = dict(previous_registry.names())
+
     # Build the nested structure
     build_nested_structure()
 
-    # Print the entire structure in copy-pasteable format
-    print("\nCategory Structure:")
-    for main_category, subcategories in category_structure.items():
-        print(f'"{main_category}": {{')
-        for subcategory, details in subcategories.items():
-            if isinstance(details, dict) and "url" not in details:
-                print(f'    "{subcategory}": {{')
-                for deep_subcategory, deep_details in details.items():
-                    print(f'        "{deep_subcategory}": {deep_details},')
-                print("    },")
-            else:
-                print(f'    "{subcategory}": {details},')
-        print("},")
-
-    print(color_dict)
-    print(material_dict)
-    print(features_dict)
+    if previous_structure is not None:
+        print(f"{len(reused_sidebars)} of {len(category_fingerprints)} filter sidebars unchanged.")
+        print(format_diff(diff_structures(previous_structure, category_structure),
+                          {**previous_names, **color_dict, **material_dict, **features_dict}))
+
+    # Save the structure where script.py reads it
+    save_registry(CATEGORIES_FILE, BASE_URL, category_structure, {**color_dict, **material_dict, **features_dict},
+                  list(FILTER_DICTS), category_fingerprints)
+    print(f"Page cache: {page_cache.misses} category pages fetched, {page_cache.hits} reads served from memory")
+    print(fetcher.report())
+    print(http_cache.report())
 
 if __name__ == "__main__":
     main()
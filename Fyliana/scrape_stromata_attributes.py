@@ -1,5 +1,13 @@
-import requests
-from bs4 import BeautifulSoup
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.fetch import Fetcher
+from common.http_cache import HttpCache
+from common.parsing import make_soup
+from category_registry import CategoryRegistry, diff_structures, filter_count, format_diff, save_registry, \
+    sidebar_fingerprint
 
 # Base URL for the website
 BASE_URL = "https://www.fylliana.gr"
@@ -9,6 +17,16 @@ MAIN_CATEGORIES = [
     "stromata",  # Focus on the "stromata" category as an example
 ]
 
+# Registry script_stromata.py reads the categories and filters from
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fylliana_stromata_categories.json")
+
+# HTTP cache shared with script_stromata.py; every page is revalidated, so unchanged ones cost a 304
+CACHE_FILE = "fylliana_http_cache.sqlite"
+http_cache = HttpCache(CACHE_FILE, ttl=0)
+
+# Keep-alive connections reused for every category page
+fetcher = Fetcher(workers=1, cache=http_cache)
+
 # Nested dictionary to store the entire structure
 category_structure = {}
 color_dict = {}
@@ -16,14 +34,26 @@ material_dict = {}
 features_dict = {}
 dimensions_dict = {}
 
+# Filter lists of a category and the dictionary naming their values
+FILTER_DICTS = {"valid_colors": color_dict, "valid_materials": material_dict, "valid_features": features_dict,
+                "valid_dimensions": dimensions_dict}
+
+# Filter sidebar hash of every category, keyed by (main category, subcategory)
+category_fingerprints = {}
+
+# Registry of the last discovery and its filter names when running with --incremental, set up in main()
+previous_registry = None
+previous_names = {}
+reused_sidebars = []
+
 
 def extract_subcategories(main_category_url):
     """
     Extract subcategories and their URLs from a main category page.
     """
     print(f"Extracting subcategories from: {main_category_url}")
-    response = requests.get(main_category_url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    response = fetcher.get(main_category_url)
+    soup = make_soup(response.content, ("div", {"id": "indstc"}))
 
     subcategories = {}
 
@@ -38,15 +68,28 @@ def extract_subcategories(main_category_url):
     return subcategories
 
 
-def scrape_filters(subcategory_url):
+def scrape_filters(subcategory_url, key):
     """
     Scrape attribute filters (Χρώμα, Υλικό, Χαρακτηριστικά, Διαστάσεις) from a subcategory URL.
+    With a previous registry, an unchanged sidebar is not read again: the stored filters are used.
     """
     print(f"Scraping filters for subcategory: {subcategory_url}")
-    response = requests.get(subcategory_url)
-    soup = BeautifulSoup(response.content, "html.parser")
-
-    filters = {"valid_colors": [], "valid_materials": [], "valid_features": [], "valid_dimensions": []}
+    response = fetcher.get(subcategory_url)
+    soup = make_soup(response.content, ("div", {"id": "sdb"}))
+
+    filters = {"valid_colors": [], "valid_materials": [], "valid_features": [], "valid_dimensions": [], "counts": {}}
+
+    fingerprint = sidebar_fingerprint(soup)
+    category_fingerprints[key] = fingerprint
+    if previous_registry and previous_registry.fingerprint(*key) == fingerprint:
+        reused_sidebars.append(key)
+        stored = previous_registry.category(*key)
+        for kind, names in FILTER_DICTS.items():
+            filters[kind] = stored.get(kind, [])
+            for filter_id in filters[kind]:
+                names[filter_id] = previous_names[filter_id]
+        filters["counts"] = stored.get("counts", {})
+        return filters
 
     # Locate the filter section
     filter_section = soup.find("div", id="sdb")
@@ -72,6 +115,9 @@ def scrape_filters(subcategory_url):
                 continue
 
             filter_id = f"{filter_name}[]={input_element['value']}"
+            count = filter_count(label.text.strip())
+            if count is not None:
+                filters["counts"][filter_id] = count
 
             # Categorize filters
             if "Χρώμα" in filter_name:
@@ -104,7 +150,7 @@ def build_nested_structure():
         # Iterate through subcategories
         for subcategory_name, subcategory_url in subcategories.items():
             print(f"Processing subcategory: {subcategory_name}")
-            attributes = scrape_filters(subcategory_url)
+            attributes = scrape_filters(subcategory_url, (main_category, subcategory_name))
 
             # Keep filters in the format like 'Χρώμα[]=10'
             category_structure[main_category][subcategory_name] = {
@@ -113,44 +159,32 @@ def build_nested_structure():
             }
 
 
-def format_output():
-    """
-    Format the nested dictionary for display.
-    """
-    formatted_output = ""
-    for main_category, subcategories in category_structure.items():
-        formatted_output += f'"{main_category}": {{\n'
-        for subcategory_name, details in subcategories.items():
-            formatted_output += f'    "{subcategory_name}": {{\n'
-            formatted_output += f'        "url": "{details["url"]}",\n'
-            formatted_output += f'        "valid_colors": {details["valid_colors"]},\n'
-            formatted_output += f'        "valid_materials": {details["valid_materials"]},\n'
-            formatted_output += f'        "valid_features": {details["valid_features"]},\n'
-            formatted_output += f'        "valid_dimensions": {details["valid_dimensions"]}\n'
-            formatted_output += f'    }},\n'
-        formatted_output += f'}},\n'
-    return formatted_output
-
-
 def main():
+    global previous_registry, previous_names
+    parser = argparse.ArgumentParser(description="Discover Fylliana mattress categories and filters into the registry.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only read the filter sidebars that changed since the last discovery, "
+                             "and print what changed")
+    args = parser.parse_args()
+
+    previous_structure = None
+    if args.incremental and os.path.exists(CATEGORIES_FILE):
+        previous_registry = CategoryRegistry(CATEGORIES_FILE)
+        previous_structure = dict(previous_registry.structure())
+        previous_names = dict(previous_registry.names())
+
     # Build the nested structure
     build_nested_structure()
 
-    # Print the entire structure in copy-pasteable format
-    print("\nCategory Structure:")
-    print(format_output())
-
-    print("\nColor Dictionary:")
-    print(color_dict)
-
-    print("\nMaterial Dictionary:")
-    print(material_dict)
-
-    print("\nFeatures Dictionary:")
-    print(features_dict)
+    names = {**color_dict, **material_dict, **features_dict, **dimensions_dict}
+    if previous_structure is not None:
+        print(f"{len(reused_sidebars)} of {len(category_fingerprints)} filter sidebars unchanged.")
+        print(format_diff(diff_structures(previous_structure, category_structure), {**previous_names, **names}))
 
-    print("\nDimensions Dictionary:")
-    print(dimensions_dict)
+    # Save the structure where script_stromata.py reads it
+    save_registry(CATEGORIES_FILE, BASE_URL, category_structure, names, list(FILTER_DICTS), category_fingerprints)
+    print(fetcher.report())
+    print(http_cache.report())
 
 
 if __name__ == "__main__":
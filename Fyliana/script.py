@@ -1,10 +1,25 @@
+import argparse
+import asyncio
 import requests
-import time
-from bs4 import BeautifulSoup
-import pandas as pd
 import os
-from categories_and_attributes import category_structure, color_dict, material_dict, features_dict
-from concurrent.futures import ThreadPoolExecutor
+import re
+import sys
+from card_store import CardStore
+from category_registry import CategoryRegistry, has_products
+from detail_cache import DetailCache
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.csv_writer import StreamingCsvWriter, update_rows
+from common.fetch import Fetcher
+from common.http_cache import HttpCache
+from common.journal import CrawlJournal
+from common.metrics import Metrics
+from common.parse_pool import ParsePool
+from common.product_state import ProductState, export_delta
+from common.rate_limit import RateLimiter
+from common.parsing import make_soup
+from common.work_queue import WorkQueue
+from concurrent.futures import Future
 
 # Base URL for the website
 BASE_URL = "https://www.fylliana.gr"
@@ -28,16 +43,66 @@ HEADERS = [
     "attribute:Feature"
 ]
 
+# Categories and filters found by scrape_attributes.py
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fylliana_categories.json")
+
 # Output CSV file
 OUTPUT_FILE = "fylliana_products.csv"
 
-# Retry settings
+# Finished listings, details and written SKUs, so `--resume` can continue an interrupted run
+JOURNAL_FILE = "fylliana_products.journal.jsonl"
+
+# On-disk HTTP cache kept between runs
+CACHE_FILE = "fylliana_http_cache.sqlite"
+
+# Products of the last finished run, to export only what changed since
+STATE_FILE = "fylliana_product_state.sqlite"
+
+# Listing cards with the details read for them; with SKIP_UNCHANGED_DETAILS an unchanged card
+# reuses the stored description and images instead of fetching its detail page
+CARD_STORE_FILE = "fylliana_cards.sqlite"
+SKIP_UNCHANGED_DETAILS = False
+
+# Run report (JSON, plus a .txt next to it) with per-stage timings, requests and products per
+# category; METRICS_PORT > 0 also serves Prometheus counters at http://127.0.0.1:<port>/metrics
+METRICS_FILE = "fylliana_metrics.json"
+METRICS_PORT = 0
+
+# Retry settings: throttled (429/503) and failed requests are retried with exponential
+# backoff and jitter, waiting at least the Retry-After the shop asks for
 MAX_RETRIES = 5
-RETRY_DELAY = 10  # seconds
+RETRY_BACKOFF = 1  # seconds, the longest first wait; doubled every retry
+RETRY_MAX_DELAY = 60  # seconds
+
+# Requests per second to the shop. The rate and the requests in flight are raised while the
+# shop keeps up and halved when it throttles (429/503), up to MAX_RATE
+START_RATE = 10
+MAX_RATE = 50
 
 # Number of threads
 NUM_THREADS = 4
 
+# Multiplex requests over HTTP/2 (needs httpx[http2])
+USE_HTTP2 = False
+
+# Processes that parse pages (0 parses in the fetch threads). BeautifulSoup holds the GIL,
+# so with parser processes NUM_THREADS can go well past 4.
+PARSE_WORKERS = 0
+
+# Crawl mode:
+# "filters" fetches the unfiltered listing once plus one listing per single filter value
+# and assigns attributes by set membership (requests grow with the sum of the filter lists).
+# "cartesian" requests every color × material × feature combination.
+CRAWL_MODE = "filters"
+
+# Limits for the asyncio engine (--engine async)
+ASYNC_MAX_CONCURRENCY = 64
+ASYNC_PER_HOST_LIMIT = 16
+
+# Parts of each page the extractors read; nothing else is built when parsing
+LISTING_PARSE_RULES = [("div", {"id": "ctg"}), ("div", {"id": "pagination"})]
+DETAIL_PARSE_RULES = [("p", {"class": "sdesc"}), ("div", {"id": "primgms"})]
+
 # Dictionary for translating main categories to Greek
 MAIN_CATEGORY_TRANSLATIONS = {
     "epipla": "Έπιπλα",
@@ -49,33 +114,100 @@ MAIN_CATEGORY_TRANSLATIONS = {
 }
 
 
-def fetch_page(url):
+# Read from CATEGORIES_FILE the first time they are used
+category_registry = CategoryRegistry(CATEGORIES_FILE)
+category_structure = category_registry.structure()
+color_dict = category_registry.names("valid_colors")
+material_dict = category_registry.names("valid_materials")
+features_dict = category_registry.names("valid_features")
+
+# Pages are revalidated with ETag/Last-Modified instead of downloaded again every run
+http_cache = HttpCache(CACHE_FILE)
+
+# Polite per-host pacing shared by both engines
+rate_limiter = RateLimiter(rate=START_RATE, max_rate=MAX_RATE, concurrency=NUM_THREADS,
+                           max_concurrency=max(NUM_THREADS, ASYNC_PER_HOST_LIMIT))
+
+# Stage timings and request counters of this run
+metrics = Metrics(shop="fylliana")
+
+# Keep-alive connections shared by every thread; listings and detail pages are retried alike
+fetcher = Fetcher(workers=NUM_THREADS, cache=http_cache, http2=USE_HTTP2, limiter=rate_limiter,
+                  max_retries=MAX_RETRIES, backoff_base=RETRY_BACKOFF, backoff_cap=RETRY_MAX_DELAY, metrics=metrics)
+
+
+def page_text(response_future, url):
     """
-    Synchronously fetch a page's content using requests with retries.
+    Return the content of a page requested with fetcher.submit (which retries throttled and
+    failed requests), or None if it could not be fetched.
     """
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            print(f"Error fetching URL {url}: {e}. Retrying ({attempt + 1}/{MAX_RETRIES})...")
-            if attempt + 1 < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
-    print(f"Failed to fetch URL after {MAX_RETRIES} attempts: {url}")
-    return None
+    try:
+        response = response_future.result()
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        print(f"Failed to fetch URL {url}: {e}")
+        return None
+
+
+# Process pool for parsing, set up in main() when PARSE_WORKERS > 0
+parse_pool = None
+
+# Set in main
+journal = None
+card_store = None
 
 
-def scrape_description_and_images(product_url):
+def parse_page(func, content):
     """
-    Scrape the description and all images of a product from its detail page.
+    Run a page parser in the parse process pool when there is one, otherwise in this thread.
     """
+    with metrics.stage("parse"):
+        if parse_pool is None:
+            return func(content)
+        return parse_pool.parse(func, content)
+
+
+def scrape_description_and_images(group, product_url):
+    """
+    Start scraping the description and all images of a product from its detail page and
+    return a Future of them. The page is downloaded (and retried) on the fetcher's threads
+    and parsed by a unit of `group`, so no worker waits for it.
+    """
+    result = Future()
+    if journal and journal.done("detail", product_url):
+        result.set_result(tuple(journal.get("detail", product_url)))
+        return result
+
     print(f"Fetching description and images from: {product_url}")
-    html = fetch_page(product_url)
-    if not html:
-        return "No description available.", ""
+    group.after(fetcher.submit(product_url, timeout=30), parse_detail_unit, product_url, result)
+    return result
 
-    soup = BeautifulSoup(html, "html.parser")
+
+def parse_detail_unit(response_future, product_url, result):
+    """
+    Parse a downloaded detail page into the `result` Future.
+    """
+    try:
+        html = page_text(response_future, product_url)
+        if not html:
+            result.set_result(("No description available.", ""))
+            return
+        details = parse_page(parse_description_and_images, html)
+    except Exception as e:
+        result.set_exception(e)
+        return
+
+    if journal:
+        journal.record("detail", product_url, list(details))
+    result.set_result(details)
+
+
+def parse_description_and_images(html):
+    """
+    Extract the description and comma-separated image URLs from a detail page.
+    """
+    soup = make_soup(html, *DETAIL_PARSE_RULES)
 
     # Extract description
     description_element = soup.find("p", class_="sdesc")
@@ -96,139 +228,640 @@ def scrape_description_and_images(product_url):
     return description, images_csv_format
 
 
-def fetch_product_data(url, main_category, subcategory, color=None, material=None, feature=None):
+# Detail pages shared by every thread, so each product is fetched once per run
+detail_cache = DetailCache()
+
+
+def schedule_card_details(group, card, done):
     """
-    Fetch product data from a given URL, handling pagination if present,
-    and consolidating attributes for each product.
+    Pass (description, images) of a listing card to `done`, or None if they could not be
+    read. The detail page is skipped if the card is unchanged.
     """
-    products = {}
-    page_number = 1
-    main_category_greek = MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)
+    details = card_store.lookup(card) if card_store else None
+    if details is not None:
+        done(details)
+        return
 
-    while True:
-        # Construct the paginated URL
-        if "?" in url:
-            paginated_url = url.replace("?", f"?p={page_number}&")
-        else:
-            paginated_url = f"{url}?p={page_number}"
+    future = detail_cache.submit(card["url"], lambda product_url: scrape_description_and_images(group, product_url))
+    group.after(future, card_details_done, card, done)
 
-        print(f"Fetching products from: {paginated_url}")
-        response = requests.get(paginated_url)
-        soup = BeautifulSoup(response.content, "html.parser")
 
-        # Locate the product container
-        category_div = soup.find("div", id="ctg")
-        if not category_div:
-            break
+def card_details_done(future, card, done):
+    """
+    Remember the details of a card in the card store and pass them on.
+    """
+    try:
+        details = future.result()
+    except Exception as e:
+        print(f"Error fetching product: {e}")
+        done(None)
+        return
 
-        product_container = category_div.find("div", id="prdsc")
-        if not product_container:
-            break
+    if card_store:
+        card_store.remember(card, details)
+    done(details)
 
-        product_list = product_container.find_all("div", class_="prdv")
-        if not product_list:
-            print(f"No products found on page {page_number} at {paginated_url}.")
-            break
 
+def schedule_details(group, cards, then):
+    """
+    Read the details of every card (see schedule_card_details) and queue `then(details)` in card order.
+    """
+    deliver = group.gather(len(cards), then)
+    for index, card in enumerate(cards):
+        group.submit(schedule_card_details, group, card, lambda details, index=index: deliver(index, details))
+
+
+def paginate_url(url, page_number):
+    """
+    Add the page number to a listing URL.
+    """
+    if "?" in url:
+        return url.replace("?", f"?p={page_number}&")
+    return f"{url}?p={page_number}"
+
+
+def parse_product_card(product):
+    """
+    Extract title, price, SKU and detail URL from a listing card (div.prdv).
+    """
+    # Title
+    title_element = product.find("h2")
+    title = title_element.text.strip() if title_element else "N/A"
+
+    # Price
+    price_element = product.find("p", class_="prc")
+    price = price_element.text.strip() if price_element else "N/A"
+
+    # SKU
+    sku_element = product.find("h4")
+    sku = sku_element.text.strip() if sku_element else "N/A"
+
+    # Product URL
+    product_link_element = product.find("a", href=True)
+    product_url = BASE_URL + product_link_element["href"] if product_link_element else "N/A"
+
+    return {"title": title, "price": price, "sku": sku, "url": product_url}
+
+
+def parse_listing_page(html):
+    """
+    Parse one listing page into product cards.
+    Returns (cards, page_count); cards is None when the page has no product container
+    and page_count is the highest page number div#pagination links to (0 if there is no pagination).
+    """
+    soup = make_soup(html, *LISTING_PARSE_RULES)
+
+    # Locate the product container
+    category_div = soup.find("div", id="ctg")
+    if not category_div:
+        return None, 0
+
+    product_container = category_div.find("div", id="prdsc")
+    if not product_container:
+        return None, 0
+
+    cards = []
+    for product in product_container.find_all("div", class_="prdv"):
+        try:
+            cards.append(parse_product_card(product))
+        except Exception as e:
+            print(f"Error parsing product card: {e}")
+
+    # Check for pagination
+    pagination_div = soup.find("div", id="pagination")
+    if not pagination_div or not pagination_div.find("div", class_="pagination"):
+        return cards, 0
+
+    return cards, last_page_number(pagination_div)
+
+
+def last_page_number(pagination_div):
+    """
+    Return the highest page number in the links of a listing's pagination, read from the
+    link texts and their ?p= parameters, so pages left out of a long pagination still count.
+    """
+    numbers = []
+    for link in pagination_div.find_all("a"):
+        text = link.get_text(strip=True)
+        if text.isdigit():
+            numbers.append(int(text))
+        match = re.search(r"[?&]p=(\d+)", link.get("href", ""))
+        if match:
+            numbers.append(int(match.group(1)))
+    return max(numbers, default=0)
+
+
+def schedule_listing_page(group, url, page_number, done):
+    """
+    Request one page of a listing URL and call `done(cards, page_count)` (see parse_listing_page)
+    from a unit of `group` once it is parsed. No worker waits for the download or its retries.
+    """
+    paginated_url = paginate_url(url, page_number)
+    print(f"Fetching products from: {paginated_url}")
+    metrics.count("pages")
+    group.after(fetcher.submit(paginated_url), parse_listing_unit, paginated_url, page_number, done)
+
+
+def parse_listing_unit(response_future, paginated_url, page_number, done):
+    """
+    Parse a downloaded listing page and pass its cards and page count to `done`.
+    """
+    page_cards, page_count = parse_page(parse_listing_page, response_future.result().content)
+    if page_cards is None:
+        done(None, 0)
+        return
+
+    if not page_cards:
+        print(f"No products found on page {page_number} at {paginated_url}.")
+    else:
         # Notify only if products are found
-        print(f"Found {len(product_list)} products on page {page_number}.")
+        print(f"Found {len(page_cards)} products on page {page_number}.")
+    done(page_cards, page_count)
+
+
+def join_listing_pages(url, pages):
+    """
+    Join the cards of a listing's pages in page order, up to the first missing or empty page.
+    """
+    cards = []
+    for page_cards in pages:
+        if not page_cards:
+            break
+        cards.extend(page_cards)
+
+    if journal:
+        journal.record("listing", url, cards)
+    return cards
+
+
+def schedule_listing(group, url, done):
+    """
+    Fetch every page of a listing URL, each page parsed by its own unit of `group`, and pass
+    the product cards in listing order to `done(cards)`.
+    """
+    if journal and journal.done("listing", url):
+        done(journal.get("listing", url))
+        return
+
+    metrics.count("listings")
+    schedule_listing_page(group, url, 1, lambda page_cards, page_count: first_listing_page_done(
+        group, url, page_cards, page_count, done))
+
+
+def first_listing_page_done(group, url, page_cards, page_count, done):
+    """
+    Request all other pages of a listing at once, as the pagination on page 1 tells how many there are.
+    """
+    if not page_cards or page_count <= 1:
+        done(join_listing_pages(url, [page_cards]))
+        return
+
+    deliver = group.gather(page_count - 1, lambda pages: done(join_listing_pages(url, [page_cards] + pages)))
+    for page_number in range(2, page_count + 1):
+        schedule_listing_page(group, url, page_number,
+                              lambda cards, _, index=page_number - 2: deliver(index, cards))
+
+
+def build_product(card, description, images_csv_format, category_path, color=None, material=None, feature=None):
+    """
+    Build a WooCommerce product row from a listing card, its detail page data and filter values.
+    """
+    # Map attributes to human-readable names
+    color_name = color_dict.get(color, color or "")
+    material_name = material_dict.get(material, material or "")
+    feature_name = features_dict.get(feature, feature or "")
 
-        for product in product_list:
-            try:
-                # Title
-                title_element = product.find("h2")
-                title = title_element.text.strip() if title_element else "N/A"
+    # Tags
+    tags = []
+    if color_name:
+        tags.append(color_name)
+    if material_name:
+        tags.append(material_name)
+    tags = ",".join(tags)
 
-                # Price
-                price_element = product.find("p", class_="prc")
-                price = price_element.text.strip() if price_element else "N/A"
+    return {
+        "sku": card["sku"],
+        "post_title": card["title"],
+        "post_excerpt": description[:100],
+        "post_content": description,
+        "regular_price": card["price"],
+        "sale_price": "",
+        "stock": "",
+        "manage_stock": "no",
+        "weight": "",
+        "images": images_csv_format,
+        "tax:product_cat": category_path,
+        "tax:product_tag": tags,
+        "attribute:Color": color_name,
+        "attribute:Material": material_name,
+        "attribute:Feature": feature_name,
+    }
 
-                # SKU
-                sku_element = product.find("h4")
-                sku = sku_element.text.strip() if sku_element else "N/A"
 
-                # Product URL
-                product_link_element = product.find("a", href=True)
-                product_url = BASE_URL + product_link_element["href"] if product_link_element else "N/A"
+def schedule_product_data(group, url, main_category, subcategory, done, color=None, material=None, feature=None):
+    """
+    Fetch product data from a given URL, handling pagination if present,
+    and consolidating attributes for each product. The listing pages and detail pages
+    are units of `group`; `done` receives the products.
+    """
+    main_category_greek = MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)
+    category_path = f"{main_category_greek} > {subcategory}"
 
-                # Scrape description and images
-                description, images_csv_format = scrape_description_and_images(product_url)
+    def listing_done(cards):
+        # Details of every SKU once, the first card of a repeated SKU is the one kept
+        first_cards = {}
+        for card in cards:
+            first_cards.setdefault(card["sku"], card)
+        schedule_details(group, list(first_cards.values()),
+                         lambda details: details_done(cards, dict(zip(first_cards, details))))
 
-                # Map attributes to human-readable names
-                color_name = color_dict.get(color, color or "")
-                material_name = material_dict.get(material, material or "")
+    def details_done(cards, details):
+        products = {}
+        for card in cards:
+            sku = card["sku"]
+            if sku in products:
+                existing_product = products[sku]
                 feature_name = features_dict.get(feature, feature or "")
+                if feature_name and feature_name not in existing_product["attribute:Feature"]:
+                    existing_product["attribute:Feature"] += f",{feature_name}"
+                continue
+            if details[sku] is None:
+                continue
+            description, images_csv_format = details[sku]
+            with metrics.stage("extract"):
+                products[sku] = build_product(card, description, images_csv_format, category_path,
+                                              color, material, feature)
+        done(list(products.values()))
 
-                # Tags and Category
-                tags = []
-                if color_name:
-                    tags.append(color_name)
-                if material_name:
-                    tags.append(material_name)
-                tags = ",".join(tags)
-
-                category_path = f"{main_category_greek} > {subcategory}"
-
-                # Add a new product entry
-                if sku in products:
-                    existing_product = products[sku]
-                    if feature_name and feature_name not in existing_product["attribute:Feature"]:
-                        existing_product["attribute:Feature"] += f",{feature_name}"
-                else:
-                    products[sku] = {
-                        "sku": sku,
-                        "post_title": title,
-                        "post_excerpt": description[:100],
-                        "post_content": description,
-                        "regular_price": price,
-                        "sale_price": "",
-                        "stock": "",
-                        "manage_stock": "no",
-                        "weight": "",
-                        "images": images_csv_format,
-                        "tax:product_cat": category_path,
-                        "tax:product_tag": tags,
-                        "attribute:Color": color_name,
-                        "attribute:Material": material_name,
-                        "attribute:Feature": feature_name,
-                    }
-
-            except Exception as e:
-                print(f"Error fetching product: {e}")
-
-        # Check for pagination
-        pagination_div = soup.find("div", id="pagination")
-        if not pagination_div or not pagination_div.find("div", class_="pagination"):
-            break
+    schedule_listing(group, url, listing_done)
 
-        pagination_links = pagination_div.find_all("a", class_="num")
-        if not pagination_links or page_number >= len(pagination_links):
-            break
 
-        page_number += 1
+def filter_values(filters):
+    """
+    Return every color, material and feature value of a category, in filter order.
+    """
+    return [value for key in ("valid_colors", "valid_materials", "valid_features") for value in filters[key]]
+
+
+def filter_listing_urls(base_url, filters):
+    """
+    Return (filter value, listing URL) for every single filter value of a category that
+    discovery counted products for. Values with the most products come first, so their
+    longer listings start paginating early.
+    """
+    counts = filters.get("counts", {})
+    values = [value for value in filter_values(filters) if has_products(filters, value)]
+    values.sort(key=lambda value: counts.get(value, 0), reverse=True)
+    return [(value, f"{base_url}?filter-{value}") for value in values]
+
 
+def filter_members(filters, filter_urls, filtered_listings):
+    """
+    Return {filter value: set of SKUs} from the listings of filter_listing_urls.
+    Values without products are not requested and have no members.
+    """
+    members = {value: set() for value in filter_values(filters)}
+    members.update({value: {card["sku"] for card in cards}
+                    for (value, _), cards in zip(filter_urls, filtered_listings)})
+    return members
+
+
+def first_match(values, skus_by_value, sku):
+    """
+    Return (index, value) of the first filter value whose listing contains the SKU.
+    An empty filter list matches everything with value None, like generate_urls does.
+    """
+    if not values:
+        return 0, None
+    for index, value in enumerate(values):
+        if sku in skus_by_value[value]:
+            return index, value
+    return None, None
+
+
+def schedule_products_by_filters(group, base_url, filters, main_category, subcategory, done):
+    """
+    Scrape a category with one listing pass per single filter value instead of one per
+    color × material × feature combination, assigning attributes by set membership.
+
+    A product gets the first matching color and material (in filter order) and every
+    matching feature, which is what the consolidated combination crawl produces.
+    Every listing is paginated by its own units of `group`, and the detail pages are
+    queued once all listings are in; `done` receives the products.
+    """
+    main_category_greek = MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)
+    category_path = f"{main_category_greek} > {subcategory}"
+    report_filter_requests(filters, category_path)
+    filter_urls = filter_listing_urls(base_url, filters)
+
+    def listings_done(listings):
+        listing, *filtered_listings = listings
+        members = filter_members(filters, filter_urls, filtered_listings)
+        selected = select_filtered_products(listing, members, filters)
+        schedule_details(group, [card for card, _, _, _ in selected],
+                         lambda details: details_done(selected, members, details))
+
+    def details_done(selected, members, details):
+        products = []
+        with metrics.stage("extract"):
+            for (card, color, material, feature), card_detail in zip(selected, details):
+                if card_detail is None:
+                    continue
+                description, images_csv_format = card_detail
+                products.append(build_filtered_product(card, description, images_csv_format, category_path,
+                                                       color, material, feature, filters, members))
+        done(products)
+
+    deliver = group.gather(1 + len(filter_urls), listings_done)
+    for index, url in enumerate([base_url] + [url for _, url in filter_urls]):
+        schedule_listing(group, url, lambda cards, index=index: deliver(index, cards))
+
+
+def report_filter_requests(filters, category_path):
+    """
+    Print how many listings the single-filter crawl needs compared to the combination crawl.
+    """
+    colors, materials, features = filters["valid_colors"], filters["valid_materials"], filters["valid_features"]
+    combinations = max(len(colors), 1) * max(len(materials), 1) * max(len(features), 1)
+    skipped = sum(not has_products(filters, value) for value in filter_values(filters))
+    if skipped:
+        metrics.count("skipped_listings", skipped)
+    print(f"Fetching {1 + len(colors) + len(materials) + len(features) - skipped} listings "
+          f"instead of {combinations} filter combinations for {category_path}"
+          + (f" ({skipped} filter values without products skipped)." if skipped else "."))
+
+
+def select_filtered_products(listing, members, filters):
+    """
+    Pick the products the combination crawl would return and their first color, material
+    and feature, ordered the way the combination crawl first meets them.
+    Returns a list of (card, color, material, feature).
+    """
+    colors, materials, features = filters["valid_colors"], filters["valid_materials"], filters["valid_features"]
+    selected = {}
+    for position, card in enumerate(listing):
+        sku = card["sku"]
+        if sku in selected:
+            continue
+        color_index, color = first_match(colors, members, sku)
+        material_index, material = first_match(materials, members, sku)
+        feature_index, feature = first_match(features, members, sku)
+        if None in (color_index, material_index, feature_index):
+            continue  # The product is not returned by any filter combination
+        order = (color_index, material_index, feature_index, position)
+        selected[sku] = (order, card, color, material, feature)
+
+    return [entry[1:] for entry in sorted(selected.values(), key=lambda entry: entry[0])]
+
+
+def build_filtered_product(card, description, images_csv_format, category_path, color, material, feature,
+                           filters, members):
+    """
+    Build the product row for a single-filter crawl, adding every other matching feature.
+    """
+    product = build_product(card, description, images_csv_format, category_path, color, material, feature)
+
+    # Collect the remaining features the same way the combination crawl does
+    for other_feature in filters["valid_features"]:
+        feature_name = features_dict.get(other_feature, other_feature)
+        if other_feature != feature and card["sku"] in members[other_feature] \
+                and feature_name not in product["attribute:Feature"]:
+            product["attribute:Feature"] = f"{product['attribute:Feature']},{feature_name}".strip(",")
+
+    return product
+
+
+def schedule_filtered_listing(group, base_url, filters, main_category, subcategory, done):
+    """
+    Scrape one listing URL and its attribute filters using the configured crawl mode,
+    as units of `group`; `done` receives the products.
+    """
+    def products_done(products):
+        metrics.count("products", len(products))
+        done(products)
+
+    # Units keep the metric labels they were queued under, as do the units they queue
+    with metrics.labels(category=category_label(main_category, subcategory)):
+        if CRAWL_MODE == "filters":
+            schedule_products_by_filters(group, base_url, filters, main_category, subcategory, products_done)
+            return
+
+        combinations = []
+        for url, color, material, feature in generate_urls(base_url, filters):
+            # A combination with a value discovery counted no products for lists nothing
+            if not has_products(filters, color, material, feature):
+                metrics.count("skipped_listings")
+                continue
+            combinations.append((url, color, material, feature))
+        deliver = group.gather(len(combinations),
+                               lambda results: products_done([product for products in results for product in products]))
+        for index, (url, color, material, feature) in enumerate(combinations):
+            schedule_product_data(group, url, main_category, subcategory,
+                                  lambda products, index=index: deliver(index, products), color, material, feature)
+
+
+def category_label(main_category, subcategory):
+    """
+    Name a category in the run report the way the CSV does (tax:product_cat).
+    """
+    return f"{MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)} > {subcategory}"
+
+
+def category_targets(subcategory_name, details):
+    """
+    Return (subcategory path, filters) for a subcategory or each of its deep subcategories.
+    """
+    if "url" in details:
+        return [(subcategory_name, details)]
+    return [(f"{subcategory_name} > {deep_subcategory_name}", deep_details)
+            for deep_subcategory_name, deep_details in details.items()]
+
+
+def schedule_category(group, main_category, subcategory_name, details):
+    """
+    Wrapper function to scrape a category: queues its first units and finishes `group`
+    with the products of the subcategory and its deep subcategories, in order.
+    """
+    targets = category_targets(subcategory_name, details)
+    deliver = group.gather(len(targets),
+                           lambda results: group.finish([product for products in results for product in products]))
+    for index, (subcategory_path, filters) in enumerate(targets):
+        schedule_filtered_listing(group, filters["url"], filters, main_category, subcategory_path,
+                                  lambda products, index=index: deliver(index, products))
+
+
+async def fetch_listing_page_async(fetcher, url, page_number):
+    """
+    Asynchronous version of fetch_listing_page.
+    """
+    paginated_url = paginate_url(url, page_number)
+    print(f"Fetching products from: {paginated_url}")
+    metrics.count("pages")
+    content = await fetcher.fetch(paginated_url, raise_for_status=False)
+    if content is None:
+        return None, 0
+
+    page_cards, page_count = await fetcher.parse(parse_listing_page, content)
+    if page_cards is None:
+        return None, 0
+
+    if not page_cards:
+        print(f"No products found on page {page_number} at {paginated_url}.")
+    else:
+        print(f"Found {len(page_cards)} products on page {page_number}.")
+    return page_cards, page_count
+
+
+async def fetch_listing_async(fetcher, url):
+    """
+    Fetch every page of a listing URL: page 1 first, then all other pages it links to at once.
+    """
+    if journal and journal.done("listing", url):
+        return journal.get("listing", url)
+
+    metrics.count("listings")
+    page_cards, page_count = await fetch_listing_page_async(fetcher, url, 1)
+    pages = [page_cards]
+    if page_cards and page_count > 1:
+        pages += [cards for cards, _ in await asyncio.gather(
+            *[fetch_listing_page_async(fetcher, url, page_number) for page_number in range(2, page_count + 1)])]
+    return join_listing_pages(url, pages)
+
+
+async def scrape_description_and_images_async(fetcher, product_url):
+    """
+    Asynchronous version of scrape_description_and_images.
+    """
+    if journal and journal.done("detail", product_url):
+        return tuple(journal.get("detail", product_url))
+
+    print(f"Fetching description and images from: {product_url}")
+    html = await fetcher.fetch(product_url)
+    if not html:
+        return "No description available.", ""
+    result = await fetcher.parse(parse_description_and_images, html)
+    if journal:
+        journal.record("detail", product_url, list(result))
+    return result
+
+
+async def product_details_async(fetcher, card):
+    """
+    Asynchronous version of product_details.
+    """
+    details = card_store.lookup(card) if card_store else None
+    if details is None:
+        details = await fetcher.once(card["url"], scrape_description_and_images_async, fetcher, card["url"])
+        if card_store:
+            card_store.remember(card, details)
+    return details
+
+
+async def fetch_product_data_async(fetcher, url, main_category, subcategory, color=None, material=None, feature=None):
+    """
+    Asynchronous version of schedule_product_data.
+    """
+    main_category_greek = MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)
+    category_path = f"{main_category_greek} > {subcategory}"
+
+    cards = await fetch_listing_async(fetcher, url)
+    # Details of every SKU once, the first card of a repeated SKU is the one kept
+    first_cards = {}
+    for card in cards:
+        first_cards.setdefault(card["sku"], card)
+    details = dict(zip(first_cards, await asyncio.gather(
+        *[product_details_async(fetcher, card) for card in first_cards.values()])))
+
+    products = {}
+    for card in cards:
+        sku = card["sku"]
+        if sku in products:
+            existing_product = products[sku]
+            feature_name = features_dict.get(feature, feature or "")
+            if feature_name and feature_name not in existing_product["attribute:Feature"]:
+                existing_product["attribute:Feature"] += f",{feature_name}"
+            continue
+        description, images_csv_format = details[sku]
+        with metrics.stage("extract"):
+            products[sku] = build_product(card, description, images_csv_format, category_path,
+                                          color, material, feature)
     return list(products.values())
 
 
-def scrape_category(main_category, subcategory_name, details):
+async def fetch_products_by_filters_async(fetcher, base_url, filters, main_category, subcategory):
     """
-    Wrapper function to scrape a category.
+    Asynchronous version of fetch_products_by_filters: every listing of the category is
+    paginated concurrently and detail pages are fetched as soon as the listings are in.
     """
+    main_category_greek = MAIN_CATEGORY_TRANSLATIONS.get(main_category, main_category)
+    category_path = f"{main_category_greek} > {subcategory}"
+    report_filter_requests(filters, category_path)
+
+    filter_urls = filter_listing_urls(base_url, filters)
+    listing, *filtered_listings = await asyncio.gather(
+        fetch_listing_async(fetcher, base_url),
+        *[fetch_listing_async(fetcher, url) for _, url in filter_urls],
+    )
+    members = filter_members(filters, filter_urls, filtered_listings)
+
+    selected = select_filtered_products(listing, members, filters)
+    details = await asyncio.gather(*[product_details_async(fetcher, card) for card, _, _, _ in selected])
+
     products = []
-    if "url" in details:
-        base_url = details["url"]
-        urls = generate_urls(base_url, details)
-        for url, color, material, feature in urls:
-            products.extend(fetch_product_data(url, main_category, subcategory_name, color, material, feature))
+    with metrics.stage("extract"):
+        for (card, color, material, feature), (description, images_csv_format) in zip(selected, details):
+            products.append(build_filtered_product(card, description, images_csv_format, category_path,
+                                                   color, material, feature, filters, members))
+    return products
+
+
+async def fetch_filtered_listing_async(fetcher, base_url, filters, main_category, subcategory):
+    """
+    Asynchronous version of schedule_filtered_listing: scrape one listing URL and its
+    attribute filters using the configured crawl mode.
+    """
+    if CRAWL_MODE == "filters":
+        products = await fetch_products_by_filters_async(fetcher, base_url, filters, main_category, subcategory)
     else:
-        for deep_subcategory_name, deep_details in details.items():
-            base_url = deep_details["url"]
-            urls = generate_urls(base_url, deep_details)
-            for url, color, material, feature in urls:
-                products.extend(fetch_product_data(url, main_category, f"{subcategory_name} > {deep_subcategory_name}", color, material, feature))
+        combinations = []
+        for url, color, material, feature in generate_urls(base_url, filters):
+            # A combination with a value discovery counted no products for lists nothing
+            if not has_products(filters, color, material, feature):
+                metrics.count("skipped_listings")
+                continue
+            combinations.append(fetch_product_data_async(fetcher, url, main_category, subcategory,
+                                                         color, material, feature))
+        products = [product for products in await asyncio.gather(*combinations) for product in products]
+    metrics.count("products", len(products))
     return products
 
 
+async def crawl_async(emit):
+    """
+    Scrape every category in category_structure on the asyncio engine.
+    Categories run concurrently; `emit` receives each category's products in the same
+    order as the thread engine, as soon as that category and the ones before it are done.
+    """
+    from async_engine import AsyncFetcher
+
+    async with AsyncFetcher(max_concurrency=ASYNC_MAX_CONCURRENCY, per_host_limit=ASYNC_PER_HOST_LIMIT,
+                            max_retries=MAX_RETRIES, limiter=rate_limiter,
+                            backoff_base=RETRY_BACKOFF, backoff_cap=RETRY_MAX_DELAY, metrics=metrics,
+                            parse_executor=parse_pool.executor if parse_pool else None,
+                            cache=http_cache) as fetcher:
+        jobs = []
+        for main_category, subcategories in category_structure.items():
+            for subcategory_name, details in subcategories.items():
+                for subcategory_path, filters in category_targets(subcategory_name, details):
+                    # A task keeps the metric labels it was created under, as do the tasks it gathers
+                    with metrics.labels(category=category_label(main_category, subcategory_path)):
+                        jobs.append(asyncio.ensure_future(fetch_filtered_listing_async(
+                            fetcher, filters["url"], filters, main_category, subcategory_path)))
+        for job in jobs:
+            emit(await job)
+        print(f"Async engine made {fetcher.requests} requests.")
+
+
 def generate_urls(base_url, filters):
     """
     Generate a list of URLs by combining base URL with attribute filters.
@@ -268,28 +901,123 @@ def consolidate_products(products):
     return list(consolidated.values())
 
 
-def main():
-    all_products = []
+def write_products(writer, products, written_features, late_features):
+    """
+    Consolidate the products of one category and stream new SKUs to the CSV.
+
+    `written_features` maps every SKU written so far to its features. When a later category
+    adds features to an SKU that is already written, the merged value goes to `late_features`
+    ({sku: {"attribute:Feature": ...}}) so the row can be patched once the crawl is done,
+    which keeps the file identical to consolidating everything in memory.
+    Every written SKU is journaled with the file offset after its row.
+    """
+    with metrics.stage("consolidate"):
+        products = consolidate_products(products)
+    for product in products:
+        sku = product["sku"]
+        if sku not in written_features:
+            written_features[sku] = product["attribute:Feature"]
+            with metrics.stage("write"):
+                writer.write(product)
+            journal.record("sku", sku, {"feature": written_features[sku], "offset": writer.tell()})
+            continue
+
+        # Same merge rule as consolidate_products
+        existing_feature = written_features[sku]
+        new_feature = product["attribute:Feature"]
+        if new_feature and new_feature not in existing_feature:
+            written_features[sku] = f"{existing_feature},{new_feature}".strip(",")
+            late_features[sku] = {"attribute:Feature": written_features[sku]}
+            offset = journal.get("sku", sku)["offset"]
+            journal.record("sku", sku, {"feature": written_features[sku], "offset": offset, "late": True})
 
-    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
-        futures = []
+
+def crawl_threads(emit):
+    """
+    Scrape every category in category_structure on NUM_THREADS threads sharing one work queue.
+    Every listing page and detail page is its own unit, so a large subcategory spreads over
+    all threads. Earlier subcategories have priority, and `emit` receives each
+    subcategory's products in order as they complete.
+    """
+    with WorkQueue(NUM_THREADS) as queue:
+        groups = []
         for main_category, subcategories in category_structure.items():
             for subcategory_name, details in subcategories.items():
-                futures.append(executor.submit(scrape_category, main_category, subcategory_name, details))
+                group = queue.group(priority=len(groups))
+                group.submit(schedule_category, group, main_category, subcategory_name, details)
+                groups.append(group)
 
-        for future in futures:
-            all_products.extend(future.result())
+        for group in groups:
+            emit(queue.result(group))
+    print(queue.report())
 
-    # Deduplicate and consolidate products
-    all_products = consolidate_products(all_products)
 
-    # Save all products to a CSV file
-    df = pd.DataFrame(all_products)
-    if not os.path.exists(OUTPUT_FILE):
-        df.to_csv(OUTPUT_FILE, index=False, encoding="utf-8-sig")
-    else:
-        df.to_csv(OUTPUT_FILE, mode="a", header=False, index=False, encoding="utf-8-sig")
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Fylliana products into a WooCommerce CSV.")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads",
+                        help="threads: listing and detail pages on a shared work queue; async: asyncio/aiohttp pipeline")
+    parser.add_argument("--parse-workers", type=int, default=PARSE_WORKERS,
+                        help="processes that parse pages (0 parses in the fetch threads)")
+    parser.add_argument("--resume", action="store_true",
+                        help=f"continue an interrupted run from {JOURNAL_FILE}")
+    parser.add_argument("--skip-unchanged-details", action="store_true", default=SKIP_UNCHANGED_DETAILS,
+                        help="reuse the last run's description and images of products whose listing card is unchanged")
+    parser.add_argument("--metrics-port", type=int, default=METRICS_PORT,
+                        help="serve Prometheus counters on this port while crawling (0: off)")
+    args = parser.parse_args()
+    if args.metrics_port:
+        metrics.serve_prometheus(args.metrics_port)
+
+    global parse_pool, journal, card_store
+    card_store = CardStore(CARD_STORE_FILE, reuse=args.skip_unchanged_details)
+    if args.parse_workers:
+        parse_pool = ParsePool(args.parse_workers)
+
+    journal = CrawlJournal(JOURNAL_FILE, resume=args.resume)
+    if args.resume:
+        # Drop a row the interrupted run only wrote partly
+        journal.truncate_output(OUTPUT_FILE)
+
+    # Products are written category by category; only a resumed run appends to the file
+    written = journal.entries("sku")
+    written_features = {sku: data["feature"] for sku, data in written.items()}
+    late_features = {sku: {"attribute:Feature": data["feature"]} for sku, data in written.items() if data.get("late")}
+    if written:
+        print(f"Resuming: {len(written)} products already written to {OUTPUT_FILE}.")
+    with StreamingCsvWriter(OUTPUT_FILE, HEADERS, append=args.resume) as writer:
+        journal.record("output", OUTPUT_FILE, {"offset": writer.tell()})
+
+        def emit(products):
+            write_products(writer, products, written_features, late_features)
+
+        if args.engine == "async":
+            asyncio.run(crawl_async(emit))
+        else:
+            crawl_threads(emit)
+
+    if parse_pool:
+        parse_pool.shutdown()
+
+    # Products found in several subcategories get the features of the later ones too
+    if late_features:
+        print(f"Merging features of {len(late_features)} products listed in more than one subcategory.")
+        with metrics.stage("consolidate"):
+            update_rows(OUTPUT_FILE, "sku", late_features)
+        # The patched rows are longer, so a later --resume must not cut the file short
+        journal.record("output", OUTPUT_FILE, {"offset": os.path.getsize(OUTPUT_FILE)})
+    journal.close()
+
+    product_state = ProductState(STATE_FILE)
+    export_delta(product_state, OUTPUT_FILE, "sku")
+    product_state.close()
+    card_store.close()
 
+    print(detail_cache.report())
+    print(card_store.report())
+    print(fetcher.report())
+    print(http_cache.report())
+    print(metrics.write_report(METRICS_FILE))
+    metrics.close()
     print(f"Scraping completed. Data saved to {OUTPUT_FILE}")
 
 
@@ -1,17 +1,48 @@
+import argparse
+import contextvars
 import requests
-import time
-from bs4 import BeautifulSoup
-import pandas as pd
-import csv  # For CSV quoting
-from concurrent.futures import ThreadPoolExecutor
-from categories_attributes_stromata import stromata_structure, stroma_feature, stroma_material, stroma_dimensions
+import os
+import re
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from card_store import CardStore
+from category_registry import CategoryRegistry, has_products
+from detail_cache import DetailCache
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.csv_writer import StreamingCsvWriter, WOOCOMMERCE_QUOTING, update_rows
+from common.fetch import Fetcher
+from common.http_cache import HttpCache
+from common.metrics import Metrics
+from common.parse_pool import ParsePool
+from common.product_state import ProductState, export_delta
+from common.rate_limit import RateLimiter
+from common.parsing import make_soup
+from common.work_queue import WorkQueue
 
 # Define constants
 BASE_URL = "https://www.fylliana.gr"
 OUTPUT_FILE = "fylliana_STROMATA.csv"
+CATEGORIES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fylliana_stromata_categories.json")
+CACHE_FILE = "fylliana_http_cache.sqlite"
+STATE_FILE = "fylliana_product_state.sqlite"  # Products of the last run, for the delta export
+CARD_STORE_FILE = "fylliana_cards.sqlite"
+SKIP_UNCHANGED_DETAILS = False  # Reuse the stored details of products whose listing card is unchanged
 NUM_THREADS = 4
-MAX_RETRIES = 5
-RETRY_DELAY = 10  # seconds
+PAGE_WORKERS = 8  # Threads parsing the listing and detail pages as they come in
+USE_HTTP2 = False  # Multiplex requests over HTTP/2 (needs httpx[http2])
+PARSE_WORKERS = 0  # Parser processes; 0 parses in the fetch threads
+MAX_RETRIES = 5  # Retries of throttled (429/503) and failed requests, with backoff and jitter
+RETRY_BACKOFF = 1  # seconds, the longest first wait; doubled every retry
+RETRY_MAX_DELAY = 60  # seconds
+START_RATE = 10  # Requests per second, adapted to how the shop responds
+MAX_RATE = 50
+METRICS_FILE = "fylliana_stromata_metrics.json"  # Run report with stage timings per category (and a .txt)
+METRICS_PORT = 0  # Serve Prometheus counters at http://127.0.0.1:<port>/metrics while crawling (0: off)
+
+# Parts of each page the extractors read; nothing else is built when parsing
+LISTING_PARSE_RULES = [("div", {"class": "prdv"}), ("a", {"class": "next"}), ("div", {"id": "pagination"})]
+DETAIL_PARSE_RULES = [("p", {"class": "sdesc"}), ("div", {"id": "primgms"})]
 
 # WooCommerce CSV headers
 HEADERS = [
@@ -29,34 +60,100 @@ HEADERS = [
     "attribute:Χαρακτηριστικά",
 ]
 
+# Columns whose values are merged across every listing of an SKU
+MERGED_ATTRIBUTES = ["attribute:Χαρακτηριστικά"]
 
-def fetch_page(url):
+
+# Categories and filters found by scrape_stromata_attributes.py, read the first time they are used
+category_registry = CategoryRegistry(CATEGORIES_FILE)
+stromata_structure = category_registry.structure()
+stroma_material = category_registry.names("valid_materials")
+stroma_feature = category_registry.names("valid_features")
+stroma_dimensions = category_registry.names("valid_dimensions")
+
+# Pages are revalidated with ETag/Last-Modified instead of downloaded again every run
+http_cache = HttpCache(CACHE_FILE)
+
+# Polite per-host pacing, ramped up while the shop keeps up and halved when it throttles
+rate_limiter = RateLimiter(rate=START_RATE, max_rate=MAX_RATE, concurrency=NUM_THREADS,
+                           max_concurrency=NUM_THREADS + PAGE_WORKERS)
+
+# Stage timings and request counters of this run
+metrics = Metrics(shop="fylliana-stromata")
+
+# Keep-alive connections shared by every thread
+fetcher = Fetcher(workers=NUM_THREADS + PAGE_WORKERS, cache=http_cache, http2=USE_HTTP2, limiter=rate_limiter,
+                  max_retries=MAX_RETRIES, backoff_base=RETRY_BACKOFF, backoff_cap=RETRY_MAX_DELAY, metrics=metrics)
+
+
+def page_text(response_future, url):
+    """
+    Return the content of a page requested with fetcher.submit (which retries throttled and
+    failed requests), or None if it could not be fetched.
     """
-    Fetch a page's content using requests with retries.
+    try:
+        response = response_future.result()
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        print(f"Failed to fetch URL {url}: {e}")
+        return None
+
+
+def fetch_page_then(url, func, *args):
     """
-    for attempt in range(MAX_RETRIES):
+    Request a page and return a Future of `func(content, *args)` (content None if the page
+    could not be fetched). `func` runs on the page pool once the page is in, so no thread
+    waits for the download or sleeps through the backoff of its retries.
+    """
+    result = Future()
+    context = contextvars.copy_context()
+
+    def downloaded(response_future):
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
-        except requests.RequestException as e:
-            print(f"Error fetching URL {url}: {e}. Retrying ({attempt + 1}/{MAX_RETRIES})...")
-            if attempt + 1 < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
-    print(f"Failed to fetch URL after {MAX_RETRIES} attempts: {url}")
-    return None
+            result.set_result(func(page_text(response_future, url), *args))
+        except Exception as e:
+            result.set_exception(e)
+
+    fetcher.submit(url, timeout=30).add_done_callback(
+        lambda response_future: page_executor.submit(context.run, downloaded, response_future))
+    return result
+
+
+# Process pool for parsing, set up in main() when PARSE_WORKERS > 0
+parse_pool = None
+
+
+def parse_page(func, content):
+    """
+    Run a page parser in the parse process pool when there is one, otherwise in this thread.
+    """
+    with metrics.stage("parse"):
+        if parse_pool is None:
+            return func(content)
+        return parse_pool.parse(func, content)
 
 
 def scrape_description_and_images(product_url):
     """
     Scrape the description and all images of a product from its detail page.
+    Returns a Future of them.
     """
     print(f"Fetching description and images from: {product_url}")
-    html = fetch_page(product_url)
+    return fetch_page_then(product_url, parse_detail_page)
+
+
+def parse_detail_page(html):
     if not html:
         return "No description available.", ""
+    return parse_page(parse_description_and_images, html)
+
 
-    soup = BeautifulSoup(html, "html.parser")
+def parse_description_and_images(html):
+    """
+    Extract the description and comma-separated image URLs from a detail page.
+    """
+    soup = make_soup(html, *DETAIL_PARSE_RULES)
 
     # Extract description
     description_element = soup.find("p", class_="sdesc")
@@ -77,51 +174,178 @@ def scrape_description_and_images(product_url):
     return description, images_csv_format
 
 
-def fetch_product_data(url, category_path, material=None, feature=None, dimension=None, products_dict=None):
+# Detail pages shared by every thread, so each product is fetched once per run
+detail_cache = DetailCache()
+
+# Listing cards of earlier runs with their details, set up in main()
+card_store = None
+
+# Pool of PAGE_WORKERS threads, set up in main()
+page_executor = None
+
+
+def product_details(card):
     """
-    Fetch product data from a given URL, handle pagination, and consolidate attributes.
+    Return a Future of (description, images) of a listing card, skipping the detail page if
+    the card is unchanged.
     """
-    if products_dict is None:
-        products_dict = {}
-    page_number = 1
+    details = card_store.lookup(card) if card_store else None
+    if details is not None:
+        future = Future()
+        future.set_result(details)
+        return future
+
+    future = detail_cache.submit(card["url"], scrape_description_and_images)
+    if card_store:
+        def remember(done):
+            if done.exception() is None:
+                card_store.remember(card, done.result())
+        future.add_done_callback(remember)
+    return future
+
+
+def parse_listing_page(html):
+    """
+    Parse one listing page into product cards (title, price, sku, url).
+    Returns (cards, has_next_page, page_count); page_count is the highest page number
+    div#pagination links to (0 if there is no pagination).
+    """
+    soup = make_soup(html, *LISTING_PARSE_RULES)
 
-    while True:
-        paginated_url = url.replace("{page_number}", str(page_number))
-        print(f"Fetching products from: {paginated_url}")
-        html = fetch_page(paginated_url)
-        if not html:
-            break
+    cards = []
+    for product in soup.select("div.prdv"):
+        try:
+            cards.append({
+                "title": product.find("h2").text.strip(),
+                "price": product.find("p", class_="prc").text.strip(),
+                "sku": product.find("h4").text.strip(),
+                "url": BASE_URL + product.find("a", href=True)["href"],
+            })
+        except Exception as e:
+            print(f"Error processing product: {e}")
+
+    # The highest page number linked, from the link texts and their ?p= parameters
+    page_numbers = []
+    pagination_div = soup.find("div", id="pagination")
+    for link in pagination_div.find_all("a") if pagination_div else []:
+        text = link.get_text(strip=True)
+        if text.isdigit():
+            page_numbers.append(int(text))
+        match = re.search(r"[?&]p=(\d+)", link.get("href", ""))
+        if match:
+            page_numbers.append(int(match.group(1)))
+
+    return cards, bool(soup.find("a", class_="next")), max(page_numbers, default=0)
+
+
+def schedule_listing_page(group, url, page_number, done):
+    """
+    Request one page of a listing URL; once it is parsed, `done(cards, has_next_page, page_count)`
+    runs as a unit of `group`.
+    """
+    paginated_url = url.replace("{page_number}", str(page_number))
+    print(f"Fetching products from: {paginated_url}")
+    metrics.count("pages")
+    group.after(fetch_page_then(paginated_url, parse_listing_html), listing_page_done, done)
+
+
+def parse_listing_html(html):
+    if not html:
+        return [], False, 0
+    return parse_page(parse_listing_page, html)
 
-        soup = BeautifulSoup(html, "html.parser")
-        product_list = soup.select("div.prdv")
 
+def listing_page_done(page, done):
+    done(*page.result())
+
+
+def join_listing_pages(pages):
+    """
+    Join the cards of a listing's pages in page order, up to the first missing or empty page.
+    """
+    cards = []
+    for page_number, product_list in enumerate(pages, 1):
         if not product_list:
             print(f"No products found on page {page_number}.")
             break
+        cards.extend(product_list)
+    return cards
+
+
+def schedule_listing(group, url, done):
+    """
+    Fetch every page of a listing URL as units of `group` and pass its product cards in page
+    order to `done(cards)`. The pagination on page 1 tells how many pages there are, so all
+    other pages are requested at once; without page links the next links are followed.
+    """
+    metrics.count("listings")
+
+    def first_page_done(cards, has_next_page, page_count):
+        if cards and page_count > 1:
+            deliver = group.gather(page_count - 1, lambda pages: done(join_listing_pages([cards] + pages)))
+            for page_number in range(2, page_count + 1):
+                schedule_listing_page(group, url, page_number,
+                                      lambda page_cards, *_, index=page_number - 2: deliver(index, page_cards))
+        else:
+            follow([cards], has_next_page)
+
+    def follow(pages, has_next_page):
+        if pages[-1] and has_next_page:
+            schedule_listing_page(group, url, len(pages) + 1,
+                                  lambda cards, has_next_page, _: follow(pages + [cards], has_next_page))
+        else:
+            done(join_listing_pages(pages))
+
+    schedule_listing_page(group, url, 1, first_page_done)
+
+
+def schedule_details(group, cards, then):
+    """
+    Read the details of every card (see product_details) and queue `then(details)` in card
+    order; a card whose details failed gets None.
+    """
+    deliver = group.gather(len(cards), then)
+    for index, card in enumerate(cards):
+        group.after(product_details(card), card_details_done, index, deliver)
+
+
+def card_details_done(details, index, deliver):
+    try:
+        deliver(index, details.result())
+    except Exception as e:
+        print(f"Error processing product: {e}")
+        deliver(index, None)
+
 
-        for product in product_list:
+def schedule_product_data(group, url, category_path, done, material=None, feature=None, dimension=None):
+    """
+    Fetch the products of one filter URL as units of `group`, handling pagination, and pass
+    their rows in listing order to `done(rows)`. Detail pages are all requested at once.
+    """
+    def listing_done(product_list):
+        if product_list:
+            metrics.count("cards", len(product_list))
+        schedule_details(group, product_list, lambda details: details_done(product_list, details))
+
+    def details_done(product_list, details):
+        rows = []
+        for product, detail in zip(product_list, details):
+            if detail is None:
+                continue
             try:
-                title = product.find("h2").text.strip()
-                price = product.find("p", class_="prc").text.strip()
-                sku = product.find("h4").text.strip()
-                product_url = BASE_URL + product.find("a", href=True)["href"]
-
-                # Scrape description and images
-                description, images_csv_format = scrape_description_and_images(product_url)
-
-                # Map attributes
-                material_name = stroma_material.get(material, material or "")
-                feature_name = stroma_feature.get(feature, feature or "")
-                dimension_name = stroma_dimensions.get(dimension, dimension or "")
-
-                # Consolidate attributes for duplicate SKUs
-                if sku in products_dict:
-                    existing_product = products_dict[sku]
-                    if feature_name and feature_name not in existing_product["attribute:Χαρακτηριστικά"]:
-                        existing_product["attribute:Χαρακτηριστικά"] += f",{feature_name}"
-                else:
-                    # Create a new product entry
-                    products_dict[sku] = {
+                title = product["title"]
+                price = product["price"]
+                sku = product["sku"]
+                description, images_csv_format = detail
+
+                with metrics.stage("extract"):
+                    # Map attributes
+                    material_name = stroma_material.get(material, material or "")
+                    feature_name = stroma_feature.get(feature, feature or "")
+                    dimension_name = stroma_dimensions.get(dimension, dimension or "")
+
+                    # The first listing of an SKU creates its entry, later ones only add features
+                    rows.append({
                         "sku": sku,
                         "post_title": title,
                         "post_excerpt": description[:100],
@@ -134,30 +358,59 @@ def fetch_product_data(url, category_path, material=None, feature=None, dimensio
                         "attribute:Υλικό": material_name,
                         "attribute:Διαστάσεις": dimension_name,
                         "attribute:Χαρακτηριστικά": feature_name,
-                    }
-
+                    })
             except Exception as e:
                 print(f"Error processing product: {e}")
+        done(rows)
 
-        # Check for pagination
-        if not soup.find("a", class_="next"):
-            break
-
-        page_number += 1
+    schedule_listing(group, url, listing_done)
 
-    return products_dict
 
-
-def scrape_category(main_category, subcategory_name, details, products_dict):
+def schedule_category(group, category_path, subcategory_name, details):
     """
-    Wrapper function to scrape a category.
+    Queue the first units of a category and finish `group` with the rows of all its filter
+    combinations, in combination order.
     """
-    base_url = details["url"]
-    category_path = f"{main_category} > {subcategory_name}"
-    urls = generate_urls(base_url, details, prioritize_dimensions=(subcategory_name == "Στρώματα"))
-
+    combinations = []
+    urls = generate_urls(details["url"], details, prioritize_dimensions=(subcategory_name == "Στρώματα"))
     for url, material, feature, dimension in urls:
-        fetch_product_data(url, category_path, material, feature, dimension, products_dict)
+        # A combination with a value discovery counted no products for lists nothing
+        if not has_products(details, material, feature, dimension):
+            continue
+        combinations.append((url, material, feature, dimension))
+    skipped = len(urls) - len(combinations)
+    if skipped:
+        metrics.count("skipped_listings", skipped)
+        print(f"Skipped {skipped} of {len(urls)} filter combinations without products for {category_path}.")
+
+    deliver = group.gather(len(combinations),
+                           lambda results: group.finish([row for rows in results for row in rows]))
+    for index, (url, material, feature, dimension) in enumerate(combinations):
+        schedule_product_data(group, url, category_path, lambda rows, index=index: deliver(index, rows),
+                              material, feature, dimension)
+
+
+def crawl(emit):
+    """
+    Scrape every category in stromata_structure on NUM_THREADS threads sharing one work queue.
+    Every listing page is its own unit, continued once the page is in, so no thread waits
+    for a download or its retry backoff. Earlier categories have priority, and `emit`
+    receives each category's rows in order as they complete.
+    """
+    with WorkQueue(NUM_THREADS) as queue:
+        groups = []
+        for main_category, subcategories in stromata_structure.items():
+            for subcategory_name, details in subcategories.items():
+                category_path = f"{main_category} > {subcategory_name}"
+                group = queue.group(priority=len(groups))
+                # Units keep the metric labels they were queued under, as do the units they queue
+                with metrics.labels(category=category_path):
+                    group.submit(schedule_category, group, category_path, subcategory_name, details)
+                groups.append((category_path, group))
+
+        for category_path, group in groups:
+            emit(category_path, queue.result(group))
+    print(queue.report())
 
 
 def generate_urls(base_url, filters, prioritize_dimensions=False):
@@ -199,28 +452,87 @@ def generate_urls(base_url, filters, prioritize_dimensions=False):
     return urls
 
 
-def write_csv(products_dict, filename):
+def write_products(writer, rows, written_values, late_values):
     """
-    Write consolidated products to a CSV file using pandas.
+    Consolidate the rows of one category and stream new SKUs to the CSV.
+
+    The first row of an SKU is kept, and the values of MERGED_ATTRIBUTES of all its rows are
+    joined. `written_values` maps every SKU written so far to those values ({column: ordered
+    set}). When a later category adds values to an SKU that is already written, the merged
+    columns go to `late_values` ({sku: {column: ...}}) so the row can be patched once the
+    crawl is done, which keeps the file identical to consolidating everything in memory.
     """
-    data = list(products_dict.values())
-    df = pd.DataFrame(data)
-    df.to_csv(filename, index=False, encoding="utf-8-sig", quoting=csv.QUOTE_ALL)
+    consolidated = {}
+    with metrics.stage("consolidate"):
+        for row in rows:
+            first_row, values = consolidated.setdefault(row["sku"], (row, {column: {} for column in MERGED_ATTRIBUTES}))
+            for column in MERGED_ATTRIBUTES:
+                if row[column]:
+                    values[column][row[column]] = None  # dict keys as an ordered set
+
+    for sku, (row, values) in consolidated.items():
+        if sku not in written_values:
+            written_values[sku] = values
+            with metrics.stage("write"):
+                writer.write(dict(row, **{column: ",".join(values[column]) for column in MERGED_ATTRIBUTES}))
+            metrics.count("products")
+            continue
+
+        known = written_values[sku]
+        added = False
+        for column in MERGED_ATTRIBUTES:
+            for value in values[column]:
+                if value not in known[column]:
+                    known[column][value] = None
+                    added = True
+        if added:
+            late_values[sku] = {column: ",".join(known[column]) for column in MERGED_ATTRIBUTES}
 
 
 def main():
-    products_dict = {}
-
-    with ThreadPoolExecutor(max_workers=NUM_THREADS) as executor:
-        futures = []
-        for main_category, subcategories in stromata_structure.items():
-            for subcategory_name, details in subcategories.items():
-                futures.append(executor.submit(scrape_category, main_category, subcategory_name, details, products_dict))
-
-        for future in futures:
-            future.result()
-
-    write_csv(products_dict, OUTPUT_FILE)
+    parser = argparse.ArgumentParser(description="Scrape Fylliana mattresses into a WooCommerce CSV.")
+    parser.add_argument("--skip-unchanged-details", action="store_true", default=SKIP_UNCHANGED_DETAILS,
+                        help="reuse the last run's description and images of products whose listing card is unchanged")
+    args = parser.parse_args()
+
+    global parse_pool, card_store, page_executor
+    card_store = CardStore(CARD_STORE_FILE, reuse=args.skip_unchanged_details)
+    if METRICS_PORT:
+        metrics.serve_prometheus(METRICS_PORT)
+    if PARSE_WORKERS:
+        parse_pool = ParsePool(PARSE_WORKERS)
+
+    # Rows are written as each category completes, so a crash keeps the categories done so far
+    written_values = {}
+    late_values = {}
+    page_executor = ThreadPoolExecutor(max_workers=PAGE_WORKERS)
+    with page_executor, StreamingCsvWriter(OUTPUT_FILE, HEADERS, quoting=WOOCOMMERCE_QUOTING) as writer:
+        def emit(category_path, rows):
+            with metrics.labels(category=category_path):
+                write_products(writer, rows, written_values, late_values)
+
+        crawl(emit)
+
+    if parse_pool:
+        parse_pool.shutdown()
+
+    # Products found in several categories get the features of the later ones too
+    if late_values:
+        print(f"Merging features of {len(late_values)} products listed in more than one category.")
+        with metrics.stage("consolidate"):
+            update_rows(OUTPUT_FILE, "sku", late_values, quoting=WOOCOMMERCE_QUOTING)
+
+    product_state = ProductState(STATE_FILE)
+    export_delta(product_state, OUTPUT_FILE, "sku", quoting=WOOCOMMERCE_QUOTING)
+    product_state.close()
+    card_store.close()
+
+    print(detail_cache.report())
+    print(card_store.report())
+    print(fetcher.report())
+    print(http_cache.report())
+    print(metrics.write_report(METRICS_FILE))
+    metrics.close()
     print(f"Scraping completed. Data saved to {OUTPUT_FILE}")
 
 
@@ -0,0 +1,61 @@
+import itertools
+import threading
+
+# Independent locks; threads only wait for each other when their SKUs hash to the same shard
+NUM_SHARDS = 64
+
+
+class SkuMerger:
+    """
+    Thread-safe consolidation of products that appear under several filter URLs.
+
+    The first listing of an SKU creates its row; every listing adds its attribute values
+    to ordered sets kept per SKU. SKUs are spread over `shards` dicts, each with its own
+    lock, so threads working on different SKUs never block each other. Attribute sets are
+    joined into comma-separated strings only when the rows are read out.
+    """
+
+    def __init__(self, attributes, shards=NUM_SHARDS):
+        self.attributes = list(attributes)
+        self._shards = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._order = itertools.count()
+
+    def merge(self, sku, row, values):
+        """
+        Add one listing of an SKU. `row` is kept only if the SKU was not seen before;
+        `values` maps attribute columns to the value this listing contributes.
+        Returns True if the SKU was new.
+        """
+        index = hash(sku) % len(self._shards)
+        with self._locks[index]:
+            shard = self._shards[index]
+            entry = shard.get(sku)
+            created = entry is None
+            if created:
+                entry = shard[sku] = (next(self._order), row, {column: {} for column in self.attributes})
+            for column, value in values.items():
+                if value:
+                    entry[2][column][value] = None  # dict keys as an ordered set
+        return created
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def rows(self):
+        """
+        Return the consolidated rows in the order their SKUs were first seen.
+        """
+        entries = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                entries.extend(shard.values())
+        entries.sort(key=lambda entry: entry[0])
+
+        rows = []
+        for _, row, attribute_sets in entries:
+            row = dict(row)
+            for column, values in attribute_sets.items():
+                row[column] = ",".join(values)
+            rows.append(row)
+        return rows
@@ -1,23 +1,61 @@
 from selenium import webdriver
-from bs4 import BeautifulSoup
-import pandas as pd
-import re
-import time
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.ui import WebDriverWait
+import argparse
+import os
+import queue
+import requests
+import sys
+import threading
 
-# Set up Selenium WebDriver (e.g., Chrome)
-driver = webdriver.Chrome()  # or webdriver.Firefox() if using Firefox
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.csv_writer import StreamingCsvWriter
+from common.fetch import Fetcher
+from common.handles import sanitize_handle
+from common.http_cache import HttpCache
+from common.journal import CrawlJournal
+from common.metrics import Metrics
+from common.pagination import PAGINATION_RULE, paginate
+from common.parsing import make_soup
+from common.product_state import ProductState, export_delta
 
 # Define the base URL of the e-commerce page
-base_url = "https://lambrostoys.gr/product-category/girl/page/"
+BASE_URL = "https://lambrostoys.gr/product-category/girl/page/"
 
-print("Start of the web scraping of Lambros Toys")
+# How pages are loaded: "auto" tries a plain HTTP GET first and only renders the page in
+# a browser when the product grid is missing; "static" and "browser" use one path only
+FETCH_MODE = "auto"
 
+# Headless browsers (and HTTP connections) loading pages in parallel
+POOL_SIZE = 4
+# Seconds to wait for the product grid to be rendered
+PAGE_TIMEOUT = 15
+PRODUCT_SELECTOR = "ul.products li.product-col"
 
-# Function to sanitize the handle by replacing special characters with "-"
-def sanitize_handle(title):
-    handle = title.lower().replace(" ", "-")
-    handle = re.sub(r'[^a-zα-ωάέήίόύώ0-9-]', '-', handle, flags=re.UNICODE)
-    return handle
+# Rows are written as soon as each page is scraped, so a crash keeps the pages done so far
+OUTPUT_FILENAME = "lambros_toys_girls.csv"
+# Finished pages and the CSV size after each of them, so --resume continues the same file
+JOURNAL_FILE = "lambros_toys_girls.journal.jsonl"
+# Products of the last finished run, to export only what changed since
+STATE_FILE = "lambros_product_state.sqlite"
+# Run report: time spent fetching, rendering, parsing, extracting and writing (plus a .txt)
+METRICS_FILE = "lambros_toys_girls_metrics.json"
+
+# Columns of the output CSV, in order
+CSV_HEADERS = ["Handle", "Title", "Body (HTML)", "Vendor", "Variant Price", "Image Src", "Tags", "SKU", "Type"]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+# Pages kept between runs. Server HTML is revalidated; rendered pages carry no validators,
+# so only the TTL applies to them
+http_cache = HttpCache("lambros_http_cache.sqlite")
+
+# Stage timings and request counters of this run
+metrics = Metrics(shop="lambros-toys")
 
 
 # Function to scrape product information from a single product container
@@ -75,40 +113,190 @@ def extract_product_info(product):
     return product_data
 
 
-# List to hold all product data
-all_products = []
-
-# Iterate through pages using Selenium
-for page_number in range(1, 305):  # Adjust page range as needed
-    url = f"{base_url}{page_number}"
-    print(f"Scraping page {page_number}: {url}")
+def create_driver():
+    """
+    Start a headless Chrome (or swap in webdriver.Firefox() if using Firefox).
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(options=options)
 
-    # Use Selenium to load the page
-    driver.get(url)
-    time.sleep(2)  # Give time for JavaScript to load content
 
-    # Parse the loaded page with BeautifulSoup
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def parse_products(page_source):
+    """
+    Return (product containers, soup) of a listing page; the list is empty if the grid is not in the HTML.
+    """
+    soup = make_soup(page_source, ("ul", {"class": "products"}), PAGINATION_RULE)
     product_list = soup.find("ul", class_=lambda value: value and "products" in value)
+    if not product_list:
+        return [], soup
+    return product_list.find_all("li", class_="product-col"), soup
+
+
+class PageLoader:
+    """
+    Loads listing pages over plain HTTP when the server HTML already holds the product grid,
+    and renders them in a pool of headless browsers otherwise.
+
+    Browsers are shared through a queue; a free slot holds None until its browser is first
+    needed, so a run that never falls back never starts one. Counts which path served each page.
+    """
+
+    def __init__(self, pool_size, mode=FETCH_MODE):
+        self.mode = mode
+        self.fetcher = Fetcher(workers=pool_size, headers=HEADERS, cache=http_cache, metrics=metrics)
+        self.pages = {"static": 0, "browser": 0}
+        self._drivers = queue.Queue()
+        for _ in range(pool_size):
+            self._drivers.put(None)
+        self._lock = threading.Lock()
+
+    def load(self, url):
+        """
+        Return (product containers, soup) of a page and count the path used, or None past
+        the last page (404).
+        """
+        print(f"Scraping page: {url}")
+        if self.mode != "browser":
+            try:
+                response = self.fetcher.get(url)
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                with metrics.stage("parse"):
+                    products, soup = parse_products(response.text)
+            except requests.RequestException as e:
+                if self.mode == "static":
+                    raise
+                print(f"Error fetching URL {url}: {e}. Loading it in a browser instead.")
+                products = None
+            if products or self.mode == "static":
+                self._count("static")
+                return products, soup
+
+        with metrics.stage("render"):
+            page_source = self.render(url)
+        with metrics.stage("parse"):
+            products, soup = parse_products(page_source)
+        self._count("browser")
+        return products, soup
+
+    def render(self, url):
+        """
+        Return the rendered HTML of a page, unless a recent copy is cached.
+        """
+        # Fragments never reach the server, so this keeps rendered pages apart from server HTML
+        cache_key = f"{url}#rendered"
+        page_source = http_cache.get_fresh(cache_key)
+        if page_source is not None:
+            return page_source
+
+        driver = self._drivers.get()
+        try:
+            if driver is None:
+                driver = create_driver()
+            driver.get(url)
+            # Wait for JavaScript to render the products instead of sleeping a fixed time
+            try:
+                WebDriverWait(driver, PAGE_TIMEOUT).until(
+                    expected_conditions.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_SELECTOR)))
+            except TimeoutException:
+                print(f"No products appeared within {PAGE_TIMEOUT} seconds at {url}.")
+            page_source = driver.page_source
+        finally:
+            self._drivers.put(driver)
+
+        http_cache.store(cache_key, page_source)
+        return page_source
+
+    def report(self):
+        """
+        Summarize which path served the pages for the end of a run.
+        """
+        total = sum(self.pages.values())
+        shares = ", ".join(f"{count} {path} ({count / total * 100 if total else 0:.1f}%)"
+                           for path, count in self.pages.items())
+        return f"Pages loaded: {shares}"
+
+    def close(self):
+        # Close the Selenium drivers
+        while not self._drivers.empty():
+            driver = self._drivers.get()
+            if driver is not None:
+                driver.quit()
+        self.fetcher.close()
+
+    def _count(self, path):
+        metrics.count("pages", path=path)
+        with self._lock:
+            self.pages[path] += 1
+
+
+def extract_rows(url, products):
+    """
+    Return the product rows of one listing page.
+    """
+    if not products:
+        print(f"Product list not found at {url}. Check the HTML structure.")
+
+    rows = []
+    for product in products:
+        product_data = extract_product_info(product)
+        if product_data:
+            rows.append(product_data)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape the Lambros Toys girls category into a Shopify CSV.")
+    parser.add_argument("--resume", action="store_true", help="continue an interrupted run, skipping finished pages")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="headless browsers loading pages in parallel")
+    parser.add_argument("--fetch-mode", choices=["auto", "static", "browser"], default=FETCH_MODE,
+                        help="auto: plain HTTP first, browser only when the product grid is missing")
+    parser.add_argument("--base-url", default=BASE_URL, help="listing URL the page number is appended to")
+    parser.add_argument("--metrics-port", type=int, default=0,
+                        help="serve Prometheus counters on this port while crawling (0: off)")
+    args = parser.parse_args()
+    if args.metrics_port:
+        metrics.serve_prometheus(args.metrics_port)
+
+    print("Start of the web scraping of Lambros Toys")
 
-    if product_list:
-        product_containers = product_list.find_all("li", class_="product-col")
-        for product in product_containers:
-            product_data = extract_product_info(product)
-            if product_data:
-                all_products.append(product_data)
-    else:
-        print(f"Product list not found on page {page_number}. Check the HTML structure.")
+    journal = CrawlJournal(JOURNAL_FILE, resume=args.resume)
+    if args.resume:
+        journal.truncate_output(OUTPUT_FILENAME)  # Drop rows of a page that did not finish
+    writer = StreamingCsvWriter(OUTPUT_FILENAME, CSV_HEADERS, append=args.resume, encoding="utf-8")
+    journal.record("output", OUTPUT_FILENAME, {"offset": writer.tell()})
 
-# Convert the list of dictionaries to a DataFrame
-df = pd.DataFrame(all_products)
+    loader = PageLoader(args.pool_size, args.fetch_mode)
+    # The number of pages is read from the first page; the rest load in parallel and are
+    # written in page order, skipping pages a resumed run already finished
+    pages = paginate(loader.load, lambda page_number: f"{args.base_url}{page_number}",
+                     workers=args.pool_size, skip=lambda url: journal.done("listing", url))
+    try:
+        for url, products in pages:
+            with metrics.stage("extract"):
+                rows = extract_rows(url, products)
+            metrics.count("products", len(rows))
+            with metrics.stage("write"):
+                writer.write_rows(rows)
+            journal.record("listing", url, {"offset": writer.tell()})
+    finally:
+        writer.close()
+        journal.close()
+        loader.close()
 
-# Save to CSV
-output_filename = "lambros_toys_girls.csv"
-df.to_csv(output_filename, index=False)
+    print(f"Data from all products has been saved to {OUTPUT_FILENAME}")
+    product_state = ProductState(STATE_FILE)
+    export_delta(product_state, OUTPUT_FILENAME, "Handle", encoding="utf-8")
+    product_state.close()
+    print(loader.report())
+    print(loader.fetcher.report())
+    print(http_cache.report())
+    print(metrics.write_report(METRICS_FILE))
+    metrics.close()
+    print("Done")
 
-print(f"Data from all products has been saved to {output_filename}")
-print("Done")
 
-# Close the Selenium driver
-driver.quit()
+if __name__ == "__main__":
+    main()
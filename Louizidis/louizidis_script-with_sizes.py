@@ -1,8 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import os
-import re
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.csv_writer import StreamingCsvWriter
+from common.fetch import Fetcher
+from common.handles import sanitize_handle
+from common.http_cache import HttpCache
+from common.metrics import Metrics
+from common.pagination import PAGINATION_RULE, paginate
+from common.parsing import make_soup
+from common.product_state import ProductState, export_delta
 
 # Define the base URL of the e-commerce page
 base_url = "https://louizidis.gr/katigoria/paidika-2/page/"
@@ -14,11 +21,14 @@ headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
-# Function to sanitize the handle by replacing special characters with "-"
-def sanitize_handle(title):
-    handle = title.lower().replace(" ", "-")
-    handle = re.sub(r'[^a-zα-ωάέήίόύώ0-9-]', '-', handle, flags=re.UNICODE)
-    return handle
+# Pages fetched in parallel once the number of pages is known
+page_workers = 4
+
+# Keep-alive connection pool with an on-disk HTTP cache kept between runs
+http_cache = HttpCache("louizidis_http_cache.sqlite")
+# Stage timings and request counters of this run, saved to louizidis_koritsi_accessories_metrics.json (and a .txt) at the end
+metrics = Metrics(shop="louizidis")
+fetcher = Fetcher(workers=page_workers, headers=headers, cache=http_cache, metrics=metrics)
 
 # Function to scrape product information from a single product container
 def extract_product_info(product):
@@ -73,30 +83,20 @@ def extract_product_info(product):
     return product_variants
 
 
-# List to hold all product data
-all_products = []
-
-# Iterate through pages
-for page_number in range(1, 2):  # Change the range as needed for the total number of pages
-    # Construct the page-specific URL
-    url = f"{base_url}{page_number}{query_suffix}"
-    print(f"Scraping page {page_number}: {url}")
-
-    # Send a request to the page and parse it
-    response = requests.get(url, headers=headers)
+# Function to fetch and parse one listing page; returns None past the last page
+def load_page(url):
+    print(f"Scraping page: {url}")
+    response = fetcher.get(url)
+    if response.status_code == 404:
+        return None
     response.raise_for_status()
-    soup = BeautifulSoup(response.content, "html.parser")
+    metrics.count("pages")
+    with metrics.stage("parse"):
+        soup = make_soup(response.content, ("div", {"class": "product-grid-item"}), PAGINATION_RULE)
 
-    # Find all product containers
-    product_containers = soup.find_all("div", class_="product-grid-item")
+        # Find all product containers
+        return soup.find_all("div", class_="product-grid-item"), soup
 
-    # Loop through each product container and extract its information
-    for product in product_containers:
-        product_data_list = extract_product_info(product)
-        all_products.extend(product_data_list)  # Add all size variants for each product
-
-# Convert the list of dictionaries to a DataFrame
-df = pd.DataFrame(all_products)
 
 # Define column order for the output
 column_order = [
@@ -104,14 +104,32 @@ column_order = [
     "Variant Price", "Option1 Name", "Option1 Value"
 ]
 
-# Reorder the DataFrame columns
-df = df[column_order]
-
 # Define the CSV file name
 output_filename = "louizidis_koritsi_accessories.csv"
 
-# Write to the CSV file
-df.to_csv(output_filename, index=False, encoding='utf-8-sig')  # UTF-8-sig for Greek characters
+# Rows are written as soon as each page is scraped
+writer = StreamingCsvWriter(output_filename, column_order, encoding='utf-8-sig')  # UTF-8-sig for Greek characters
+
+# Iterate through pages; the number of pages is read from the first page's pagination
+for url, product_containers in paginate(load_page, lambda page_number: f"{base_url}{page_number}{query_suffix}", workers=page_workers):
+    # Loop through each product container and extract its information
+    for product in product_containers:
+        with metrics.stage("extract"):
+            product_data_list = extract_product_info(product)
+        metrics.count("products")
+        with metrics.stage("write"):
+            writer.write_rows(product_data_list)  # Add all size variants for each product
+
+writer.close()
 
 print(f"Data from all products has been saved to {output_filename}")
+
+# Products seen by earlier runs, to import only new and changed ones (all sizes of a handle together)
+product_state = ProductState("louizidis_product_state.sqlite")
+export_delta(product_state, output_filename, "Handle")
+product_state.close()
+
+print(fetcher.report())
+print(http_cache.report())
+print(metrics.write_report("louizidis_koritsi_accessories_metrics.json"))
 print("Done")
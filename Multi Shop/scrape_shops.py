@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.shop_engine import ShopEngine, load_config
+
+CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "shops.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape every shop/category target in a config file in one run.")
+    parser.add_argument("--config", default=CONFIG_FILE, help="shops config (JSON)")
+    parser.add_argument("--workers", type=int, help="page loads in flight across all targets (default: from config)")
+    parser.add_argument("--metrics-port", type=int, default=0,
+                        help="serve Prometheus counters on this port while crawling (0: off)")
+    parser.add_argument("targets", nargs="*", help="names of the targets to scrape (default: all)")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    unknown = set(args.targets) - {target["name"] for target in config["targets"]}
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    print("Start of the web scraping of every shop")
+    engine = ShopEngine(config, workers=args.workers)
+    if args.metrics_port:
+        engine.metrics.serve_prometheus(args.metrics_port)
+    try:
+        engine.run(args.targets)
+    finally:
+        engine.close()
+    print("Done")
+
+
+if __name__ == "__main__":
+    main()
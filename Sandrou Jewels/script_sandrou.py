@@ -1,8 +1,15 @@
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
 import os
-import re
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.csv_writer import StreamingCsvWriter
+from common.fetch import Fetcher
+from common.handles import sanitize_handle
+from common.http_cache import HttpCache
+from common.metrics import Metrics
+from common.pagination import PAGINATION_RULE, paginate
+from common.parsing import make_soup
+from common.product_state import ProductState, export_delta
 
 # Define the base URL of the e-commerce page
 
@@ -19,18 +26,16 @@ headers = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
-print("Start of the web scraping of Sandrou Jewels")
-
+# Pages fetched in parallel once the number of pages is known
+page_workers = 4
 
-import re
+# Keep-alive connection pool with an on-disk HTTP cache kept between runs
+http_cache = HttpCache("sandrou_http_cache.sqlite")
+# Stage timings and request counters of this run, saved to sandrou_metrics.json (and a .txt) at the end
+metrics = Metrics(shop="sandrou")
+fetcher = Fetcher(workers=page_workers, headers=headers, cache=http_cache, metrics=metrics)
 
-# Function to sanitize the handle by replacing special characters with "-"
-def sanitize_handle(title):
-    # Convert to lowercase and replace spaces with hyphens
-    handle = title.lower().replace(" ", "-")
-    # Replace any character that is not a Greek or Latin letter, number, or hyphen with "-"
-    handle = re.sub(r'[^a-zα-ωάέήίόύώ0-9-]', '-', handle, flags=re.UNICODE)
-    return handle
+print("Start of the web scraping of Sandrou Jewels")
 
 
 # Function to scrape product information from a single product container
@@ -87,53 +92,57 @@ def extract_product_info(product):
     return product_data
 
 
-# List to hold all product data
-all_products = []
+# Function to fetch and parse one listing page; returns None past the last page
+def load_page(url):
+    print(f"Scraping page: {url}")
+    response = fetcher.get(url)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    metrics.count("pages")
+    with metrics.stage("parse"):
+        soup = make_soup(response.content, ("div", {"class": "product-grid-item"}), PAGINATION_RULE)
 
-# Iterate through pages
-####---------------------------------------------------####
-#MODIFY THIS VVVV
+        # Find all product containers
+        return soup.find_all("div", class_="product-grid-item"), soup
 
 
-for page_number in range(1, 5):
+# Columns of the output CSV, in order
+csv_headers = ["Handle", "Title", "Body (HTML)", "Vendor", "Variant Price", "Image Src", "Tags", "SKU", "Type"]
 
 ####---------------------------------------------------####
+#MODIFY THIS VVVV
 
+# Define the CSV file name
+output_filename = "sandrou_jewel_roloi_vogue.csv"
 
-    # Construct the page-specific URL
-    url = f"{base_url}{page_number}"
-    print(f"Scraping page {page_number}: {url}")
-
-    # Send a request to the page and parse it
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.content, "html.parser")
+####---------------------------------------------------####
 
-    # Find all product containers
-    product_containers = soup.find_all("div", class_="product-grid-item")
+# Rows are written as soon as each page is scraped. The file holds this run's full catalogue;
+# what changed since the last run goes to a separate delta file at the end
+writer = StreamingCsvWriter(output_filename, csv_headers, encoding="utf-8")
 
+# Iterate through pages; the number of pages is read from the first page's pagination
+for url, product_containers in paginate(load_page, lambda page_number: f"{base_url}{page_number}", workers=page_workers):
     # Loop through each product container and extract its information
     for product in product_containers:
-        product_data = extract_product_info(product)
+        with metrics.stage("extract"):
+            product_data = extract_product_info(product)
         if product_data:  # Only add product data if it's not None
-            all_products.append(product_data)
-
-# Convert the list of dictionaries to a DataFrame
-df = pd.DataFrame(all_products)
+            metrics.count("products")
+            with metrics.stage("write"):
+                writer.write(product_data)
 
-####---------------------------------------------------####
-#MODIFY THIS VVVV
+writer.close()
 
-# Define the CSV file name
-output_filename = "sandrou_jewel_roloi_vogue.csv"
-
-####---------------------------------------------------####
+print(f"Data from all products has been saved to {output_filename}")
 
-# Append to the CSV if it exists; otherwise, create it
-if os.path.isfile(output_filename):
-    df.to_csv(output_filename, mode='a', header=False, index=False)
-else:
-    df.to_csv(output_filename, mode='w', header=True, index=False)
+# Products seen by earlier runs, to import only new and changed ones
+product_state = ProductState("sandrou_product_state.sqlite")
+export_delta(product_state, output_filename, "Handle", encoding="utf-8")
+product_state.close()
 
-print(f"Data from all products has been appended to {output_filename}")
+print(fetcher.report())
+print(http_cache.report())
+print(metrics.write_report("sandrou_metrics.json"))
 print("Done")
@@ -0,0 +1,145 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+from fixture_server import serve
+
+SHOPS = ["fyliana", "sandrou", "louizidis", "lampros"]
+
+# Fixture shop -> ShopEngine shop of shops.json (Lampros is measured through its engine adapter,
+# the same listing markup its Selenium script reads once the browser has rendered the page)
+ENGINE_SHOPS = {"sandrou": "sandrou", "louizidis": "louizidis_sizes", "lampros": "lambros"}
+
+# Filter values of the generated Fyliana categories
+FYLIANA_FILTERS = {
+    "valid_colors": ["Χρώμα[]=15", "Χρώμα[]=12"],
+    "valid_materials": ["Υλικό[]=1"],
+    "valid_features": ["Χαρακτηριστικά[]=70", "Χαρακτηριστικά[]=29"],
+}
+
+
+def run_fyliana(url, args):
+    """
+    Run Fyliana/script.py against the fixture server and return its Metrics.
+    """
+    sys.path.append(os.path.join(ROOT, "Fyliana"))
+    import script
+
+    script.BASE_URL = url
+    script.category_structure = {
+        "epipla": {f"bench-{number}": dict(FYLIANA_FILTERS, url=f"{url}/fyliana/epipla/bench-{number}")
+                   for number in range(1, args.categories + 1)}
+    }
+    # Measure the scraper, not the politeness towards the real shop
+    script.rate_limiter.rate = script.rate_limiter.max_rate = args.rate
+    script.fetcher.backoff_base = script.RETRY_BACKOFF = args.backoff
+    sys.argv = ["script.py", "--engine", args.engine]
+    script.main()
+    return script.metrics
+
+
+def run_engine(shop, url, args):
+    """
+    Run one ShopEngine target of `Multi Shop/shops.json` against the fixture server and return its Metrics.
+    """
+    from common.fetch import Fetcher
+    from common.shop_engine import ShopEngine, load_config
+
+    config = load_config(os.path.join(ROOT, "Multi Shop", "shops.json"))
+    target = next(target for target in config["targets"] if target["shop"] == ENGINE_SHOPS[shop])
+    target["url"] = f"{url}/{shop}/page/{{page}}"
+    config["targets"] = [target]
+    engine = ShopEngine(config)
+    # Retry the server's injected errors instead of failing the target
+    engine.fetcher.close()
+    engine.fetcher = Fetcher(workers=engine.workers, headers=config.get("headers"), cache=engine.http_cache,
+                             metrics=engine.metrics, max_retries=args.retries, backoff_base=args.backoff)
+    try:
+        engine.run()
+    finally:
+        engine.close()
+    return engine.metrics
+
+
+def child(shop, url, args):
+    """
+    Scrape one shop in this process (in a scratch directory) and print its numbers as JSON.
+    """
+    os.chdir(tempfile.mkdtemp(prefix=f"bench_{shop}_"))
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        metrics = run_fyliana(url, args) if shop == "fyliana" else run_engine(shop, url, args)
+    seconds = time.perf_counter() - start
+
+    totals = metrics.summary()["totals"]
+    retries = totals["counters"].get("retries", 0)
+    fetched = totals["stages"].get("fetch", {}).get("count", 0) - retries  # Pages, not attempts
+    parse = totals["stages"].get("parse", {"count": 0, "seconds": 0})
+    print(json.dumps({
+        "shop": shop,
+        "pages": fetched,
+        "products": totals["counters"].get("products", 0),
+        "seconds": round(seconds, 3),
+        "pages_per_second": round(fetched / seconds, 2) if seconds else 0.0,
+        "parse_ms_per_page": round(parse["seconds"] / parse["count"] * 1000, 3) if parse["count"] else 0.0,
+        "retries": retries,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape every shop end to end from the fixture server.")
+    parser.add_argument("--shops", nargs="*", choices=SHOPS, default=SHOPS)
+    parser.add_argument("--pages", type=int, default=30, help="listing pages per category")
+    parser.add_argument("--categories", type=int, default=2, help="Fyliana categories to crawl")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="Fyliana engine")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds every response waits (±50%%)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--rate", type=float, default=1000, help="Fyliana rate limiter ceiling, requests per second")
+    parser.add_argument("--retries", type=int, default=5, help="retries of failed pages in the shop engine")
+    parser.add_argument("--backoff", type=float, default=0.05, help="seconds, the longest first retry wait")
+    parser.add_argument("--json", help="also save the results to this file")
+    parser.add_argument("--child", choices=SHOPS, help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.url, args)
+        return
+
+    server, url = serve(pages=args.pages, latency=args.latency, error_rate=args.error_rate)
+    print(f"{args.pages} pages per category, {args.latency * 1000:g} ms latency, "
+          f"{args.error_rate:.0%} of requests fail with 503")
+    print("  shop        pages  products  seconds  pages/s  parse ms/page  retries  peak RSS MB")
+    results = []
+    for shop in args.shops:
+        # One process per shop, so peak memory is the shop's own
+        command = [sys.executable, os.path.abspath(__file__), "--child", shop, "--url", url] + sys.argv[1:]
+        output = subprocess.run(command, capture_output=True, text=True)
+        if output.returncode:
+            print(f"  {shop:<10}failed:\n{output.stderr}")
+            continue
+        result = json.loads(output.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(f"  {shop:<10}{result['pages']:>7}{result['products']:>10}{result['seconds']:>9.2f}"
+              f"{result['pages_per_second']:>9.1f}{result['parse_ms_per_page']:>15.2f}{result['retries']:>9}"
+              f"{result['peak_rss_mb']:>13.1f}")
+    server.shutdown()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"settings": {"pages": args.pages, "latency": args.latency, "error_rate": args.error_rate},
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
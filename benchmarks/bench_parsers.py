@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.parsing import make_soup
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# (fixture, rules the scraper parses with, selector whose matches must agree across variants)
+CASES = [
+    ("fyliana/listing.html", [("div", {"id": "ctg"}), ("div", {"id": "pagination"})], "div.prdv"),
+    ("fyliana/detail.html", [("p", {"class": "sdesc"}), ("div", {"id": "primgms"})], "p.sdesc, div#primgms a"),
+    ("sandrou/listing.html", [("div", {"class": "product-grid-item"})], "div.product-grid-item"),
+    ("louizidis/listing.html", [("div", {"class": "product-grid-item"})], "div.product-grid-item"),
+    ("lampros/listing.html", [("ul", {"class": "products"})], "ul.products li.product-col"),
+]
+
+PARSERS = ["html.parser", "lxml"]
+
+
+def time_parse(markup, parser, rules, repeat):
+    """
+    Return (seconds per parse, last soup) for one parser variant.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        soup = make_soup(markup, *rules, parser=parser)
+    elapsed = (time.perf_counter() - start) / repeat
+    return elapsed, soup
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on the saved shop pages.")
+    parser.add_argument("--repeat", type=int, default=50, help="parses per variant")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<26}{'variant':<24}{'ms/page':>10}{'speedup':>10}")
+    for fixture, rules, selector in CASES:
+        with open(os.path.join(FIXTURES_DIR, fixture), "rb") as f:
+            markup = f.read()
+
+        baseline = None
+        expected = None
+        for parser_name in PARSERS:
+            for strained in (False, True):
+                try:
+                    elapsed, soup = time_parse(markup, parser_name, rules if strained else [], args.repeat)
+                except Exception as e:  # e.g. lxml is not installed
+                    print(f"{fixture:<26}{parser_name:<24}skipped ({e})")
+                    break
+                extracted = [element.get_text(strip=True) + str(element.get("href")) for element in soup.select(selector)]
+                if expected is None:
+                    baseline, expected = elapsed, extracted
+                elif extracted != expected:
+                    print(f"{fixture}: {parser_name} extracted different data than html.parser")
+
+                variant = f"{parser_name}{' + strainer' if strained else ''}"
+                print(f"{fixture:<26}{variant:<24}{elapsed * 1000:>10.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from common.fetch import Fetcher
+from common.rate_limit import RateLimiter
+from fixture_server import Throttle, serve
+
+
+def crawl(base_url, pages, threads, limiter, max_retries, backoff_base):
+    """
+    Fetch pages 1..pages of the lampros fixture from `threads` threads.
+    Returns (pages fetched, seconds, fetcher).
+    """
+    fetcher = Fetcher(workers=threads, limiter=limiter, max_retries=max_retries, backoff_base=backoff_base)
+    urls = [f"{base_url}/lampros/page/{page}" for page in range(1, pages + 1)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        responses = list(executor.map(fetcher.get, urls))
+    seconds = time.perf_counter() - start
+    fetcher.close()
+    return sum(response.status_code == 200 for response in responses), seconds, fetcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl a throttling fixture server with and without the rate limiter.")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--throttle", type=float, default=40, help="requests per second the server accepts")
+    parser.add_argument("--retries", type=int, default=8)
+    parser.add_argument("--backoff", type=float, default=0.5, help="seconds, the longest first retry wait")
+    args = parser.parse_args()
+
+    print(f"{args.pages} pages, {args.threads} threads, server accepts {args.throttle:g} req/s")
+    for name, limiter in [("retries only", None),
+                          ("adaptive limiter", RateLimiter(rate=args.throttle / 4, concurrency=args.threads,
+                                                           max_concurrency=args.threads))]:
+        throttle = Throttle(args.throttle)
+        server, url = serve(pages=args.pages, throttle=throttle)
+        fetched, seconds, fetcher = crawl(url, args.pages, args.threads, limiter, args.retries, args.backoff)
+        server.shutdown()
+        print(f"{name:>16}: {fetched}/{args.pages} pages in {seconds:.1f}s ({fetched / seconds:.1f} pages/s), "
+              f"{throttle.rejected} requests got 429, {fetcher.retries} retries")
+        if limiter:
+            print(f"{'':>16}  {limiter.report()}")
+
+
+if __name__ == "__main__":
+    main()
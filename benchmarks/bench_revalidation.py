@@ -0,0 +1,81 @@
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+from fixture_server import serve
+
+# Filter values of the generated Fyliana categories
+FYLIANA_FILTERS = {
+    "valid_colors": ["Χρώμα[]=15", "Χρώμα[]=12"],
+    "valid_materials": ["Υλικό[]=1"],
+    "valid_features": ["Χαρακτηριστικά[]=70", "Χαρακτηριστικά[]=29"],
+}
+
+
+def child(url, args):
+    """
+    Run Fyliana/script.py against the fixture server in the current directory, revalidating
+    every cached page instead of trusting it for the cache's TTL.
+    """
+    sys.path.append(os.path.join(ROOT, "Fyliana"))
+    import script
+
+    script.BASE_URL = url
+    script.category_structure = {
+        "epipla": {f"bench-{number}": dict(FYLIANA_FILTERS, url=f"{url}/fyliana/epipla/bench-{number}")
+                   for number in range(1, args.categories + 1)}
+    }
+    script.http_cache.ttl = 0
+    script.rate_limiter.rate = script.rate_limiter.max_rate = 1000
+    sys.argv = ["script.py", "--engine", args.engine]
+    with contextlib.redirect_stdout(io.StringIO()):
+        script.main()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl Fyliana twice with one HTTP cache and check that the second "
+                                                 "crawl is served by 304s.")
+    parser.add_argument("--categories", type=int, default=2, help="Fyliana categories to crawl")
+    parser.add_argument("--pages", type=int, default=10, help="listing pages per category")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="Fyliana engine")
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds every response waits (±50%%)")
+    parser.add_argument("--min-share", type=float, default=0.95,
+                        help="share of the second crawl's responses that must be 304")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.url, args)
+        return
+
+    server, url = serve(pages=args.pages, latency=args.latency)
+    directory = tempfile.mkdtemp(prefix="bench_revalidation_")
+    command = [sys.executable, os.path.abspath(__file__), "--child", "--url", url, "--categories", str(args.categories),
+               "--engine", args.engine]
+    print(f"{'crawl':<8}{'200':>8}{'304':>8}{'other':>8}{'304 share':>12}")
+    share = 0.0
+    for crawl in ("first", "second"):
+        output = subprocess.run(command, cwd=directory, capture_output=True, text=True)
+        if output.returncode:
+            print(f"{crawl} crawl failed:\n{output.stderr}")
+            sys.exit(1)
+        counts = server.responses.take()
+        total = sum(counts.values())
+        share = counts[304] / total if total else 0.0
+        print(f"{crawl:<8}{counts[200]:>8}{counts[304]:>8}{total - counts[200] - counts[304]:>8}{share:>12.1%}")
+    server.shutdown()
+
+    if share < args.min_share:
+        print(f"Only {share:.1%} of the second crawl was revalidated with 304, expected at least {args.min_share:.0%}.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
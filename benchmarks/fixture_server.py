@@ -0,0 +1,292 @@
+import argparse
+import functools
+import json
+import os
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# /<shop>/page/<n>, the WooCommerce listing URL shape
+PAGE_PATH = re.compile(r"^/(?P<shop>[a-z]+)/page/(?P<page>\d+)/?$")
+
+
+# Markup of the page links and of the product grid in the WooCommerce fixtures
+PAGINATION = re.compile(r'<nav class="woocommerce-pagination">.*?</nav>', re.S)
+PRODUCT_GRID = re.compile(r'<ul class="products[^"]*">.*?</ul>(?=</div>)', re.S)
+
+# Product cards and page links in the Fyliana listing fixture
+FYLIANA_CARD = re.compile(r'<div class="prdv"><a href="[^"]*">.*?<h4>(?P<sku>[^<]*)</h4>.*?</div></div>', re.S)
+FYLIANA_PAGINATION = re.compile(r'<div class="pagination">.*?</div>', re.S)
+
+
+@functools.lru_cache(maxsize=None)
+def read_fixture(shop, name):
+    with open(os.path.join(FIXTURES_DIR, shop, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def fyliana_page(path, query, pages):
+    """
+    Build a Fyliana page: `/fyliana/product/<sku>` is a product page, any other `/fyliana/...`
+    path a category listing. `p=<n>` selects the listing page, and every `filter-<value>`
+    keeps only the products a hash assigns to that value (about half), so filtered
+    listings are subsets of the category like on the shop. Returns None past the last page.
+    """
+    if path.startswith("/fyliana/product/"):
+        return read_fixture("fyliana", "detail.html")
+
+    params = query.split("&") if query else []
+    page = next((int(param[2:]) for param in params if param.startswith("p=") and param[2:].isdigit()), 1)
+    filters = [param for param in params if param.startswith("filter-")]
+    if not 1 <= page <= pages:
+        return None
+
+    def card(match):
+        sku = f"P{page}-{match['sku']}"
+        if any(zlib.crc32(f"{sku}|{value}".encode("utf-8")) % 2 for value in filters):
+            return ""
+        html = match.group(0).replace(f"<h4>{match['sku']}</h4>", f"<h4>{sku}</h4>")
+        return re.sub(r'href="[^"]*"', f'href="/fyliana/product/{sku}"', html, count=1)
+
+    html = FYLIANA_CARD.sub(card, read_fixture("fyliana", "listing.html"))
+    links = "".join(f'<a class="num" href="?p={number}">{number}</a>' for number in range(1, pages + 1))
+    if page < pages:
+        links += f'<a class="next" href="?p={page + 1}">&raquo;</a>'
+    return FYLIANA_PAGINATION.sub(lambda _: f'<div class="pagination">{links}</div>', html, count=1)
+
+
+def render_with_script(html):
+    """
+    Move the product grid into a script that inserts it when the page runs, like a shop
+    that renders its listing client-side. Only a browser sees the products.
+    """
+    def replace(match):
+        markup = json.dumps(match.group(0)).replace("</", "<\\/")
+        return f'<div id="grid"></div><script>document.getElementById("grid").innerHTML = {markup};</script>'
+    return PRODUCT_GRID.sub(replace, html, count=1)
+
+
+def pagination_markup(page, pages):
+    """
+    Build WooCommerce page links for `page` of `pages`: first, neighbours, last and "next".
+    """
+    items = []
+    shown = sorted({1, page - 1, page, page + 1, pages} & set(range(1, pages + 1)))
+    for previous, number in zip([0] + shown, shown):
+        if number - previous > 1:
+            items.append('<li><span class="page-numbers dots">&hellip;</span></li>')
+        if number == page:
+            items.append(f'<li><span aria-current="page" class="page-numbers current">{number}</span></li>')
+        else:
+            items.append(f'<li><a class="page-numbers" href="../{number}/">{number}</a></li>')
+    if page < pages:
+        items.append(f'<li><a class="next page-numbers" href="../{page + 1}/">&rarr;</a></li>')
+    return f'<nav class="woocommerce-pagination"><ul class="page-numbers">{"".join(items)}</ul></nav>'
+
+
+class Throttle:
+    """
+    Server-side token bucket: allows `rate` requests per second (with a burst of one second's
+    worth) and counts what it turned away, like a shop that answers floods with 429.
+    """
+
+    def __init__(self, rate, retry_after=1):
+        self.rate = rate
+        self.retry_after = retry_after
+        self.tokens = rate
+        self.refilled = time.monotonic()
+        self.served = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.refilled) * self.rate)
+            self.refilled = now
+            if self.tokens < 1:
+                self.rejected += 1
+                return False
+            self.tokens -= 1
+            self.served += 1
+            return True
+
+
+class ResponseCounter:
+    """
+    Counts the responses the server sent by status code, e.g. full pages (200) against
+    revalidated ones (304) when a crawler keeps an HTTP cache.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, status):
+        with self._lock:
+            self.counts[status] += 1
+
+    def take(self):
+        """
+        Return the counts so far and start counting from zero.
+        """
+        with self._lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+
+def not_modified(headers, etag, last_modified):
+    """
+    Whether a conditional request can be answered with 304: If-None-Match names the page's ETag,
+    or, without If-None-Match, If-Modified-Since is not older than the page.
+    """
+    if headers.get("If-None-Match"):
+        return any(tag.strip() in (etag, "*") for tag in headers["If-None-Match"].split(","))
+    if headers.get("If-Modified-Since"):
+        try:
+            return parsedate_to_datetime(headers["If-Modified-Since"]).timestamp() >= last_modified
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def woocommerce_page(path, pages, js_every=0, pagination=True):
+    """
+    Build page n of a WooCommerce shop (`/<shop>/page/<n>`) from its listing fixture, or None.
+    """
+    match = PAGE_PATH.match(path)
+    if not match or not os.path.exists(os.path.join(FIXTURES_DIR, match["shop"], "listing.html")) \
+            or not 1 <= int(match["page"]) <= pages:
+        return None
+
+    html = read_fixture(match["shop"], "listing.html")
+    html = html.replace('data-product_sku="', f'data-product_sku="p{match["page"]}-')
+    links = pagination_markup(int(match["page"]), pages) if pagination else ""
+    html = PAGINATION.sub(lambda _: links, html)
+    if js_every and int(match["page"]) % js_every == 0:
+        html = render_with_script(html)
+    return html
+
+
+def make_handler(pages, js_every=0, pagination=True, throttle=None, latency=0.0, error_rate=0.0, seed=0,
+                 responses=None):
+    """
+    Build a request handler serving `fixtures/<shop>/listing.html` as pages 1..pages of every shop.
+    Each page gets its own SKUs so rows from different pages can be told apart. With
+    `js_every=n`, every n-th page only has its products in a script (see render_with_script).
+    The page links match `pages`, or are left out with `pagination=False`. Fyliana listings
+    and product pages are served under `/fyliana/` (see fyliana_page).
+
+    Every response waits about `latency` seconds (±50%), a share `error_rate` of requests
+    fails with 503, and requests over the rate of a Throttle get 429 with a Retry-After header.
+
+    Pages carry an ETag (a hash of the page) and a Last-Modified date (when the server started),
+    and conditional requests for an unchanged page get 304 without a body. Every response is
+    counted by status in `responses` (a ResponseCounter).
+    """
+    faults = random.Random(seed)
+    last_modified = int(time.time())
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, like a real shop
+
+        def send_response(self, code, message=None):
+            if responses:
+                responses.count(code)
+            super().send_response(code, message)
+
+        def do_GET(self):
+            if throttle and not throttle.allow():
+                self.send_response(429)
+                self.send_header("Retry-After", str(throttle.retry_after))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            if latency:
+                time.sleep(latency * faults.uniform(0.5, 1.5))
+            if error_rate and faults.random() < error_rate:
+                self.send_error(503)
+                return
+
+            path, _, query = self.path.partition("?")
+            if path.startswith("/fyliana/"):
+                html = fyliana_page(path, query, pages)
+            else:
+                html = woocommerce_page(path, pages, js_every, pagination)
+            if html is None:
+                self.send_error(404)
+                return
+            body = html.encode("utf-8")
+            etag = f'"{zlib.crc32(body):08x}"'
+            if not_modified(self.headers, etag, last_modified):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", formatdate(last_modified, usegmt=True))
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", formatdate(last_modified, usegmt=True))
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+def serve(host="127.0.0.1", port=0, pages=304, js_every=0, pagination=True, throttle=None, latency=0.0,
+          error_rate=0.0):
+    """
+    Start the fixture server in a background thread and return (server, base URL).
+    `server.responses` counts the responses by status (see ResponseCounter).
+    """
+    ThreadingHTTPServer.request_queue_size = 256
+    ThreadingHTTPServer.daemon_threads = True
+    responses = ResponseCounter()
+    server = ThreadingHTTPServer((host, port), make_handler(pages, js_every, pagination, throttle, latency, error_rate,
+                                                            responses=responses))
+    server.responses = responses
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the saved shop pages over HTTP for offline scraper runs.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pages", type=int, default=304, help="listing pages per shop; later pages are 404")
+    parser.add_argument("--js-every", type=int, default=0,
+                        help="render every n-th page's products with JavaScript only (0: none)")
+    parser.add_argument("--no-pagination", action="store_true", help="leave the page links out of every page")
+    parser.add_argument("--throttle", type=float, default=0,
+                        help="requests per second served; the rest get 429 with Retry-After (0: no limit)")
+    parser.add_argument("--latency", type=float, default=0, help="seconds every response waits (±50%%)")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of requests answered with 503")
+    args = parser.parse_args()
+
+    server, url = serve(port=args.port, pages=args.pages, js_every=args.js_every,
+                        pagination=not args.no_pagination, throttle=Throttle(args.throttle) if args.throttle else None,
+                        latency=args.latency, error_rate=args.error_rate)
+    print(f"Serving {FIXTURES_DIR} at {url}/<shop>/page/<n> (e.g. {url}/lampros/page/1) "
+          f"and {url}/fyliana/<category>?p=<n>")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+        print("Responses by status: " + ", ".join(f"{status}: {count}"
+                                                 for status, count in sorted(server.responses.take().items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import argparse
+import contextlib
+import csv
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.append(ROOT)
+from fixture_server import serve
+
+# Filter values of the generated Fyliana categories
+FYLIANA_FILTERS = {
+    "valid_colors": ["Χρώμα[]=15", "Χρώμα[]=12"],
+    "valid_materials": ["Υλικό[]=1"],
+    "valid_features": ["Χαρακτηριστικά[]=70", "Χαρακτηριστικά[]=29"],
+}
+
+OUTPUT_FILE = "fylliana_products.csv"
+
+
+def child(url, args):
+    """
+    Run Fyliana/script.py against the fixture server in the current directory.
+    """
+    sys.path.append(os.path.join(ROOT, "Fyliana"))
+    import script
+
+    script.BASE_URL = url
+    script.category_structure = {
+        "epipla": {f"stress-{number}": dict(FYLIANA_FILTERS, url=f"{url}/fyliana/epipla/stress-{number}")
+                   for number in range(1, args.categories + 1)}
+    }
+    script.rate_limiter.rate = script.rate_limiter.max_rate = 1000
+    script.fetcher.backoff_base = script.RETRY_BACKOFF = 0.05
+    sys.argv = ["script.py", "--engine", args.engine] + (["--resume"] if args.resume else [])
+    with contextlib.redirect_stdout(io.StringIO()):
+        script.main()
+
+
+def crawl(directory, url, args, resume=False, kill_after=0):
+    """
+    Crawl into `directory` in a child process. With `kill_after`, the child is killed (SIGKILL)
+    once the CSV holds about that many rows. Returns True if the crawl ran to the end.
+    """
+    command = [sys.executable, os.path.abspath(__file__), "--child", "--url", url,
+               "--categories", str(args.categories), "--engine", args.engine] + (["--resume"] if resume else [])
+    process = subprocess.Popen(command, cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    output = os.path.join(directory, OUTPUT_FILE)
+    while kill_after and process.poll() is None:
+        if os.path.exists(output):
+            with open(output, "rb") as f:
+                if f.read().count(b"\n") > kill_after:  # The header line, then one line per row
+                    process.kill()
+                    process.wait()
+                    return False
+        time.sleep(0.01)
+    _, errors = process.communicate()
+    if process.returncode:
+        raise RuntimeError(f"crawl failed:\n{errors.decode('utf-8', 'replace')}")
+    return True
+
+
+def read_rows(directory):
+    with open(os.path.join(directory, OUTPUT_FILE), encoding="utf-8-sig", newline="") as f:
+        return [tuple(row) for row in csv.reader(f)]
+
+
+def check(expected, resumed):
+    """
+    Compare a resumed CSV with the uninterrupted one; rows may come in another order.
+    Returns a list of problems.
+    """
+    problems = []
+    if expected[0] != resumed[0]:
+        problems.append("different headers")
+    skus = Counter(row[resumed[0].index("sku")] for row in resumed[1:]) if "sku" in resumed[0] else Counter()
+    duplicates = [sku for sku, count in skus.items() if count > 1]
+    if duplicates:
+        problems.append(f"{len(duplicates)} SKUs written twice, e.g. {duplicates[0]}")
+    missing = Counter(expected[1:]) - Counter(resumed[1:])
+    extra = Counter(resumed[1:]) - Counter(expected[1:])
+    if missing:
+        problems.append(f"{sum(missing.values())} rows missing or different, e.g. {next(iter(missing))[:3]}")
+    if extra:
+        problems.append(f"{sum(extra.values())} rows not in the uninterrupted run, e.g. {next(iter(extra))[:3]}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kill a Fyliana crawl part way, resume it and compare the CSV "
+                                                 "with an uninterrupted run.")
+    parser.add_argument("--categories", type=int, default=3, help="Fyliana categories to crawl")
+    parser.add_argument("--pages", type=int, default=10, help="listing pages per category")
+    parser.add_argument("--engine", choices=["threads", "async"], default="threads", help="Fyliana engine")
+    parser.add_argument("--kill-after", type=int, default=0,
+                        help="rows written before the first kill, later rounds kill after 2x, 3x... as many "
+                             "(0: spread the kills over the run)")
+    parser.add_argument("--rounds", type=int, default=3, help="interrupted runs, each killed later than the last")
+    parser.add_argument("--latency", type=float, default=0.01, help="seconds every response waits (±50%%)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--resume", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.url, args)
+        return
+
+    server, url = serve(pages=args.pages, latency=args.latency, error_rate=args.error_rate)
+    reference = tempfile.mkdtemp(prefix="stress_resume_reference_")
+    crawl(reference, url, args)
+    expected = read_rows(reference)
+    print(f"Uninterrupted run: {len(expected) - 1} rows")
+
+    failed = False
+    print(f"{'round':<8}{'killed at':>10}{'rows':>8}{'result':>10}")
+    for round_number in range(args.rounds):
+        kill_after = (args.kill_after or (len(expected) - 1) // (args.rounds + 1)) * (round_number + 1)
+        directory = tempfile.mkdtemp(prefix="stress_resume_")
+        problems = []
+        if crawl(directory, url, args, kill_after=kill_after):
+            problems.append(f"the crawl finished before {kill_after} rows; lower --kill-after")
+        else:
+            crawl(directory, url, args, resume=True)
+            resumed = read_rows(directory)
+            problems = check(expected, resumed)
+        failed = failed or bool(problems)
+        rows = len(read_rows(directory)) - 1
+        print(f"{round_number:<8}{kill_after:>10}{rows:>8}{'ok' if not problems else 'FAILED':>10}")
+        for problem in problems:
+            print(f"    {problem}")
+    server.shutdown()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
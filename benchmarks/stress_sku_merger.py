@@ -0,0 +1,97 @@
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Fyliana"))
+from sku_merger import SkuMerger
+
+FEATURE_COLUMN = "attribute:Χαρακτηριστικά"
+FEATURES = [f"Feature {i}" for i in range(12)] + [""]
+
+
+def make_listings(skus, listings_per_thread, threads, seed):
+    """
+    Build one list of (sku, feature) listings per thread, with every SKU shared by many threads.
+    """
+    rng = random.Random(seed)
+    sku_names = [f"SKU{i:05d}" for i in range(skus)]
+    return [[(rng.choice(sku_names), rng.choice(FEATURES)) for _ in range(listings_per_thread)]
+            for _ in range(threads)]
+
+
+def run(listings, shards):
+    """
+    Merge every thread's listings concurrently and return (merger, seconds).
+    """
+    merger = SkuMerger([FEATURE_COLUMN], shards=shards)
+    start_barrier = threading.Barrier(len(listings))
+
+    def worker(items):
+        start_barrier.wait()
+        for sku, feature in items:
+            merger.merge(sku, {"sku": sku, FEATURE_COLUMN: feature}, {FEATURE_COLUMN: feature})
+
+    threads = [threading.Thread(target=worker, args=(items,)) for items in listings]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return merger, time.perf_counter() - start
+
+
+def check(merger, listings):
+    """
+    Compare the merged rows with a serial merge. Returns a list of problems.
+    """
+    expected = {}
+    for items in listings:
+        for sku, feature in items:
+            features = expected.setdefault(sku, set())
+            if feature:
+                features.add(feature)
+
+    problems = []
+    rows = merger.rows()
+    seen = [row["sku"] for row in rows]
+    if len(seen) != len(set(seen)):
+        problems.append(f"{len(seen) - len(set(seen))} duplicate rows")
+    for row in rows:
+        features = set(filter(None, row[FEATURE_COLUMN].split(",")))
+        if features != expected.get(row["sku"]):
+            problems.append(f"{row['sku']}: {sorted(features)} != {sorted(expected.get(row['sku'], []))}")
+    missing = set(expected) - set(seen)
+    if missing:
+        problems.append(f"{len(missing)} SKUs missing")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge overlapping SKUs from many threads and verify nothing is lost.")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--skus", type=int, default=2000, help="distinct SKUs shared by all threads")
+    parser.add_argument("--listings", type=int, default=20000, help="listings merged by each thread")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'round':<8}{'shards':>8}{'merges/s':>14}{'result':>10}")
+    for round_number in range(args.rounds):
+        listings = make_listings(args.skus, args.listings, args.threads, seed=round_number)
+        total = args.threads * args.listings
+        for shards in (1, 64):
+            merger, elapsed = run(listings, shards)
+            problems = check(merger, listings)
+            failed = failed or bool(problems)
+            print(f"{round_number:<8}{shards:>8}{total / elapsed:>14,.0f}{'ok' if not problems else 'FAILED':>10}")
+            for problem in problems[:5]:
+                print(f"    {problem}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
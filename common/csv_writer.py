@@ -0,0 +1,86 @@
+import csv
+import os
+import threading
+
+# Quoting styles expected by the importers, the same the pandas exports used: pandas' default
+# QUOTE_MINIMAL, and QUOTE_ALL for script_stromata.py, whose to_csv call asked for it
+SHOPIFY_QUOTING = csv.QUOTE_MINIMAL
+WOOCOMMERCE_QUOTING = csv.QUOTE_ALL
+
+
+class StreamingCsvWriter:
+    """
+    Writes product rows to a CSV file as they complete instead of collecting the whole
+    catalogue first, so a crash keeps everything scraped so far and memory stays flat.
+
+    Columns always follow `headers`; missing fields are written empty and unknown ones are
+    ignored. With `append=True` an existing file keeps its rows and no second header (or
+    second UTF-8 BOM) is written. Rows are flushed every `flush_every` rows.
+    """
+
+    def __init__(self, path, headers, append=False, encoding="utf-8-sig", quoting=SHOPIFY_QUOTING, flush_every=1):
+        self.path = path
+        self.headers = list(headers)
+        self.flush_every = flush_every
+        self.rows_written = 0
+        self._lock = threading.Lock()
+
+        existing = append and os.path.exists(path) and os.path.getsize(path) > 0
+        if existing and encoding.lower().replace("_", "-") == "utf-8-sig":
+            encoding = "utf-8"  # The BOM is already at the start of the file
+        self._file = open(path, "a" if existing else "w", newline="", encoding=encoding)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.headers, extrasaction="ignore",
+                                      quoting=quoting, lineterminator=os.linesep)
+        if not existing:
+            self._writer.writeheader()
+            self._file.flush()
+
+    def write(self, row):
+        """
+        Write one row (a dict keyed by header).
+        """
+        with self._lock:
+            self._writer.writerow(row)
+            self.rows_written += 1
+            if self.rows_written % self.flush_every == 0:
+                self._file.flush()
+
+    def tell(self):
+        """
+        Flush and return the byte offset of the end of the file, e.g. for a crawl journal.
+        """
+        with self._lock:
+            self._file.flush()
+            return self._file.buffer.tell()
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def update_rows(path, key, updates, encoding="utf-8-sig", quoting=SHOPIFY_QUOTING):
+    """
+    Rewrite a CSV file in place, replacing fields of the rows whose `key` column is in
+    `updates` ({key value: {column: new value}}). Rows stream through a temporary file,
+    so memory does not grow with the file.
+    """
+    temp_path = f"{path}.tmp"
+    with open(path, newline="", encoding=encoding) as source, \
+            open(temp_path, "w", newline="", encoding=encoding) as target:
+        reader = csv.DictReader(source)
+        writer = csv.DictWriter(target, fieldnames=reader.fieldnames, quoting=quoting, lineterminator=os.linesep)
+        writer.writeheader()
+        for row in reader:
+            row.update(updates.get(row[key], {}))
+            writer.writerow(row)
+    os.replace(temp_path, path)
@@ -0,0 +1,229 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import Future
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from common.rate_limit import BACKOFF_BASE, BACKOFF_CAP, RETRY_STATUSES, RetryScheduler, backoff_delay, \
+    retry_after_seconds
+
+try:
+    import httpx
+except ImportError:  # Only needed for HTTP/2
+    httpx = None
+
+# Default settings
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT = 30  # seconds
+MAX_HOSTS = 10  # hosts with their own connection pool
+
+# Failures without a response that are worth retrying
+RETRY_ERRORS = (requests.ConnectionError, requests.Timeout) + ((httpx.TransportError,) if httpx else ())
+
+
+class Fetcher:
+    """
+    Shared fetch layer for the scrapers.
+
+    All requests go through one client that keeps a keep-alive connection pool per host,
+    sized to the number of worker threads, so consecutive requests to the same shop reuse
+    the TCP+TLS connection. With `http2=True` (and httpx[http2] installed) requests are
+    multiplexed over HTTP/2 instead. An optional HttpCache sits in front of the network.
+
+    An optional RateLimiter paces the requests that reach the network (cache hits are free).
+    With `max_retries`, throttled (429/503), failed (5xx) and timed out requests are retried
+    with exponential backoff and jitter, waiting at least the server's Retry-After. Retries
+    are scheduled on a timer: callers that use `submit` and continue in a callback hold no
+    thread during a backoff, while `get` waits for the final response. With a Metrics instance
+    every response is recorded (latency, status, bytes, cache hits) along with the retries.
+    """
+
+    def __init__(self, workers=DEFAULT_WORKERS, headers=None, cache=None, http2=False, timeout=DEFAULT_TIMEOUT,
+                 limiter=None, max_retries=0, backoff_base=BACKOFF_BASE, backoff_cap=BACKOFF_CAP, metrics=None):
+        self.workers = workers
+        self.cache = cache
+        self.metrics = metrics
+        self.timeout = timeout
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.requests = 0
+        self.connections = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+        self._scheduler = RetryScheduler(workers) if max_retries else None
+
+        if http2:
+            if httpx is None:
+                raise RuntimeError("HTTP/2 needs httpx: pip install 'httpx[http2]'")
+            limits = httpx.Limits(max_connections=workers * MAX_HOSTS, max_keepalive_connections=workers * MAX_HOSTS)
+            self.client = httpx.Client(http2=True, limits=limits, headers=headers, follow_redirects=True,
+                                       event_hooks={"response": [lambda response: self._count_request()]})
+            self.connections = None  # httpx does not expose how many connections it opened
+        else:
+            self.client = requests.Session()
+            if headers:
+                self.client.headers.update(headers)
+            for prefix in ("http://", "https://"):
+                adapter = HTTPAdapter(pool_connections=MAX_HOSTS, pool_maxsize=workers)
+                adapter.poolmanager.pool_classes_by_scheme = {
+                    "http": counting_pool(HTTPConnectionPool, self._count_connection),
+                    "https": counting_pool(HTTPSConnectionPool, self._count_connection),
+                }
+                self.client.mount(prefix, adapter)
+            self.client.hooks["response"].append(lambda response, **kwargs: self._count_request())
+        self._network = LimitedClient(self.client, limiter, metrics) if limiter else self.client
+
+    def get(self, url, **kwargs):
+        """
+        GET a URL through the cache (if any) and the pooled client, retrying if enabled.
+        After the last retry the final response is returned, or its error raised; the calling
+        thread waits through the backoffs, use `submit` to avoid that.
+        """
+        if not self.max_retries:
+            return self._send(url, **kwargs)
+        return self.submit(url, **kwargs).result()
+
+    def submit(self, url, **kwargs):
+        """
+        Start a GET on the retry scheduler's pool and return a Future of the final response.
+        Retries wait on the scheduler's timer, so the caller can continue in a done-callback
+        without any thread sleeping through a backoff.
+        """
+        with self._lock:
+            if self._scheduler is None:
+                self._scheduler = RetryScheduler(self.workers)
+        future = Future()
+        # Attempts run on the scheduler's threads, under the caller's metric labels
+        self._scheduler.submit(contextvars.copy_context().run, self._attempt, future, url, 0, kwargs)
+        return future
+
+    def _send(self, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        start = time.perf_counter()
+        try:
+            if self.cache:
+                response = self.cache.get(url, session=self._network, **kwargs)
+            else:
+                response = self._network.get(url, **kwargs)
+        except Exception:
+            if self.metrics:
+                self.metrics.count("request_errors")
+            raise
+        if self.metrics:
+            waited = self._network.take_wait() if self.limiter else 0
+            self.metrics.record_response(response, time.perf_counter() - start - waited)
+        return response
+
+    def _attempt(self, future, url, attempt, kwargs):
+        """
+        Send one attempt of a request; schedule the next one or settle the Future.
+        """
+        response, error = None, None
+        try:
+            response = self._send(url, **dict(kwargs))
+        except RETRY_ERRORS as e:
+            error = e
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        if (response is None or response.status_code in RETRY_STATUSES) and attempt < self.max_retries:
+            retry_after = retry_after_seconds(response.headers.get("Retry-After")) if response is not None else None
+            delay = backoff_delay(attempt, self.backoff_base, self.backoff_cap, retry_after)
+            reason = error if response is None else f"HTTP {response.status_code}"
+            print(f"Error fetching URL {url}: {reason}. Retrying in {delay:.1f}s ({attempt + 1}/{self.max_retries})...")
+            with self._lock:
+                self.retries += 1
+            if self.metrics:
+                self.metrics.count("retries")
+            self._scheduler.schedule(delay, contextvars.copy_context().run, self._attempt, future, url, attempt + 1,
+                                     kwargs)
+        elif response is None:
+            future.set_exception(error)
+        else:
+            future.set_result(response)
+
+    def report(self):
+        """
+        Summarize connection reuse (and retries and rate limits, if used) for the end of a run.
+        """
+        if self.connections is None:
+            summary = f"Fetcher: {self.requests} requests over HTTP/2"
+        else:
+            summary = f"Fetcher: {self.requests} requests over {self.connections} connections"
+        if self.max_retries:
+            summary += f", {self.retries} retries"
+        if self.limiter:
+            summary += f"\n{self.limiter.report()}"
+        return summary
+
+    def close(self):
+        if self._scheduler:
+            self._scheduler.close()
+        self.client.close()
+
+    def _count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def _count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+
+class LimitedClient:
+    """
+    Wraps a requests/httpx client so every GET waits for the RateLimiter and reports its
+    outcome (status and Retry-After) back to it. The time spent waiting is added to the
+    `limiter_wait_seconds` counter of `metrics`, if given.
+    """
+
+    def __init__(self, client, limiter, metrics=None):
+        self.client = client
+        self.limiter = limiter
+        self.metrics = metrics
+        self._local = threading.local()
+
+    def get(self, url, **kwargs):
+        start = time.perf_counter()
+        self.limiter.acquire(url)
+        self._local.waited = time.perf_counter() - start
+        if self.metrics:
+            self.metrics.count("limiter_wait_seconds", self._local.waited)
+        try:
+            response = self.client.get(url, **kwargs)
+        except Exception:
+            self.limiter.release(url)
+            raise
+        self.limiter.release(url, response.status_code, retry_after_seconds(response.headers.get("Retry-After")))
+        return response
+
+    def take_wait(self):
+        """
+        Return (and clear) how long this thread's last request waited for the limiter, so the
+        fetch latency can leave it out.
+        """
+        waited = getattr(self._local, "waited", 0)
+        self._local.waited = 0
+        return waited
+
+
+def counting_pool(pool_class, on_connect):
+    """
+    Subclass a urllib3 connection pool so every TCP connect (including reconnects of a
+    dropped keep-alive connection) calls `on_connect`.
+    """
+    class CountingConnection(pool_class.ConnectionCls):
+        def connect(self):
+            on_connect()
+            super().connect()
+
+    class CountingPool(pool_class):
+        ConnectionCls = CountingConnection
+
+    return CountingPool
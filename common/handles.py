@@ -0,0 +1,11 @@
+import re
+
+
+def sanitize_handle(title):
+    """
+    Build a Shopify handle from a product title: lowercase, with spaces and every character
+    that is not a Greek or Latin letter, a digit or a hyphen replaced by "-".
+    """
+    handle = title.lower().replace(" ", "-")
+    handle = re.sub(r'[^a-zα-ωάέήίόύώ0-9-]', '-', handle, flags=re.UNICODE)
+    return handle
@@ -0,0 +1,254 @@
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+
+# Default cache settings
+DEFAULT_TTL = 6 * 60 * 60  # seconds a stored page is served without asking the server
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # total size of stored bodies before LRU eviction
+DEFAULT_TOUCH_COMMIT_EVERY = 200  # cache hits whose last-used time is committed together
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    encoding TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for requests.Response built from a stored cache entry.
+    """
+
+    def __init__(self, url, status_code, headers, content, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}", response=self)
+
+
+class HttpCache:
+    """
+    Disk-backed HTTP response cache stored in SQLite.
+
+    Entries younger than `ttl` are served without a request. Older entries are revalidated
+    with If-None-Match / If-Modified-Since, so an unchanged page costs a 304 instead of a
+    full download. The total body size is kept under `max_bytes` by evicting the least
+    recently used entries; the total is kept in memory, so a store does not add up the
+    whole table. Hits only update the entry's last-used time, and those updates are
+    committed every `touch_commit_every` hits, with the next store, or at exit.
+    """
+
+    def __init__(self, path, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES,
+                 touch_commit_every=DEFAULT_TOUCH_COMMIT_EVERY):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.touch_commit_every = touch_commit_every
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._uncommitted_touches = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self._size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        atexit.register(self.flush)
+
+    def get(self, url, session=None, **kwargs):
+        """
+        Fetch a URL through the cache, using `session` (or the requests module) for the network.
+        Only 200 responses are stored; anything else is returned uncached.
+        """
+        session = session or requests
+        cached, conditional_headers = self.lookup(url)
+        if cached:
+            return cached
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.update(conditional_headers)
+        response = session.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304:
+            entry = self._revalidate(url)
+            if entry:
+                return self._to_response(url, entry)
+
+        with self._lock:
+            self.misses += 1
+        if response.status_code == 200:
+            self.store(url, response.content, response.headers, response.encoding)
+        response.from_cache = False
+        return response
+
+    def lookup(self, url):
+        """
+        Return (the stored response if it is younger than the TTL, else None, the headers that
+        revalidate the stored entry). For clients that send the request themselves, e.g. aiohttp,
+        which then pass the answer to `update`.
+        """
+        entry = self._load(url)
+        if entry and time.time() - entry["stored_at"] < self.ttl:
+            self._touch(url)
+            with self._lock:
+                self.hits += 1
+            return self._to_response(url, entry), {}
+
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return None, headers
+
+    def update(self, url, status, body, headers=None, encoding=None):
+        """
+        Record the answer to a request sent with `lookup`'s headers. Returns the stored response
+        on a 304, otherwise None; a 200 is stored.
+        """
+        if status == 304:
+            entry = self._revalidate(url)
+            if entry:
+                return self._to_response(url, entry)
+        with self._lock:
+            self.misses += 1
+        if status == 200:
+            self.store(url, body, headers, encoding)
+        return None
+
+    def get_fresh(self, url):
+        """
+        Return the stored body of a URL if it is younger than the TTL, otherwise None.
+        Used for pages that cannot be revalidated, e.g. HTML rendered by a browser.
+        """
+        entry = self._load(url)
+        if not entry or time.time() - entry["stored_at"] >= self.ttl:
+            return None
+        self._touch(url)
+        with self._lock:
+            self.hits += 1
+        return self._to_response(url, entry).text
+
+    def store(self, url, body, headers=None, encoding=None):
+        """
+        Store a response body (bytes or str) and evict old entries if the cache is full.
+        """
+        if isinstance(body, str):
+            body = body.encode(encoding or "utf-8")
+        headers = dict(headers or {})
+        # Header names are case-insensitive (httpx lowercases them all)
+        validators = {name.lower(): value for name, value in headers.items()
+                      if name.lower() in ("etag", "last-modified")}
+        now = time.time()
+        with self._lock:
+            replaced = self._db.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, 200, json.dumps(headers), body, encoding, validators.get("etag"),
+                 validators.get("last-modified"), now, now, len(body)),
+            )
+            self._size += len(body) - (replaced[0] if replaced else 0)
+            self._evict()
+            self._db.commit()
+            self._uncommitted_touches = 0
+
+    def report(self):
+        """
+        Summarize cache usage for the end of a run.
+        """
+        return (f"HTTP cache: {self.hits} fresh hits, {self.revalidated} revalidated (304), "
+                f"{self.misses} downloaded")
+
+    def flush(self):
+        """
+        Commit the last-used times of recent hits.
+        """
+        with self._lock:
+            if not self._closed and self._uncommitted_touches:
+                self._db.commit()
+                self._uncommitted_touches = 0
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._db.close()
+        atexit.unregister(self.flush)
+
+    def _load(self, url):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, headers, body, encoding, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row:
+            return None
+        keys = ("status", "headers", "body", "encoding", "etag", "last_modified", "stored_at")
+        return dict(zip(keys, row))
+
+    def _touch(self, url, refreshed=False):
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self._db.execute("UPDATE responses SET last_used = ?, stored_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self._db.execute("UPDATE responses SET last_used = ? WHERE url = ?", (now, url))
+            self._uncommitted_touches += 1
+            if self._uncommitted_touches >= self.touch_commit_every:
+                self._db.commit()
+                self._uncommitted_touches = 0
+
+    def _revalidate(self, url):
+        # The server answered 304: the stored entry is fresh again
+        entry = self._load(url)
+        if entry:
+            self._touch(url, refreshed=True)
+            with self._lock:
+                self.revalidated += 1
+        return entry
+
+    def _evict(self):
+        # Caller holds the lock
+        if self._size <= self.max_bytes:
+            return
+        for url, size in self._db.execute("SELECT url, size FROM responses ORDER BY last_used").fetchall():
+            self._db.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._size -= size
+            if self._size <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _to_response(url, entry):
+        return CachedResponse(url, entry["status"], json.loads(entry["headers"]), entry["body"], entry["encoding"])
@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+
+
+class CrawlJournal:
+    """
+    Durable record of finished crawl work, so an interrupted run can resume.
+
+    Every finished unit (a listing URL, a detail URL, an emitted SKU, ...) is appended as
+    one JSON line and flushed immediately. Entries carry optional data, e.g. the parsed
+    cards of a listing or the CSV offset after a written row. A line cut short by a crash
+    is ignored when the journal is loaded.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+
+        if resume and os.path.exists(path):
+            self._load()
+            mode = "a"
+        else:
+            mode = "w"
+        self._file = open(path, mode, encoding="utf-8")
+
+    def done(self, kind, key):
+        """
+        Check whether a unit of work was recorded.
+        """
+        with self._lock:
+            return (kind, key) in self._entries
+
+    def get(self, kind, key, default=None):
+        """
+        Return the data recorded with a unit of work.
+        """
+        with self._lock:
+            return self._entries.get((kind, key), default)
+
+    def entries(self, kind):
+        """
+        Return {key: data} of every recorded unit of one kind, in recording order.
+        """
+        with self._lock:
+            return {key: data for (entry_kind, key), data in self._entries.items() if entry_kind == kind}
+
+    def record(self, kind, key, data=None):
+        """
+        Append a finished unit of work and flush it to disk.
+        """
+        line = json.dumps({"kind": kind, "key": key, "data": data}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._entries[(kind, key)] = data
+
+    def truncate_output(self, path):
+        """
+        Cut the output file back to the largest "offset" recorded in any entry, dropping
+        anything written after the last recorded unit (e.g. half of a row).
+        Scripts record the offset right after the header so there is always one to go back to.
+        """
+        with self._lock:
+            offsets = [data["offset"] for data in self._entries.values() if isinstance(data, dict) and "offset" in data]
+        if offsets and os.path.exists(path):
+            os.truncate(path, max(offsets))
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def _load(self):
+        valid_size = 0
+        with open(self.path, "rb") as f:
+            for raw_line in f:
+                if not raw_line.endswith(b"\n"):
+                    break  # Cut short by a crash
+                entry = json.loads(raw_line)
+                self._entries[(entry["kind"], entry["key"])] = entry["data"]
+                valid_size += len(raw_line)
+        os.truncate(self.path, valid_size)
@@ -0,0 +1,293 @@
+import bisect
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Stages in the order the reports list them
+STAGES = ("fetch", "render", "parse", "extract", "consolidate", "write")
+
+# Labels (shop, category) of the work the current thread or asyncio task is doing
+_current_labels = contextvars.ContextVar("metric_labels", default={})
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, as Prometheus keeps them.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q):
+        """
+        Return the upper bound of the bucket holding the q-th quantile (the maximum for the last one).
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"count": self.count, "seconds": round(self.sum, 6), "max": round(self.max, 6),
+                "p50": self.quantile(0.5), "p95": self.quantile(0.95),
+                "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], self.counts))}
+
+
+class Metrics:
+    """
+    Thread-safe counters and stage-latency histograms for one crawl, labelled by shop and category.
+
+    Code that knows the category wraps its work in `metrics.labels(category=...)`; every stage
+    timed (`with metrics.stage("parse"):`) or counter bumped inside it, in the same thread or
+    asyncio task, is attributed to that category. Stages are fetch, render, parse, extract,
+    consolidate and write. At the end `write_report` saves a JSON and a text report, and
+    `serve_prometheus` optionally exposes the same numbers for scraping while the crawl runs.
+    """
+
+    def __init__(self, **labels):
+        self.constant_labels = labels
+        self.started = time.time()
+        self._start = time.perf_counter()
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _key(self, name, labels):
+        merged = dict(self.constant_labels)
+        merged.update(_current_labels.get())
+        merged.update(labels)
+        return name, tuple(sorted(merged.items()))
+
+    @contextmanager
+    def labels(self, **labels):
+        """
+        Attribute everything recorded inside the block (in this thread or task) to these labels.
+        """
+        merged = dict(_current_labels.get())
+        merged.update(labels)
+        token = _current_labels.set(merged)
+        try:
+            yield
+        finally:
+            _current_labels.reset(token)
+
+    def count(self, name, value=1, **labels):
+        """
+        Add `value` to a counter.
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, stage, seconds, **labels):
+        """
+        Record the duration of one unit of a stage.
+        """
+        key = self._key(stage, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, stage, **labels):
+        """
+        Time the block as one unit of `stage`.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def record_response(self, response, seconds):
+        """
+        Record a fetched page: latency, status, body size, and whether the cache answered it.
+        """
+        self.observe("fetch", seconds)
+        self.count("requests", status=str(response.status_code))
+        if getattr(response, "from_cache", False):
+            self.count("cache_hits")
+        else:
+            self.count("bytes", len(response.content))
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def summary(self):
+        """
+        Return the run's numbers as a dict: totals, stages, and the same per shop and category.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {}
+            for key, histogram in self._histograms.items():
+                histograms[key] = Histogram()
+                histograms[key].merge(histogram)
+
+        elapsed = self.elapsed()
+        groups = {}
+        group_stages = {}
+        for (name, labels), value in counters.items():
+            labels = dict(labels)
+            group = groups.setdefault(_group_name(labels), {"counters": {}, "stages": {}})
+            if name == "requests":
+                name = f"requests_{labels['status']}"
+                group["counters"]["requests"] = group["counters"].get("requests", 0) + value
+            group["counters"][name] = group["counters"].get(name, 0) + value
+        for (stage, labels), histogram in histograms.items():
+            group_stages.setdefault((_group_name(dict(labels)), stage), Histogram()).merge(histogram)
+        for (name, stage), histogram in group_stages.items():
+            groups.setdefault(name, {"counters": {}, "stages": {}})["stages"][stage] = histogram.to_dict()
+
+        totals = {"counters": {}, "stages": {}}
+        for group in groups.values():
+            for name, value in group["counters"].items():
+                totals["counters"][name] = totals["counters"].get(name, 0) + value
+        for stage in STAGES:
+            merged = Histogram()
+            for (name, _), histogram in histograms.items():
+                if name == stage:
+                    merged.merge(histogram)
+            if merged.count:
+                totals["stages"][stage] = merged.to_dict()
+        products = totals["counters"].get("products", 0)
+        totals["products_per_second"] = round(products / elapsed, 3) if elapsed else 0.0
+
+        return {"labels": self.constant_labels, "started": self.started, "seconds": round(elapsed, 3),
+                "totals": totals, "groups": groups}
+
+    def report(self, summary=None):
+        """
+        Format the summary as text: where the time went, then one line per shop/category.
+        """
+        summary = summary or self.summary()
+        totals = summary["totals"]
+        counters = totals["counters"]
+        lines = [f"Run report ({summary['seconds']:.1f}s, {counters.get('products', 0)} products, "
+                 f"{totals['products_per_second']:.2f} products/s)"]
+        lines.append(f"  requests {counters.get('requests', 0)}, cache hits {counters.get('cache_hits', 0)}, "
+                     f"retries {counters.get('retries', 0)}, errors {counters.get('request_errors', 0)}, "
+                     f"{counters.get('bytes', 0) / 1024 / 1024:.2f} MiB downloaded, "
+                     f"{counters.get('limiter_wait_seconds', 0):.1f}s waiting for the rate limiter")
+        if counters.get("skipped_listings"):
+            lines.append(f"  {counters['skipped_listings']} filter listings skipped as empty by their discovered "
+                         f"product counts (at least as many requests saved)")
+        busy = sum(stage["seconds"] for stage in totals["stages"].values()) or 1
+        lines.append("  stage        units    seconds   share    p50      p95      max")
+        for stage in STAGES:
+            if stage in totals["stages"]:
+                data = totals["stages"][stage]
+                lines.append(f"  {stage:<11}{data['count']:>7}{data['seconds']:>11.2f}{data['seconds'] / busy:>8.1%}"
+                             f"{data['p50']:>9.3f}{data['p95']:>9.3f}{data['max']:>9.3f}")
+        for name, group in sorted(summary["groups"].items()):
+            if not name:
+                continue
+            stages = ", ".join(f"{stage} {group['stages'][stage]['seconds']:.1f}s"
+                               for stage in STAGES if stage in group["stages"])
+            group_counters = group["counters"]
+            parts = [f"{group_counters.get('products', 0)} products", f"{group_counters.get('pages', 0)} pages"]
+            if group_counters.get("listings"):
+                parts.append(f"{group_counters['listings']} listing URLs")
+            parts.append(f"{group_counters.get('requests', 0)} requests")
+            lines.append(f"  {name}: {', '.join(parts)}" + (f"; {stages}" if stages else ""))
+        return "\n".join(lines)
+
+    def write_report(self, path):
+        """
+        Write the summary as JSON to `path` and as text next to it (`.txt`). Returns the text.
+        """
+        summary = self.summary()
+        text = self.report(summary)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        return text
+
+    def prometheus(self):
+        """
+        Return every counter and histogram in the Prometheus text exposition format.
+        """
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+            lines = []
+            for (name, labels), value in counters:
+                lines.append(f"scraper_{name}_total{_format_labels(labels)} {value}")
+            for (stage, labels), histogram in histograms:
+                labels = labels + (("stage", stage),)
+                cumulative = 0
+                for bound, count in zip(list(BUCKETS) + ["+Inf"], histogram.counts):
+                    cumulative += count
+                    lines.append(f"scraper_stage_seconds_bucket{_format_labels(labels + (('le', str(bound)),))} "
+                                 f"{cumulative}")
+                lines.append(f"scraper_stage_seconds_sum{_format_labels(labels)} {histogram.sum}")
+                lines.append(f"scraper_stage_seconds_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve_prometheus(self, port, host="127.0.0.1"):
+        """
+        Serve `prometheus()` at http://host:port/metrics from a background thread.
+        """
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        print(f"Serving metrics at http://{host}:{self._server.server_port}/metrics")
+
+    def close(self):
+        if self._server:
+            self._server.shutdown()
+
+
+def _group_name(labels):
+    return " / ".join(labels[name] for name in ("shop", "category") if name in labels)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    escaped = [(name, str(value).replace("\\", "\\\\").replace('"', '\\"')) for name, value in labels]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+
+# Pages fetched in parallel once the number of pages is known
+DEFAULT_WORKERS = 4
+
+# Strainer rule for make_soup that keeps the WooCommerce page links
+PAGINATION_RULE = ("nav", {"class": "woocommerce-pagination"})
+
+
+def last_page_number(soup):
+    """
+    Read the number of the last page from WooCommerce pagination markup
+    (the `a.page-numbers` and `span.page-numbers` links of `nav.woocommerce-pagination`; the
+    `ul.page-numbers` around them holds all the numbers run together). Returns None if the
+    page has none.
+    """
+    numbers = []
+    for element in soup.select(".woocommerce-pagination a.page-numbers, .woocommerce-pagination span.page-numbers"):
+        text = element.get_text(strip=True).replace(".", "").replace(",", "")
+        if text.isdigit():
+            numbers.append(int(text))
+    return max(numbers) if numbers else None
+
+
+def paginate(load, page_url, workers=DEFAULT_WORKERS, skip=None, executor=None):
+    """
+    Yield (url, items) for every page of a listing, in page order.
+
+    `page_url(n)` builds the URL of page n and `load(url)` returns (items, soup) for a page,
+    or None if it does not exist (e.g. 404); the soup must keep PAGINATION_RULE. The last page
+    number is read from the first page and the remaining pages are loaded by `workers` threads.
+    Without pagination markup pages are loaded one by one until the first missing or empty page.
+    Pages for which `skip(url)` is true are not yielded (page 1 is still loaded to count pages).
+    Pass `executor` to load the pages on a pool shared with other listings instead.
+    """
+    first_url = page_url(1)
+    first = load(first_url)
+    if first is None:
+        return
+
+    items, soup = first
+    if skip is None or not skip(first_url):
+        yield first_url, items
+
+    last_page = last_page_number(soup)
+    if last_page is None:
+        # No page links, walk until a page is missing or empty
+        if not items:
+            return
+        page_number = 2
+        while True:
+            url = page_url(page_number)
+            if skip is None or not skip(url):
+                page = load(url)
+                if page is None or not page[0]:
+                    return
+                yield url, page[0]
+            page_number += 1
+
+    urls = [page_url(page_number) for page_number in range(2, last_page + 1)]
+    urls = [url for url in urls if skip is None or not skip(url)]
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [(url, executor.submit(load, url)) for url in urls]
+    try:
+        for url, future in futures:
+            page = future.result()
+            if page is None:
+                print(f"Page {url} is missing although the pagination lists it, stopping.")
+                return
+            yield url, page[0]
+    finally:
+        for _, future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
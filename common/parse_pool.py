@@ -0,0 +1,50 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+# Pages allowed to wait for a parser, per worker process
+PENDING_PER_WORKER = 4
+
+
+class ParsePool:
+    """
+    Parses raw pages in worker processes, away from the I/O threads.
+
+    Fetch threads hand over the downloaded bytes and a top-level parse function; the
+    function runs in one of `workers` processes and returns a compact record (plain dicts,
+    lists and strings). At most `max_pending` pages wait for a parser, so a fetch thread
+    blocks when parsing falls behind instead of piling pages up in memory.
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._slots = threading.BoundedSemaphore(max_pending or self.workers * PENDING_PER_WORKER)
+
+    def submit(self, func, *args):
+        """
+        Queue `func(*args)` for a parser process and return its Future.
+        """
+        self._slots.acquire()
+        try:
+            future = self.executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def parse(self, func, *args):
+        """
+        Parse in a worker process and wait for the result.
+        """
+        return self.submit(func, *args).result()
+
+    def shutdown(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
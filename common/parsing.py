@@ -0,0 +1,65 @@
+import bs4
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401
+    PARSER = "lxml"
+except ImportError:  # Fall back to the pure Python parser
+    PARSER = "html.parser"
+
+# Beautiful Soup 4.13 replaced the callable SoupStrainer API with allow_tag_creation()
+LEGACY_STRAINER = tuple(int(part) for part in bs4.__version__.split(".")[:2]) < (4, 13)
+
+
+class TagFilter(SoupStrainer):
+    """
+    SoupStrainer that keeps only the tags matching any of the given rules, together with
+    everything inside them. Each rule is a tag name and a dict of required attribute values,
+    e.g. ("div", {"id": "primgms"}) or ("p", {"class": "sdesc"}).
+    """
+
+    def __init__(self, *rules):
+        self.rules = rules
+        if LEGACY_STRAINER:
+            # bs4 < 4.13 calls a callable name with the tag name and its attributes
+            super().__init__(lambda name, attrs=None: self.matches(name, attrs))
+        else:
+            super().__init__()
+
+    def matches(self, name, attrs):
+        """
+        Check whether a tag with this name and these attributes matches any rule.
+        """
+        attrs = attrs or {}
+        for rule_name, rule_attrs in self.rules:
+            if rule_name != name:
+                continue
+            if all(value in attribute_values(attrs.get(key)) for key, value in rule_attrs.items()):
+                return True
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.matches(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False  # Strings are only kept inside matching tags
+
+
+def attribute_values(value):
+    """
+    Split a raw attribute value ("a b" or ["a", "b"]) into its whitespace-separated values.
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return value.split()
+    return list(value)
+
+
+def make_soup(markup, *rules, parser=None):
+    """
+    Parse markup with the fastest available backend (lxml, else html.parser).
+    When rules are given, only the matching subtrees are built (see TagFilter).
+    """
+    parse_only = TagFilter(*rules) if rules else None
+    return BeautifulSoup(markup, parser or PARSER, parse_only=parse_only)
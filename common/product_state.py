@@ -0,0 +1,123 @@
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from common.csv_writer import SHOPIFY_QUOTING
+
+
+class ProductState:
+    """
+    SQLite record of the products every output file held after its last run, keyed by
+    SKU or handle, with a content hash of each product's rows.
+
+    `export_delta` compares a freshly written catalogue with it, so only new and changed
+    products have to be imported again, and products that disappeared are listed apart.
+    One database can hold several outputs; each is a separate `scope`.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS products ("
+            " scope TEXT NOT NULL, key TEXT NOT NULL, hash TEXT NOT NULL, rows TEXT NOT NULL,"
+            " updated REAL NOT NULL, PRIMARY KEY (scope, key))"
+        )
+        self._db.commit()
+
+    def hashes(self, scope):
+        """
+        Return {key: hash} of every product recorded for a scope.
+        """
+        return dict(self._db.execute("SELECT key, hash FROM products WHERE scope = ?", (scope,)))
+
+    def rows(self, scope, keys):
+        """
+        Return the last recorded rows of the given products, in key order.
+        """
+        rows = []
+        for key in keys:
+            found = self._db.execute("SELECT rows FROM products WHERE scope = ? AND key = ?", (scope, key)).fetchone()
+            if found:
+                rows.extend(json.loads(found[0]))
+        return rows
+
+    def save(self, scope, changed, removed):
+        """
+        Record the new state of a scope: `changed` maps keys to (hash, rows), `removed` lists keys.
+        """
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO products (scope, key, hash, rows, updated) VALUES (?, ?, ?, ?, ?)",
+                [(scope, key, digest, json.dumps(rows, ensure_ascii=False), now)
+                 for key, (digest, rows) in changed.items()],
+            )
+            self._db.executemany("DELETE FROM products WHERE scope = ? AND key = ?", [(scope, key) for key in removed])
+
+    def close(self):
+        self._db.close()
+
+
+def delta_paths(path):
+    """
+    Return the paths of the delta and removed-products files that go with an output CSV.
+    """
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_delta{extension}", f"{stem}_removed{extension}"
+
+
+def export_delta(state, path, key, encoding="utf-8-sig", quoting=SHOPIFY_QUOTING):
+    """
+    Compare the catalogue in the CSV at `path` with its last recorded state and write
+    `<name>_delta.csv` (rows of new and changed products, ready to import) and
+    `<name>_removed.csv` (last known rows of products no longer listed), then record the new state.
+
+    Products are grouped by the `key` column, so every variant row of a product is compared
+    together. The catalogue is read twice instead of being held in memory. Returns
+    {"new": n, "changed": n, "removed": n, "unchanged": n}.
+    """
+    scope = os.path.basename(path)
+    previous = state.hashes(scope)
+
+    # First pass: hash every product's rows
+    digests = {}
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.DictReader(f)
+        fieldnames = reader.fieldnames
+        for row in reader:
+            digests.setdefault(row[key], hashlib.sha256()).update(json.dumps(row, sort_keys=True).encode("utf-8"))
+    digests = {product: digest.hexdigest() for product, digest in digests.items()}
+
+    new = [product for product in digests if product not in previous]
+    changed = [product for product in digests if product in previous and previous[product] != digests[product]]
+    removed = [product for product in previous if product not in digests]
+    to_import = set(new) | set(changed)
+
+    # Second pass: copy the rows of new and changed products
+    delta_path, removed_path = delta_paths(path)
+    updated = {}
+    with open(path, newline="", encoding=encoding) as source, \
+            open(delta_path, "w", newline="", encoding=encoding) as target:
+        writer = csv.DictWriter(target, fieldnames=fieldnames, quoting=quoting, lineterminator=os.linesep)
+        writer.writeheader()
+        for row in csv.DictReader(source):
+            if row[key] in to_import:
+                writer.writerow(row)
+                updated.setdefault(row[key], (digests[row[key]], []))[1].append(row)
+
+    with open(removed_path, "w", newline="", encoding=encoding) as target:
+        writer = csv.DictWriter(target, fieldnames=fieldnames, quoting=quoting, lineterminator=os.linesep,
+                                extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(state.rows(scope, removed))
+
+    state.save(scope, updated, removed)
+    counts = {"new": len(new), "changed": len(changed), "removed": len(removed),
+              "unchanged": len(digests) - len(to_import)}
+    print(f"Delta: {counts['new']} new, {counts['changed']} changed, {counts['removed']} removed, "
+          f"{counts['unchanged']} unchanged products; import {delta_path} (removed products: {removed_path})")
+    return counts
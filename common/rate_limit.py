@@ -0,0 +1,240 @@
+import asyncio
+import heapq
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Default limits per host
+DEFAULT_RATE = 10.0  # requests per second to start with
+MIN_RATE = 0.5
+MAX_RATE = 100.0
+DEFAULT_BURST = 4  # tokens a host can save up while idle
+SLOW_START_FACTOR = 1.05  # rate multiplier per success until a host first throttles
+RATE_INCREASE = 0.1  # requests per second added after every success after that
+DECREASE_FACTOR = 0.5  # rate and concurrency are multiplied by it when the shop throttles
+DECREASE_INTERVAL = 1.0  # seconds; throttles of requests already in flight count once
+
+# Responses that mean the request may succeed later
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = THROTTLE_STATUSES | {500, 502, 504}
+
+# Exponential backoff between retries
+BACKOFF_BASE = 1.0  # seconds
+BACKOFF_CAP = 60.0  # seconds
+
+
+def host_of(url):
+    """
+    Return the host (with port) a URL is sent to.
+    """
+    return urlsplit(url).netloc
+
+
+def retry_after_seconds(value):
+    """
+    Parse a Retry-After header (seconds or an HTTP date) into seconds, or None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP, retry_after=None):
+    """
+    Seconds to wait before retry `attempt` (0 for the first retry): exponential backoff with
+    full jitter, so retries of many requests do not hit the shop at the same moment.
+    A Retry-After from the server is the minimum.
+    """
+    delay = random.uniform(0, min(cap, base * 2 ** attempt))
+    return max(delay, retry_after or 0)
+
+
+class HostLimit:
+    """
+    Token bucket and concurrency window of one host.
+    """
+
+    def __init__(self, rate, burst, concurrency):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.refilled = time.monotonic()
+        self.window = concurrency
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.decreased = 0.0
+        self.slow_start = True
+        self.requests = 0
+        self.throttled = 0
+
+
+class RateLimiter:
+    """
+    Per-host token-bucket rate limiter with AIMD (additive increase, multiplicative decrease)
+    control of both the rate and the number of requests in flight.
+
+    Like TCP, a host starts in slow start: every success multiplies its rate by
+    SLOW_START_FACTOR until the first throttle. From then on every success adds RATE_INCREASE
+    requests per second, and the concurrency window grows by 1/window, up to `max_rate` and
+    `max_concurrency`. A 429 or 503 halves both and pauses the host for its Retry-After, so
+    the crawl settles just under what the shop tolerates. Works from threads (`acquire`)
+    and from asyncio (`acquire_async`).
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=DEFAULT_BURST,
+                 concurrency=4, max_concurrency=64):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self._hosts = {}
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+
+    def _host(self, url):
+        host = host_of(url)
+        if host not in self._hosts:
+            self._hosts[host] = HostLimit(self.rate, self.burst, self.concurrency)
+        return self._hosts[host]
+
+    def reserve(self, url):
+        """
+        Take a token and a concurrency slot for a request to `url` if both are free and return 0,
+        otherwise return the seconds to wait before asking again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            limit = self._host(url)
+            if now < limit.blocked_until:
+                return limit.blocked_until - now
+            limit.tokens = min(limit.burst, limit.tokens + (now - limit.refilled) * limit.rate)
+            limit.refilled = now
+            if limit.in_flight >= int(limit.window):
+                return 0.05  # Woken earlier by release() when waiting in acquire()
+            if limit.tokens < 1:
+                return (1 - limit.tokens) / limit.rate
+            limit.tokens -= 1
+            limit.in_flight += 1
+            limit.requests += 1
+            return 0
+
+    def acquire(self, url):
+        """
+        Block the calling thread until a request to `url` may be sent.
+        """
+        while True:
+            wait = self.reserve(url)
+            if not wait:
+                return
+            with self._released:
+                self._released.wait(wait)
+
+    async def acquire_async(self, url):
+        """
+        Wait without blocking the event loop until a request to `url` may be sent.
+        """
+        while True:
+            wait = self.reserve(url)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def release(self, url, status=None, retry_after=None):
+        """
+        Give back the slot of a finished request and adapt the host's limits to its outcome.
+        `status` is None for a request that failed without a response (e.g. a timeout).
+        """
+        now = time.monotonic()
+        with self._released:
+            limit = self._host(url)
+            limit.in_flight -= 1
+            if status in THROTTLE_STATUSES or status is None:
+                if status is not None:
+                    limit.throttled += 1
+                    if retry_after:
+                        limit.blocked_until = max(limit.blocked_until, now + retry_after)
+                if now - limit.decreased >= DECREASE_INTERVAL:
+                    limit.decreased = now
+                    limit.window = max(1.0, limit.window * DECREASE_FACTOR)
+                    if status is not None:
+                        limit.rate = max(self.min_rate, limit.rate * DECREASE_FACTOR)
+                        limit.slow_start = False
+            elif status < 500:
+                if limit.slow_start:
+                    limit.rate = min(self.max_rate, limit.rate * SLOW_START_FACTOR)
+                else:
+                    limit.rate = min(self.max_rate, limit.rate + RATE_INCREASE)
+                limit.window = min(self.max_concurrency, limit.window + 1 / limit.window)
+            self._released.notify_all()
+
+    def report(self):
+        """
+        Summarize the rate each host settled at for the end of a run.
+        """
+        with self._lock:
+            hosts = [f"{host} {limit.rate:.1f} req/s x{int(limit.window)} "
+                     f"({limit.requests} requests, {limit.throttled} throttled)"
+                     for host, limit in self._hosts.items()]
+        return "Rate limiter: " + ("; ".join(hosts) if hosts else "no requests")
+
+
+class RetryScheduler:
+    """
+    Runs delayed calls on a thread pool. Calls wait in a heap watched by a single timer
+    thread, so a request backing off before its retry does not hold a pool worker.
+    """
+
+    def __init__(self, workers=4):
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self._heap = []
+        self._counter = 0
+        self._closed = False
+        self._wakeup = threading.Condition()
+        self._timer = threading.Thread(target=self._run, daemon=True)
+        self._timer.start()
+
+    def submit(self, func, *args):
+        """
+        Run `func(*args)` on the pool now.
+        """
+        return self.executor.submit(func, *args)
+
+    def schedule(self, delay, func, *args):
+        """
+        Run `func(*args)` on the pool after `delay` seconds.
+        """
+        with self._wakeup:
+            self._counter += 1
+            heapq.heappush(self._heap, (time.monotonic() + delay, self._counter, func, args))
+            self._wakeup.notify()
+
+    def _run(self):
+        with self._wakeup:
+            while not self._closed:
+                if not self._heap:
+                    self._wakeup.wait()
+                    continue
+                due = self._heap[0][0] - time.monotonic()
+                if due > 0:
+                    self._wakeup.wait(due)
+                    continue
+                _, _, func, args = heapq.heappop(self._heap)
+                self.executor.submit(func, *args)
+
+    def close(self):
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify()
+        self._timer.join()
+        self.executor.shutdown()
@@ -0,0 +1,226 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from common.csv_writer import StreamingCsvWriter
+from common.fetch import Fetcher
+from common.handles import sanitize_handle
+from common.http_cache import HttpCache
+from common.metrics import Metrics
+from common.pagination import PAGINATION_RULE, paginate
+from common.parsing import make_soup
+from common.product_state import ProductState, export_delta
+
+# Page loads shared by every target of a run
+DEFAULT_WORKERS = 8
+CACHE_FILE = "shops_http_cache.sqlite"
+STATE_FILE = "shops_product_state.sqlite"
+METRICS_FILE = "shops_metrics.json"
+
+# Value of a field whose element is missing from the product card
+MISSING = "N/A"
+
+
+def load_config(path):
+    """
+    Read a shops config file (see `Multi Shop/shops.json`).
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class SiteAdapter:
+    """
+    Turns one shop's listing pages into CSV rows, driven by the shop's config entry:
+
+    - `parse_rules`: strainer rules for make_soup, and `products`: CSS selector of a product card
+    - `fields`: name -> {"selector", "attr", "index", "all", "include", "exclude", "join", "default"}
+    - `require`: [{"selector", "text"}], cards that do not match are skipped (e.g. out of stock)
+    - `variants`: one row per matched element (e.g. sizes), with `first_only` columns left empty
+      on every row but the first
+    - `columns`: output column -> template over the fields, the shop `values` and the target `values`
+
+    Shops that need more than selectors can subclass it and register the class in ADAPTERS.
+    """
+
+    def __init__(self, name, config):
+        self.name = name
+        self.config = config
+        self.parse_rules = [tuple(rule) for rule in config["parse_rules"]]
+        self.columns = config["columns"]
+        self.pagination = config.get("pagination", "woocommerce")
+
+    def parse_page(self, content):
+        """
+        Return (product cards, soup) of one listing page.
+        """
+        soup = make_soup(content, *self.parse_rules, PAGINATION_RULE)
+        return soup.select(self.config["products"]), soup
+
+    def field(self, product, spec):
+        """
+        Extract one field of a product card.
+        """
+        elements = product.select(spec["selector"])
+        values = []
+        for element in elements:
+            attrs = spec.get("attr")
+            if attrs is None:
+                values.append(element.get_text(strip=True))
+                continue
+            for attr in [attrs] if isinstance(attrs, str) else attrs:
+                if element.get(attr):
+                    values.append(element[attr])
+                    break
+
+        if "include" in spec:
+            values = [value for value in values if value in spec["include"]]
+        if "exclude" in spec:
+            values = [value for value in values if value not in spec["exclude"]]
+        if not values:
+            return spec.get("default", MISSING)
+        if spec.get("all"):
+            return spec.get("join", ", ").join(values)
+
+        index = spec.get("index", 0)
+        return values[index] if -len(values) <= index < len(values) else spec.get("default", MISSING)
+
+    def extract(self, product, values):
+        """
+        Return the CSV rows of one product card (none if it fails a `require` check).
+        """
+        for check in self.config.get("require", []):
+            element = product.select_one(check["selector"])
+            if not element or element.get_text(strip=True) != check["text"]:
+                return []
+
+        fields = dict(self.config.get("values", {}))
+        fields.update(values)
+        for name, spec in self.config.get("fields", {}).items():
+            fields[name] = self.field(product, spec)
+        fields["handle"] = sanitize_handle(fields.get("title", ""))
+
+        variants = self.config.get("variants")
+        if not variants:
+            return [{column: template.format_map(fields) for column, template in self.columns.items()}]
+
+        options = [element.get_text(strip=True) for element in product.select(variants["selector"])]
+        rows = []
+        for index, option in enumerate(options or [variants["default"]]):
+            fields[variants["field"]] = option
+            row = {column: template.format_map(fields) for column, template in self.columns.items()}
+            if index:
+                for column in variants.get("first_only", []):
+                    row[column] = ""
+            rows.append(row)
+        return rows
+
+
+# Adapter classes by the name used in the config's "adapter" key
+ADAPTERS = {"selectors": SiteAdapter}
+
+
+class ShopEngine:
+    """
+    Crawls many shop/category targets in one process. Every target runs in its own thread
+    and writes its own CSV in page order, while all page requests share one keep-alive
+    Fetcher, one HTTP cache and one pool of `workers` page loaders. After each target a
+    delta of its new, changed and removed products is exported (see product_state).
+    Stage timings and requests are recorded per shop and target and saved to `metrics_path`.
+    """
+
+    def __init__(self, config, workers=None, cache_path=CACHE_FILE, state_path=STATE_FILE, metrics_path=METRICS_FILE):
+        self.config = config
+        self.workers = workers or config.get("workers", DEFAULT_WORKERS)
+        self.metrics_path = metrics_path
+        self.metrics = Metrics()
+        self.http_cache = HttpCache(cache_path)
+        self.fetcher = Fetcher(workers=self.workers, headers=config.get("headers"), cache=self.http_cache,
+                               metrics=self.metrics)
+        self.product_state = ProductState(state_path)
+        self.adapters = {}
+        for name, shop in config["shops"].items():
+            adapter_class = ADAPTERS[shop.get("adapter", "selectors")]
+            self.adapters[name] = adapter_class(name, shop)
+
+    def load_page(self, adapter, url):
+        """
+        Fetch and parse one listing page; None past the last page (404).
+        """
+        print(f"Scraping page: {url}")
+        response = self.fetcher.get(url)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        with self.metrics.stage("parse"):
+            return adapter.parse_page(response.content)
+
+    def crawl_target(self, target, executor):
+        """
+        Scrape every page of one target into its CSV. Returns (pages, rows).
+        """
+        adapter = self.adapters[target["shop"]]
+
+        def page_url(page_number):
+            return target["url"].format(page=page_number)
+
+        labels = {"shop": target["shop"], "category": target["name"]}
+
+        def load(url):
+            # Runs on the shared page pool, so the target's labels are set again there
+            with self.metrics.labels(**labels):
+                return self.load_page(adapter, url)
+
+        if adapter.pagination == "woocommerce":
+            pages = paginate(load, page_url, executor=executor)
+        else:
+            page = load(page_url(1))
+            pages = [(page_url(1), page[0])] if page else []
+
+        page_count = 0
+        encoding = target.get("encoding", "utf-8")
+        with self.metrics.labels(**labels), \
+                StreamingCsvWriter(target["output"], list(adapter.columns), encoding=encoding) as writer:
+            for url, products in pages:
+                page_count += 1
+                self.metrics.count("pages")
+                for product in products:
+                    with self.metrics.stage("extract"):
+                        rows = adapter.extract(product, target.get("values", {}))
+                    if rows:
+                        self.metrics.count("products")
+                    with self.metrics.stage("write"):
+                        writer.write_rows(rows)
+            return page_count, writer.rows_written
+
+    def run(self, names=None):
+        """
+        Crawl every target (or the ones named) concurrently and print a summary per target.
+        """
+        targets = [target for target in self.config["targets"] if not names or target["name"] in names]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            with ThreadPoolExecutor(max_workers=max(len(targets), 1)) as target_executor:
+                futures = [(target, target_executor.submit(self.crawl_target, target, executor)) for target in targets]
+                for target, future in futures:
+                    # One shop being down should not cost the others their refresh
+                    try:
+                        pages, rows = future.result()
+                    except Exception as e:
+                        print(f"{target['name']}: failed: {e}")
+                        continue
+                    print(f"{target['name']}: {pages} pages, {rows} rows saved to {target['output']}")
+                    # Exported here in the main thread, which owns the state store's SQLite connection
+                    export_delta(self.product_state, target["output"], target.get("key", "Handle"),
+                                 encoding=target.get("encoding", "utf-8"))
+
+        print(f"Scraped {len(targets)} targets in {time.perf_counter() - start:.1f} seconds")
+        print(self.fetcher.report())
+        print(self.http_cache.report())
+        print(self.metrics.write_report(self.metrics_path))
+
+    def close(self):
+        self.metrics.close()
+        self.fetcher.close()
+        self.http_cache.close()
+        self.product_state.close()
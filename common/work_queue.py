@@ -0,0 +1,189 @@
+import contextvars
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+
+class WorkGroup:
+    """
+    The units of one job (e.g. a category) on a WorkQueue.
+
+    Every unit of the group runs at the group's priority. A unit that raises fails the
+    group's `future` (and the queue) and the group's remaining units are dropped;
+    `finish(result)` completes it.
+    """
+
+    def __init__(self, queue, priority):
+        self.queue = queue
+        self.priority = priority
+        self.future = Future()
+
+    def submit(self, func, *args):
+        """
+        Queue `func(*args)` as one unit.
+        """
+        self.queue._put(self.priority, contextvars.copy_context(), self._run, func, args)
+
+    def after(self, future, func, *args):
+        """
+        Queue `func(future, *args)` as one unit once `future` is done, e.g. a page a Fetcher
+        downloads on its own threads, so no worker waits for it.
+        """
+        context = contextvars.copy_context()
+        future.add_done_callback(lambda future: self.queue._put(self.priority, context, self._run, func,
+                                                                (future,) + args))
+
+    def _run(self, func, args):
+        if self.future.done():
+            return
+        try:
+            func(*args)
+        except Exception as e:
+            print(f"Work unit failed: {e}")
+            if not self.future.done():
+                self.future.set_exception(e)
+            self.queue._fail(e)
+
+    def gather(self, count, then):
+        """
+        Return `deliver(index, result)`. Once all `count` results are delivered (from any
+        units), `then(results)` is queued with the results in index order.
+        """
+        results = [None] * count
+        remaining = [count]
+        lock = threading.Lock()
+
+        def deliver(index, result):
+            results[index] = result
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self.submit(then, results)
+
+        if not count:
+            self.submit(then, results)
+        return deliver
+
+    def map(self, func, items, then):
+        """
+        Queue `func(item)` for every item as its own unit, then `then(results)` in item order.
+        """
+        deliver = self.gather(len(items), then)
+        for index, item in enumerate(items):
+            self.submit(self._map_unit, func, item, index, deliver)
+
+    def _map_unit(self, func, item, index, deliver):
+        deliver(index, func(item))
+
+    def finish(self, result):
+        self.future.set_result(result)
+
+
+class WorkQueue:
+    """
+    Worker threads that take small units of work from one shared priority queue.
+
+    Jobs are split into units (a listing page, a detail page) that queue their follow-up
+    units when they finish, so no worker is tied to one job: whichever worker is free takes
+    the most urgent unit of any job, and a large job spreads over every worker instead of
+    keeping one busy while the others idle. Lower priorities run first, equal ones in the
+    order they were queued. Like an asyncio task, a unit keeps the context variables (e.g.
+    metric labels) of the code that queued it.
+
+    The first unit that raises fails the whole queue: `result(group)` raises its error at once,
+    and leaving the `with` block on an exception drops every unit still queued.
+    """
+
+    def __init__(self, workers=4):
+        self.workers = workers
+        self.units = 0
+        self.busy_seconds = 0.0
+        self._heap = []
+        self._counter = 0
+        self._closed = False
+        self._cancelled = False
+        self._failed = Future()
+        self._started = time.perf_counter()
+        self._wakeup = threading.Condition()
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def group(self, priority=0):
+        """
+        Start a job whose units run at `priority`.
+        """
+        return WorkGroup(self, priority)
+
+    def _put(self, priority, context, func, *args):
+        with self._wakeup:
+            if self._cancelled:
+                return
+            self._counter += 1
+            heapq.heappush(self._heap, (priority, self._counter, context, func, args))
+            self._wakeup.notify()
+
+    def _work(self):
+        while True:
+            with self._wakeup:
+                while not self._heap and not self._closed:
+                    self._wakeup.wait()
+                if not self._heap:
+                    return
+                _, _, context, func, args = heapq.heappop(self._heap)
+            start = time.perf_counter()
+            context.run(func, *args)
+            with self._wakeup:
+                self.units += 1
+                self.busy_seconds += time.perf_counter() - start
+
+    def _fail(self, error):
+        with self._wakeup:
+            if not self._failed.done():
+                self._failed.set_exception(error)
+
+    def result(self, group):
+        """
+        Wait for the result of a group, raising the first error of any unit as soon as it happens.
+        """
+        wait([group.future, self._failed], return_when=FIRST_COMPLETED)
+        if group.future.done():
+            return group.future.result()
+        return self._failed.result()
+
+    def cancel(self):
+        """
+        Drop every queued unit and every unit queued from now on; running units finish.
+        """
+        with self._wakeup:
+            self._cancelled = True
+            self._heap.clear()
+
+    def report(self):
+        """
+        Summarize how busy the workers were for the end of a run.
+        """
+        seconds = time.perf_counter() - self._started
+        busy = self.busy_seconds / (seconds * self.workers) * 100 if seconds else 0
+        return f"Work queue: {self.units} units on {self.workers} workers in {seconds:.1f}s ({busy:.0f}% busy)"
+
+    def close(self):
+        """
+        Let the workers finish every queued unit, then stop them.
+        """
+        with self._wakeup:
+            self._closed = True
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # After an error the remaining units are dropped instead of run, then the error propagates
+        if exc_type is not None:
+            self.cancel()
+        self.close()